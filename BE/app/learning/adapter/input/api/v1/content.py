@@ -1,14 +1,54 @@
+import json
+import logging
+from contextlib import aclosing
+from typing import AsyncIterator
+
 from fastapi import APIRouter, Depends, status, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
+from app.learning.application.service.summary import course_summary_service
 from app.learning.domain.models import CourseContents, Course
 from app.user.domain.entity.user import User
-from core.ai.chatbot import chat
+from core.ai.chatbot import chat, chat_stream
 from core.db.session import session_factory
 from core.fastapi.dependencies.permission import IsAuthenticated, PermissionDependency
 from fastapi import HTTPException
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+def sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def wants_stream(request: Request) -> bool:
+    if request.query_params.get("stream", "").lower() in ("1", "true", "yes"):
+        return True
+    return "text/event-stream" in request.headers.get("accept", "")
+
+
+async def chat_events(request: Request, tokens: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Render chat tokens as server-sent events.
+
+    Emits a `token` event per delta, then `done`, or `error` if generation fails.
+    Stops as soon as the client disconnects; closing the token generator cancels
+    the upstream LLM stream.
+    """
+    async with aclosing(tokens) as stream:
+        try:
+            async for token in stream:
+                if await request.is_disconnected():
+                    logger.info("Chat client disconnected, stopping generation")
+                    return
+                yield sse_event("token", {"token": token})
+        except Exception as e:
+            logger.error(f"Error streaming chat response: {e}")
+            yield sse_event("error", {"detail": "Failed to generate a response"})
+            return
+    yield sse_event("done", {})
 
 
 @router.get(
@@ -49,9 +89,23 @@ async def get_course_contents(course_id: int, request: Request):
 )
 async def course_chat(course_id: int, request: Request):
     body = await request.json()
-    response = chat(
+    if wants_stream(request):
+        # Opt-in with `?stream=true` or `Accept: text/event-stream`; the JSON response stays the default
+        return StreamingResponse(
+            chat_events(request, chat_stream(
+                messages=body.get("messages"),
+                course_id=course_id,
+                conversation_id=body.get("conversation_id"),
+                summary_loader=course_summary_service.get_summary,
+            )),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    response = await chat(
         messages=body.get("messages"),
-        course_id=course_id
+        course_id=course_id,
+        conversation_id=body.get("conversation_id"),
+        summary_loader=course_summary_service.get_summary,
     )
     return {"response": response}
 
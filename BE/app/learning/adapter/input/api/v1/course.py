@@ -11,6 +11,7 @@ from app.learning.domain.models import Course, user_courses_association
 from core.db.session import session_factory
 from core.config import config
 from core.fastapi.dependencies.permission import IsAuthenticated, PermissionDependency
+from core.helpers.cache import Cache, CacheTag
 
 router = APIRouter()
 
@@ -40,6 +41,7 @@ class RazorpayOrderResponse(BaseModel):
     summary="List all Courses",
     tags=["Learning - Courses"],
 )
+@Cache.cached(tag=CacheTag.GET_COURSE_LIST, ttl=config.CATALOG_CACHE_TTL)
 async def list_courses():
     """
     Retrieves a list of all courses with pagination.
@@ -68,6 +70,7 @@ async def list_courses():
     summary="List all Courses for a specific Specialisation",
     tags=["Learning - Courses"],
 )
+@Cache.cached(tag=CacheTag.GET_COURSE_LIST, ttl=config.CATALOG_CACHE_TTL)
 async def list_courses_by_specialisation(specialisation_id: int):
     """
     Retrieves a list of all courses for a specific specialisation.
@@ -130,6 +133,7 @@ async def list_enrolled_courses(request: Request):
     summary="Get a Course by ID",
     tags=["Learning - Courses"],
 )
+@Cache.cached(tag=CacheTag.GET_COURSE, ttl=config.CATALOG_CACHE_TTL)
 async def get_course_by_id(
     course_id: int,
 ):
@@ -15,6 +15,7 @@ from app.learning.domain.models import (
 from core.db.session import session_factory
 from core.fastapi.dependencies.permission import IsAuthenticated, PermissionDependency
 from core.config import config
+from core.helpers.cache import Cache, CacheTag
 
 router = APIRouter()
 
@@ -52,6 +53,7 @@ class PaymentVerificationRequest(BaseModel):
     summary="List all Specialisations",
     tags=["Learning - Specialisations"],
 )
+@Cache.cached(tag=CacheTag.GET_SPECIALISATION_LIST, ttl=config.CATALOG_CACHE_TTL)
 async def list_specialisations():
     """
     Retrieves a list of all specialisations with pagination.
@@ -120,6 +122,7 @@ async def list_enrolled_specialisations(request: Request):
     summary="Get a Specialisation by ID",
     tags=["Learning - Specialisations"],
 )
+@Cache.cached(tag=CacheTag.GET_SPECIALISATION, ttl=config.CATALOG_CACHE_TTL)
 async def get_specialisation_by_id(
     specialisation_id: int,
 ):
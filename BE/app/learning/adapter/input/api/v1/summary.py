@@ -0,0 +1,53 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel
+
+from app.learning.application.service.summary_job import summary_jobs
+from celery_task import celery_app
+from core.fastapi.dependencies.permission import IsAdmin, PermissionDependency
+
+router = APIRouter()
+
+
+class SummaryJobRequest(BaseModel):
+    course_ids: Optional[list[int]] = None  # Every course if omitted
+    force: bool = False  # Regenerate summaries of unchanged courses too
+
+
+@router.post(
+    "/jobs",
+    response_model=dict,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(PermissionDependency([IsAdmin]))],
+    summary="Start a Course Summarisation Job",
+    tags=["Learning - Summaries"],
+)
+async def create_summary_job(body: SummaryJobRequest):
+    """
+    Queues a background job summarising courses on the Celery worker.
+    - **course_ids**: Courses to summarise; every course if omitted.
+    - **force**: Regenerate summaries whose course content is unchanged.
+    """
+    job_id = await summary_jobs.create(body.course_ids, force=body.force)
+    # By name, so the API process never imports the summarisation tasks
+    celery_app.send_task("summary.summarise_courses", args=[job_id])
+    return {"job_id": job_id, "status": "queued"}
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=dict,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(PermissionDependency([IsAdmin]))],
+    summary="Get a Course Summarisation Job",
+    tags=["Learning - Summaries"],
+)
+async def get_summary_job(job_id: str):
+    """
+    Retrieves the progress and per-course outcomes of a summarisation job.
+    """
+    job = await summary_jobs.status(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Summary job not found")
+    return job
@@ -0,0 +1,181 @@
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable, List, Optional
+
+from sqlalchemy import select
+
+from app.learning.domain.models import Course, CourseContents, CourseSummary
+from core.ai.instrumentation import ai_call_context, ai_course
+from core.ai.summariser import summary_tree
+from core.config import config
+from core.db.session import session_factory
+
+Summarise = Callable[[List[str]], Awaitable[str]]
+
+logger = logging.getLogger(__name__)
+
+
+def log_progress(completed: int, total: int) -> None:
+    logger.info(f"Summarised chunk {completed}/{total} of course {ai_course.get()}")
+
+
+async def summarise_sections(texts: List[str]) -> str:
+    """
+    Summarise a course's content texts with the hierarchical summariser, one section per content.
+    """
+    return await summary_tree.summarise(texts, on_progress=log_progress)
+
+
+def source_hash(texts: Iterable[str], model: str) -> str:
+    """
+    Identity of a summary's input; a different content or model means the summary is stale.
+    """
+    digest = hashlib.sha256(model.encode("utf-8"))
+    for text in texts:
+        data = text.encode("utf-8")
+        # Length-prefixed, so no two different lists of texts hash alike
+        digest.update(len(data).to_bytes(8, "big") + data)
+    return digest.hexdigest()
+
+
+@dataclass
+class SummaryRefreshResult:
+    """
+    Outcome of refreshing the summaries of several courses.
+
+    Attributes:
+        generated: IDs of courses whose summary was (re)generated
+        unchanged: IDs of courses whose summary was already up to date
+        skipped: IDs of courses without any content text
+        errors: List of (course ID, error message) for failed courses
+    """
+    generated: List[int] = field(default_factory=list)
+    unchanged: List[int] = field(default_factory=list)
+    skipped: List[int] = field(default_factory=list)
+    errors: List[tuple] = field(default_factory=list)
+
+
+class CourseSummaryService:
+    """
+    Precomputed course summaries.
+
+    Summaries are generated offline from the courses' `content_text` and stored with a
+    hash of their input, so a refresh only calls the LLM for courses whose content
+    changed; within a changed course, sections whose text is unchanged are served from
+    the summary tree's node cache. The chat `summary` intent reads the stored summary.
+    """
+
+    def __init__(self, *, summarise: Summarise = summarise_sections, model: str = config.LLM_SUMMARY_MODEL):
+        """
+        Initialize the service.
+
+        Args:
+            summarise: Async function summarising a course's content texts
+            model: Name of the summary model, part of the source hash
+        """
+        self.logger = logging.getLogger(__name__)
+        self.summarise = summarise
+        self.model = model
+
+    async def get_summary(self, course_id: int) -> Optional[str]:
+        """
+        Stored summary of a course.
+
+        Args:
+            course_id: ID of the course
+
+        Returns:
+            The summary, or None if none was generated yet
+        """
+        query = select(CourseSummary.summary).where(CourseSummary.course_id == course_id)
+        async with session_factory() as read_session:
+            result = await read_session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def _load_texts(self, course_id: int) -> List[str]:
+        query = (
+            select(CourseContents.content_text)
+            .where(CourseContents.course_id == course_id, CourseContents.content_text.is_not(None))
+            .order_by(CourseContents.id)
+        )
+        async with session_factory() as read_session:
+            result = await read_session.execute(query)
+        return [text for text in result.scalars().all() if text.strip()]
+
+    async def refresh(self, course_id: int, force: bool = False) -> Optional[bool]:
+        """
+        Regenerate a course's summary if its content changed.
+
+        Args:
+            course_id: ID of the course
+            force: Regenerate even if the content is unchanged
+
+        Returns:
+            True if a summary was generated, False if it was up to date, None if the
+            course has no content text
+        """
+        texts = await self._load_texts(course_id)
+        if not texts:
+            return None
+
+        digest = source_hash(texts, self.model)
+        query = select(CourseSummary.source_hash).where(CourseSummary.course_id == course_id)
+        async with session_factory() as read_session:
+            result = await read_session.execute(query)
+        if result.scalar_one_or_none() == digest and not force:
+            return False
+
+        # No session is held open while the LLM runs
+        with ai_call_context("course_summary", course_id):
+            summary = await self.summarise(texts)
+
+        async with session_factory() as session:
+            result = await session.execute(select(CourseSummary).where(CourseSummary.course_id == course_id))
+            stored = result.scalars().first()
+            if stored is None:
+                session.add(CourseSummary(course_id=course_id, summary=summary, source_hash=digest, model=self.model))
+            else:
+                stored.summary = summary
+                stored.source_hash = digest
+                stored.model = self.model
+            await session.commit()
+
+        self.logger.info(f"Generated summary of course {course_id}")
+        return True
+
+    async def refresh_all(self, course_ids: Optional[Iterable[int]] = None,
+                          force: bool = False) -> SummaryRefreshResult:
+        """
+        Regenerate the summaries of changed courses, one course at a time.
+
+        Args:
+            course_ids: IDs of the courses to refresh, or None for every course
+            force: Regenerate even unchanged summaries
+
+        Returns:
+            SummaryRefreshResult with the outcome per course
+        """
+        if course_ids is None:
+            async with session_factory() as read_session:
+                result = await read_session.execute(select(Course.id).order_by(Course.id))
+            course_ids = result.scalars().all()
+
+        outcome = SummaryRefreshResult()
+        for course_id in course_ids:
+            try:
+                generated = await self.refresh(course_id, force=force)
+            except Exception as e:
+                self.logger.error(f"Error summarising course {course_id}: {e}")
+                outcome.errors.append((course_id, str(e)))
+                continue
+            if generated is None:
+                outcome.skipped.append(course_id)
+            elif generated:
+                outcome.generated.append(course_id)
+            else:
+                outcome.unchanged.append(course_id)
+        return outcome
+
+
+course_summary_service = CourseSummaryService()
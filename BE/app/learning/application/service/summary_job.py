@@ -0,0 +1,186 @@
+import json
+import logging
+import time
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy import select
+
+from app.learning.application.service.summary import CourseSummaryService, course_summary_service
+from app.learning.domain.models import Course
+from core.config import config
+from core.db.session import session_factory
+from core.helpers.redis import redis_client
+
+# Outcome of `CourseSummaryService.refresh` as recorded per course
+OUTCOMES = {True: "generated", False: "unchanged", None: "skipped"}
+
+
+class SummaryJobs:
+    """
+    Background course summarisation jobs, checkpointed in Redis.
+
+    A job records its course IDs and, per course, the outcome once that course is
+    done. The outcomes are the checkpoint: a course task redelivered after a worker
+    crash, or a job started again, skips the courses already recorded, and a course
+    interrupted halfway resumes from the summary tree's node cache. The same records
+    answer status queries from the API while the job runs on the Celery worker.
+    """
+
+    def __init__(self, *, service: CourseSummaryService = course_summary_service,
+                 redis: AsyncRedis = redis_client, ttl: int = config.SUMMARY_JOB_TTL,
+                 key_prefix: str = "summary_job"):
+        """
+        Initialize the job tracker.
+
+        Args:
+            service: Course summary service doing the work
+            redis: Asyncio Redis client (decoded responses) holding the job records
+            ttl: Time to live of a job record in seconds after its last update
+            key_prefix: Prefix for Redis keys
+        """
+        self.logger = logging.getLogger(__name__)
+        self.service = service
+        self.redis = redis
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+    def job_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}:{job_id}"
+
+    def results_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}:{job_id}:results"
+
+    async def _update(self, job_id: str, **fields) -> None:
+        fields["updated_at"] = int(time.time())
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(self.job_key(job_id), mapping=fields)
+        pipe.expire(self.job_key(job_id), self.ttl)
+        pipe.expire(self.results_key(job_id), self.ttl)
+        await pipe.execute()
+
+    async def create(self, course_ids: Optional[List[int]] = None, force: bool = False) -> str:
+        """
+        Record a new queued job.
+
+        Args:
+            course_ids: IDs of the courses to summarise, or None for every course
+            force: Regenerate even unchanged summaries
+
+        Returns:
+            The job ID
+        """
+        job_id = uuid4().hex
+        await self._update(
+            job_id,
+            status="queued",
+            force=int(force),
+            course_ids="" if course_ids is None else json.dumps(course_ids),
+            created_at=int(time.time()),
+        )
+        return job_id
+
+    async def start(self, job_id: str) -> List[int]:
+        """
+        Mark a job running and fix its course list.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            IDs of the job's courses without a recorded outcome
+        """
+        job = await self.redis.hgetall(self.job_key(job_id))
+        if not job:
+            raise KeyError(f"Unknown summary job: {job_id}")
+
+        if job.get("course_ids"):
+            course_ids = json.loads(job["course_ids"])
+        else:
+            # Resolved once, so a restarted job keeps the courses it started with
+            async with session_factory() as read_session:
+                result = await read_session.execute(select(Course.id).order_by(Course.id))
+            course_ids = list(result.scalars().all())
+
+        done = await self.redis.hgetall(self.results_key(job_id))
+        pending = [course_id for course_id in course_ids if str(course_id) not in done]
+        await self._update(
+            job_id,
+            status="running" if pending else "completed",
+            course_ids=json.dumps(course_ids),
+            total=len(course_ids),
+        )
+        return pending
+
+    async def run_course(self, job_id: str, course_id: int, final_attempt: bool = True) -> Optional[str]:
+        """
+        Summarise one course of a job and record its outcome.
+
+        Args:
+            job_id: ID of the job
+            course_id: ID of the course
+            final_attempt: Record a failure as the course's outcome instead of raising it
+
+        Returns:
+            The outcome (generated, unchanged, skipped or error), or None if the course
+            was already done
+        """
+        recorded = await self.redis.hget(self.results_key(job_id), str(course_id))
+        if recorded is not None:
+            return None
+
+        force = await self.redis.hget(self.job_key(job_id), "force") == "1"
+        try:
+            outcome = OUTCOMES[await self.service.refresh(course_id, force=force)]
+            result = {"outcome": outcome}
+        except Exception as e:
+            self.logger.error(f"Error summarising course {course_id} in job {job_id}: {e}")
+            if not final_attempt:
+                raise
+            outcome = "error"
+            result = {"outcome": outcome, "error": str(e)}
+
+        await self.redis.hset(self.results_key(job_id), str(course_id), json.dumps(result))
+        await self._update(job_id)
+        return outcome
+
+    async def status(self, job_id: str) -> Optional[Dict]:
+        """
+        Progress and per-course outcomes of a job.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            The job status, or None for an unknown or expired job
+        """
+        job = await self.redis.hgetall(self.job_key(job_id))
+        if not job:
+            return None
+
+        outcomes: Dict[str, List] = {"generated": [], "unchanged": [], "skipped": [], "errors": []}
+        results = await self.redis.hgetall(self.results_key(job_id))
+        for course_id, data in sorted(results.items(), key=lambda item: int(item[0])):
+            result = json.loads(data)
+            if result["outcome"] == "error":
+                outcomes["errors"].append({"course_id": int(course_id), "error": result["error"]})
+            else:
+                outcomes[result["outcome"]].append(int(course_id))
+
+        total = int(job["total"]) if job.get("total") else None
+        # Course tasks finish concurrently, so completion is derived rather than stored by each
+        status = "completed" if total is not None and len(results) >= total else job["status"]
+        return {
+            "job_id": job_id,
+            "status": status,
+            "force": job.get("force") == "1",
+            "total": total,
+            "completed": len(results),
+            **outcomes,
+            "created_at": int(job["created_at"]),
+            "updated_at": int(job["updated_at"]),
+        }
+
+
+summary_jobs = SummaryJobs()
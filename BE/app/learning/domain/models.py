@@ -79,6 +79,8 @@ class Course(Base, TimestampMixin):
 
     certificates = relationship("Certificate", back_populates="course")
 
+    summary = relationship("CourseSummary", back_populates="course", uselist=False)
+
     def __repr__(self):
         return f"<Course(name='{self.name}')>"
 
@@ -127,3 +129,18 @@ class CourseContents(Base, TimestampMixin):
 
     def __repr__(self):
         return f"<CourseContents(course_id={self.course_id}, content_type='{self.content_type}')>"
+
+
+class CourseSummary(Base, TimestampMixin):
+    __tablename__ = "course_summaries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), unique=True, nullable=False)
+    course = relationship("Course", back_populates="summary")
+
+    summary = Column(Text, nullable=False)
+    source_hash = Column(String(64), nullable=False)  # SHA-256 of the summarised content_text
+    model = Column(String(255), nullable=False)
+
+    def __repr__(self):
+        return f"<CourseSummary(course_id={self.course_id}, model='{self.model}')>"
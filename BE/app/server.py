@@ -1,13 +1,20 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware import Middleware
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from prometheus_client import make_asgi_app
 
 from app.auth.adapter.input.api import router as auth_router
 from app.container import Container
 from app.user.adapter.input.api import router as user_router
 from app.code.adapter.input.api import router as code_router
 from app.learning.adapter.input.api import router as learning_router
+from core.ai.history import conversation_history
+from core.ai.llm import llm_registry
+from core.ai.transcript_provider import async_transcript_provider
 from core.config import config
 from core.exceptions import CustomException
 from core.fastapi.dependencies import Logging
@@ -79,6 +86,26 @@ def init_cache() -> None:
     Cache.init(backend=RedisBackend(), key_maker=CustomKeyMaker())
 
 
+def init_metrics(app_: FastAPI) -> None:
+    # Prometheus exposition of the process metrics, including the AI latency, token and cost metrics
+    if config.METRICS_ENABLED:
+        app_.mount("/metrics", make_asgi_app())
+
+
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    try:
+        await async_transcript_provider.init(weaviate_url=config.WEAVIATE_URL)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Weaviate unavailable at startup, connecting lazily: {e}")
+
+    yield
+
+    await async_transcript_provider.close()
+    await conversation_history.drain()
+    await llm_registry.aclose()
+
+
 def create_app() -> FastAPI:
     app_ = FastAPI(
         title="Hide",
@@ -88,10 +115,12 @@ def create_app() -> FastAPI:
         redoc_url=None if config.ENV == "production" else "/redoc",
         dependencies=[Depends(Logging)],
         middleware=make_middleware(),
+        lifespan=lifespan,
     )
     init_routers(app_=app_)
     init_listeners(app_=app_)
     init_cache()
+    init_metrics(app_=app_)
     return app_
 
 
@@ -1,12 +1,34 @@
+import asyncio
+from typing import Awaitable, TypeVar
+
 from celery import Celery
 from core.config import config
 
+T = TypeVar("T")
 
 celery_app = Celery(
     "worker",
     backend=config.CELERY_BACKEND_URL,
     broker=config.CELERY_BROKER_URL,
+    include=["celery_task.tasks.summary"],
 )
 
-celery_app.conf.task_routes = {"worker.celery_worker.test_celery": "test-queue"}
+celery_app.conf.task_routes = {
+    "worker.celery_worker.test_celery": "test-queue",
+    "summary.*": {"queue": config.SUMMARY_TASK_QUEUE},
+}
 celery_app.conf.update(task_track_started=True)
+
+# One event loop per worker process: the async database engine and Redis clients keep
+# connections bound to the loop they were opened on, so tasks must not each create one
+_loop = None
+
+
+def run_async(awaitable: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion on the worker process's event loop.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(awaitable)
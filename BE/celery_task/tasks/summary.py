@@ -0,0 +1,55 @@
+import logging
+from typing import Optional
+
+from app.learning.application.service.summary_job import summary_jobs
+from celery_task import celery_app, run_async
+from core.config import config
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="summary.summarise_courses", acks_late=True, reject_on_worker_lost=True)
+def summarise_courses(job_id: str) -> int:
+    """
+    Start a summarisation job: queue one task per course not summarised yet.
+
+    Safe to run again for the same job, e.g. when redelivered after a worker crash;
+    courses already done are not queued again.
+
+    Args:
+        job_id: ID of a job created with `summary_jobs.create`
+
+    Returns:
+        Number of course tasks queued
+    """
+    pending = run_async(summary_jobs.start(job_id))
+    for course_id in pending:
+        summarise_course.delay(job_id, course_id)
+    logger.info(f"Summary job {job_id}: queued {len(pending)} courses")
+    return len(pending)
+
+
+@celery_app.task(
+    name="summary.summarise_course",
+    bind=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+    rate_limit=config.SUMMARY_TASK_RATE_LIMIT,
+    max_retries=config.SUMMARY_TASK_MAX_RETRIES,
+)
+def summarise_course(self, job_id: str, course_id: int) -> Optional[str]:
+    """
+    Summarise one course of a job, retrying failures with exponential backoff.
+
+    Args:
+        job_id: ID of the job
+        course_id: ID of the course
+
+    Returns:
+        The course's outcome, or None if it was already done
+    """
+    final_attempt = self.request.retries >= self.max_retries
+    try:
+        return run_async(summary_jobs.run_course(job_id, course_id, final_attempt=final_attempt))
+    except Exception as e:
+        raise self.retry(exc=e, countdown=2 ** self.request.retries * 30)
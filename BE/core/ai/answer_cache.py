@@ -0,0 +1,246 @@
+import logging
+import struct
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+
+from core.ai.metrics import ANSWER_CACHE_REQUESTS, ANSWER_CACHE_SIMILARITY
+from core.config import config
+from core.helpers.redis import async_binary_redis_client, sync_redis_client
+
+# Each stored question is its creation time followed by its float32 embedding
+TIMESTAMP = struct.Struct("<d")
+
+
+def stream_id(value: str) -> Tuple[int, int]:
+    """
+    Order key of a Redis stream entry ID such as "1700000000000-3".
+    """
+    milliseconds, sequence = value.split("-")
+    return int(milliseconds), int(sequence)
+
+
+@dataclass
+class _CourseIndex:
+    """
+    Entries of one course generation mirrored in process memory, oldest first.
+    """
+    generation: int
+    last_id: str = "-"
+    ids: List[str] = field(default_factory=list)
+    created: List[float] = field(default_factory=list)
+    vectors: List[np.ndarray] = field(default_factory=list)
+    matrix: Optional[np.ndarray] = None
+
+
+class SemanticAnswerCache:
+    """
+    Per-course cache of chat answers, looked up by question embedding similarity.
+
+    Entries of a course are appended to a Redis stream (question vector with its creation
+    time, and answer) under the course's current generation, trimmed to `max_entries`.
+    Reindexing a course bumps the generation, so every earlier answer is dropped at once;
+    old streams expire by TTL.
+
+    Each process mirrors the question vectors of up to `local_courses` recently asked
+    courses. A lookup reads the generation together with only the entries added since the
+    last lookup, compares the question with the mirrored vectors in one vectorized
+    product, and fetches the answer from Redis on a hit. Redis failures are logged and
+    treated as misses.
+    """
+
+    def __init__(self, *, threshold: float = config.ANSWER_CACHE_THRESHOLD,
+                 ttl: int = config.ANSWER_CACHE_TTL,
+                 max_entries: int = config.ANSWER_CACHE_MAX_ENTRIES,
+                 local_courses: int = config.ANSWER_CACHE_LOCAL_COURSES,
+                 redis: Optional[AsyncRedis] = async_binary_redis_client,
+                 sync_redis: Optional[Redis] = sync_redis_client,
+                 key_prefix: str = "answer_cache"):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cached answer to be reused
+            ttl: Time to live of an answer in seconds
+            max_entries: Maximum number of answers kept per course; the oldest are evicted
+            local_courses: Maximum number of courses whose vectors are mirrored in memory
+            redis: Binary asyncio Redis client used on the request path
+            sync_redis: Synchronous Redis client used for invalidation from ingestion code
+            key_prefix: Prefix for Redis keys
+        """
+        self.logger = logging.getLogger(__name__)
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.local_courses = local_courses
+        self.redis = redis
+        self.sync_redis = sync_redis
+        self.key_prefix = key_prefix
+        self._indexes: "OrderedDict[int, _CourseIndex]" = OrderedDict()
+
+    def generation_key(self, course_id: int) -> str:
+        return f"{self.key_prefix}:{course_id}:generation"
+
+    def entries_key(self, course_id: int, generation: int) -> str:
+        return f"{self.key_prefix}:{course_id}:{generation}:entries"
+
+    async def _generation(self, course_id: int) -> int:
+        value = await self.redis.get(self.generation_key(course_id))
+        return int(value) if value is not None else 0
+
+    async def _sync_index(self, course_id: int) -> _CourseIndex:
+        """
+        Bring the course's mirrored entries up to date with Redis.
+
+        One round trip reads the generation and the entries added since the last sync; a
+        second is only needed when the generation changed.
+        """
+        index = self._indexes.get(course_id)
+        if index is None:
+            generation = await self._generation(course_id)
+            index = _CourseIndex(generation)
+        else:
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.get(self.generation_key(course_id))
+            pipeline.xrange(self.entries_key(course_id, index.generation), f"({index.last_id}", "+")
+            value, added = await pipeline.execute()
+            generation = int(value) if value is not None else 0
+            if generation == index.generation:
+                self._append(index, added)
+                return index
+            index = _CourseIndex(generation)
+
+        self._indexes[course_id] = index
+        self._indexes.move_to_end(course_id)
+        while len(self._indexes) > self.local_courses:
+            self._indexes.popitem(last=False)
+        self._append(index, await self.redis.xrange(self.entries_key(course_id, generation), "-", "+"))
+        return index
+
+    def _append(self, index: _CourseIndex, entries: list) -> None:
+        # Entries already mirrored by a concurrent sync are skipped
+        fresh = [
+            (entry_id.decode(), data[b"v"]) for entry_id, data in entries
+            if index.last_id == "-" or stream_id(entry_id.decode()) > stream_id(index.last_id)
+        ]
+        if not fresh:
+            return
+
+        for entry_id, data in fresh:
+            index.ids.append(entry_id)
+            index.created.append(TIMESTAMP.unpack_from(data)[0])
+            index.vectors.append(np.frombuffer(data, dtype=np.float32, offset=TIMESTAMP.size))
+        index.last_id = fresh[-1][0]
+
+        # Mirror the stream's trimming
+        excess = len(index.ids) - self.max_entries
+        if excess > 0:
+            del index.ids[:excess], index.created[:excess], index.vectors[:excess]
+        index.matrix = None
+
+    async def lookup(self, course_id: int, vector: List[float]) -> Optional[str]:
+        """
+        Return a cached answer for a question similar enough to this one.
+
+        Args:
+            course_id: ID of the course the question is about
+            vector: Embedding of the question
+
+        Returns:
+            The cached answer, or None on a miss
+        """
+        try:
+            index = await self._sync_index(course_id)
+
+            best_id, best_similarity = self._best_match(index, vector)
+            if best_id is not None:
+                ANSWER_CACHE_SIMILARITY.observe(best_similarity)
+            if best_id is None or best_similarity < self.threshold:
+                ANSWER_CACHE_REQUESTS.labels(result="miss").inc()
+                return None
+
+            found = await self.redis.xrange(self.entries_key(course_id, index.generation), best_id, best_id)
+            if not found:
+                ANSWER_CACHE_REQUESTS.labels(result="miss").inc()
+                return None
+
+            ANSWER_CACHE_REQUESTS.labels(result="hit").inc()
+            self.logger.info(f"Answer cache hit for course {course_id} (similarity {best_similarity:.3f})")
+            return found[0][1][b"a"].decode("utf-8")
+
+        except Exception as e:
+            ANSWER_CACHE_REQUESTS.labels(result="error").inc()
+            self.logger.warning(f"Answer cache lookup failed: {e}")
+            return None
+
+    def _best_match(self, index: _CourseIndex, vector: List[float]) -> tuple:
+        """
+        Most similar unexpired entry as (entry ID, cosine similarity), or (None, 0.0).
+        """
+        if not index.ids:
+            return None, 0.0
+        if index.matrix is None:
+            # Entries from another embedding size never match
+            size = len(vector)
+            index.matrix = np.vstack([
+                row if len(row) == size else np.zeros(size, dtype=np.float32) for row in index.vectors
+            ])
+        if index.matrix.shape[1] != len(vector):
+            return None, 0.0
+
+        live = np.asarray(index.created) >= time.time() - self.ttl
+        if not live.any():
+            return None, 0.0
+
+        query = np.asarray(vector, dtype=np.float32)
+        norms = np.linalg.norm(index.matrix, axis=1) * np.linalg.norm(query)
+        similarities = np.where(live, index.matrix @ query / np.maximum(norms, 1e-12), -np.inf)
+        best = int(similarities.argmax())
+        return index.ids[best], float(similarities[best])
+
+    async def store(self, course_id: int, vector: List[float], answer: str) -> None:
+        """
+        Cache an answer under its question embedding.
+
+        Args:
+            course_id: ID of the course the question is about
+            vector: Embedding of the question
+            answer: Final answer returned to the user
+        """
+        try:
+            entries_key = self.entries_key(course_id, await self._generation(course_id))
+            data = TIMESTAMP.pack(time.time()) + np.asarray(vector, dtype=np.float32).tobytes()
+
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.xadd(entries_key, {"v": data, "a": answer.encode("utf-8")},
+                          maxlen=self.max_entries, approximate=False)
+            pipeline.expire(entries_key, self.ttl)
+            await pipeline.execute()
+
+        except Exception as e:
+            self.logger.warning(f"Answer cache write failed: {e}")
+
+    def invalidate(self, course_id: int) -> None:
+        """
+        Drop every cached answer of a course, e.g. after its transcripts were reindexed.
+
+        Synchronous so ingestion and reindexing code can call it directly.
+
+        Args:
+            course_id: ID of the course
+        """
+        if self.sync_redis is None:
+            return
+        try:
+            self.sync_redis.incrby(self.generation_key(course_id), 1)
+            self.logger.info(f"Invalidated cached answers of course {course_id}")
+        except Exception as e:
+            self.logger.warning(f"Answer cache invalidation failed for course {course_id}: {e}")
+
+
+answer_cache = SemanticAnswerCache()
@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from core.ai.embedding_cache import EmbeddingCache, embedding_namespace
+from core.ai.llm import llm_registry
+from core.ai.transcript_manager import (
+    TRANSCRIPT_PROPERTIES,
+    create_numpy_store,
+    release_numpy_store,
+    report_retrieval,
+    rerank,
+)
+from core.ai.vector_store import AsyncVectorStore, AsyncWeaviateVectorStore, NumpyVectorStore, ThreadedVectorStore
+from core.config import config
+
+
+class AsyncTranscriptManager:
+    """
+    Asyncio variant of TranscriptManager for the request path.
+
+    Embeddings go through `aembed_query` and the shared embedding cache, and the vector
+    store is an AsyncVectorStore (Weaviate's async client, or a sync backend run in worker
+    threads), so retrieval never blocks the event loop. Ingestion and reindexing stay on
+    the synchronous TranscriptManager.
+    """
+
+    def __init__(self, store: AsyncVectorStore, collection_name: str = "Transcripts"):
+        """
+        Initialize AsyncTranscriptManager with a connected store.
+
+        Use `AsyncTranscriptManager.connect` to create the configured store.
+
+        Args:
+            store: Connected async vector store
+            collection_name: Name of the collection storing transcripts
+        """
+        self.logger = logging.getLogger(__name__)
+        self.store = store
+        self.collection_name = collection_name
+        self._initialize_embedding_model()
+
+    @classmethod
+    async def connect(cls, weaviate_url: Optional[str] = None,
+                      collection_name: str = "Transcripts") -> "AsyncTranscriptManager":
+        """
+        Connect to the vector store selected by VECTOR_STORE_BACKEND.
+
+        Args:
+            weaviate_url: URL to the Weaviate instance (used by the Weaviate backend)
+            collection_name: Name of the collection storing transcripts
+
+        Returns:
+            A connected AsyncTranscriptManager
+        """
+        if config.VECTOR_STORE_BACKEND == "numpy":
+            store = ThreadedVectorStore(create_numpy_store(collection_name))
+        else:
+            store = await AsyncWeaviateVectorStore.connect(
+                weaviate_url or config.WEAVIATE_URL,
+                collection_name=collection_name,
+                properties=TRANSCRIPT_PROPERTIES,
+            )
+        return cls(store, collection_name=collection_name)
+
+    def _initialize_embedding_model(self) -> None:
+        """
+        Initialize the OpenAI embedding model.
+
+        Raises:
+            Exception: If initialization fails
+        """
+        try:
+            self.embedding_model = llm_registry.embeddings(config.EMBEDDING_MODEL, config.EMBEDDING_DIMENSIONS)
+            self.embedding_cache = EmbeddingCache(
+                namespace=embedding_namespace(config.EMBEDDING_MODEL, config.EMBEDDING_DIMENSIONS)
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to initialize OpenAI embedding model: {e}")
+            raise
+
+    async def create_embedding(self, text: str) -> List[float]:
+        """
+        Generate embedding for the given text, served from the embedding cache when possible.
+
+        Args:
+            text: The text to generate embeddings for
+
+        Returns:
+            The embedding vector as a list of floats
+        """
+        try:
+            async def embed(texts: List[str]) -> List[List[float]]:
+                return [await self.embedding_model.aembed_query(texts[0])]
+
+            embeddings = await self.embedding_cache.aget_or_create([text], embed)
+            return embeddings[0]
+        except Exception as e:
+            self.logger.error(f"Error generating embedding: {e}")
+            raise
+
+    async def vector_search(self, query_text: str, limit: int = 5, **filter_kwargs) -> List[Dict[str, Any]]:
+        """
+        Search for objects by vector similarity with optional filters.
+
+        Args:
+            query_text: The search query text
+            limit: Maximum number of results to return
+            **filter_kwargs: Keyword arguments for filtering results (property=value)
+
+        Returns:
+            List of matching objects sorted by relevance
+        """
+        try:
+            started = time.perf_counter()
+            query_vector = await self.create_embedding(query_text)
+            embedded = time.perf_counter()
+
+            results = await self.store.search(query_vector, limit=limit, filters=filter_kwargs)
+            finished = time.perf_counter()
+
+            report_retrieval(
+                self.logger, "vector", query_text, results, results, "similarity",
+                embed=embedded - started, search=finished - embedded, total=finished - started,
+            )
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Error searching objects: {e}")
+            raise
+
+    async def hybrid_search(self, query_text: str, limit: Optional[int] = None,
+                            alpha: Optional[float] = None, **filter_kwargs) -> List[Dict[str, Any]]:
+        """
+        Search for objects by fused keyword (BM25) and vector scores, see
+        `TranscriptManager.hybrid_search`.
+
+        Args:
+            query_text: The search query text
+            limit: Maximum number of results to return (defaults to RETRIEVAL_TOP_K)
+            alpha: Weight of the vector score; 0 is pure keyword, 1 is pure vector search
+                (defaults to RETRIEVAL_ALPHA)
+            **filter_kwargs: Keyword arguments for filtering results (property=value)
+
+        Returns:
+            List of matching objects sorted by relevance
+        """
+        limit = config.RETRIEVAL_TOP_K if limit is None else limit
+        alpha = config.RETRIEVAL_ALPHA if alpha is None else alpha
+        try:
+            started = time.perf_counter()
+            query_vector = await self.create_embedding(query_text)
+            embedded = time.perf_counter()
+
+            candidates = await self.store.hybrid_search(
+                query_text,
+                query_vector,
+                alpha=alpha,
+                limit=limit * config.RETRIEVAL_CANDIDATE_MULTIPLIER,
+                filters=filter_kwargs,
+            )
+            searched = time.perf_counter()
+
+            results = rerank(query_text, candidates, limit)
+            finished = time.perf_counter()
+
+            report_retrieval(
+                self.logger, "hybrid", query_text, candidates, results, "score",
+                embed=embedded - started, search=searched - embedded,
+                rerank=finished - searched, total=finished - started,
+            )
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Error in hybrid search: {e}")
+            raise
+
+    async def most_similar_content(self, query_text: str, **filter_kwargs) -> Optional[str]:
+        """
+        Find the most similar content to the query text.
+
+        Args:
+            query_text: The search query text
+            **filter_kwargs: Keyword arguments for filtering results (property=value)
+
+        Returns:
+            The text of the most similar transcript or None if no results are found
+        """
+        try:
+            results = await self.hybrid_search(query_text, limit=1, **filter_kwargs)
+            if results:
+                return results[0].get("text")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error finding most similar content: {e}")
+            raise
+
+    async def get_transcript(self, transcript_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a transcript by its global ID.
+
+        Args:
+            transcript_id: Global ID of the transcript
+
+        Returns:
+            The transcript data or None if not found
+        """
+        try:
+            objects = await self.store.fetch(filters={"transcript_id": transcript_id}, limit=1)
+            if not objects:
+                self.logger.warning(f"Transcript with ID {transcript_id} not found")
+                return None
+            return objects[0]
+        except Exception as e:
+            self.logger.error(f"Error retrieving transcript: {e}")
+            raise
+
+    async def is_ready(self) -> bool:
+        """
+        Whether the underlying vector store can serve requests.
+        """
+        return await self.store.is_ready()
+
+    async def close(self) -> None:
+        """
+        Close the vector store connection.
+        """
+        if isinstance(self.store, ThreadedVectorStore) and isinstance(self.store.store, NumpyVectorStore):
+            # The NumPy store may be shared with the other managers of the process
+            await asyncio.to_thread(release_numpy_store, self.store.store)
+        else:
+            await self.store.close()
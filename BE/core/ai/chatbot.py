@@ -1,20 +1,41 @@
-from typing import List, Annotated
+import asyncio
+import hashlib
+import logging
+import time
+from contextlib import aclosing
+from functools import lru_cache
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Annotated, Optional, Tuple, TypeVar
 
 from langchain_core.messages import SystemMessage, BaseMessage, HumanMessage, AnyMessage
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 from langgraph.graph import StateGraph, START, END, add_messages
 from pydantic import BaseModel
 from typing_extensions import TypedDict, Literal
 
 from core.config import config
-from core.ai.transcript_manager import TranscriptManager
+from core.ai.answer_cache import answer_cache
+from core.ai.concurrency import limited_call, llm_limiter
+from core.ai.history import conversation_history
+from core.ai.instrumentation import ai_call_context
+from core.ai.intent_classifier import intent_classifier
+from core.ai.llm import llm_registry
+from core.ai.metrics import CHAT_STAGE_LATENCY
+from core.ai.transcript_provider import async_transcript_provider
 
-def do_rag(message: str, course_id: int = 1) -> str:
-    # Placeholder for RAG function
-    tm = TranscriptManager(config.WEAVIATE_URL)
-    rt_res = tm.most_similar_content(message, course_id=course_id)
+T = TypeVar("T")
+SummaryLoader = Callable[[int], Awaitable[Optional[str]]]
 
-    prompt = f"""
+NO_SUMMARY_MESSAGE = "A summary of this course is not available yet. Please try again later."
+logger = logging.getLogger(__name__)
+
+def format_context(results: List[dict]) -> str:
+    return "\n\n".join(
+        f"[{result.get('start_time')}s-{result.get('end_time')}s] {result.get('text')}" for result in results
+    )
+
+def rag_prompt(message: str, context: str) -> str:
+    return f"""
     The user message is:
     ```
     {message}
@@ -22,30 +43,50 @@ def do_rag(message: str, course_id: int = 1) -> str:
     
     Additional context for info:
     ```
-    {rt_res}
+    {context}
     ```
     
     Generate a response to the user message based on the additional context.
     """
 
-    llm = ChatOpenAI(
-        model="gpt-4o-mini",
-        api_key=config.OPENAI_API_KEY,
-        temperature=0,
-    )
+def general_prompt(history: str) -> str:
+    return f"""
+        Provide response to the user query.
+        {history}
+        """
+
+def chat_llm() -> ChatOpenAI:
+    return llm_registry.chat("chat")
+
+def normalise(text: str) -> str:
+    return " ".join(text.lower().split())
+
+async def retrieve_context(message: str, course_id: int) -> str:
+    async def search() -> str:
+        tm = await async_transcript_provider.get()
+        return format_context(await tm.hybrid_search(message, course_id=course_id))
+
+    # Identical questions arriving together share one retrieval
+    return await limited_call((course_id, normalise(message)), course_id, search, kind="retrieval")
 
-    res = llm.invoke(prompt)
+async def do_rag(message: str, course_id: int = 1, context: Optional[str] = None) -> str:
+    if context is None:
+        context = await retrieve_context(message, course_id)
+    prompt = rag_prompt(message, context)
+    res = await limited_call(
+        (course_id, normalise(message)), course_id, lambda: chat_llm().ainvoke(prompt), kind="rag"
+    )
     return res.content
 
-def intent_identifier(message: str) -> str:
-    class Intent(BaseModel):
-        intent: Literal["summary", "course_question", "general_question"]
+class Intent(BaseModel):
+    intent: Literal["summary", "course_question", "general_question"]
+
+@lru_cache(maxsize=None)
+def intent_llm() -> Runnable:
+    return llm_registry.chat("intent").with_structured_output(Intent)
 
-    llm = ChatOpenAI(
-        model="gpt-4o-mini",
-        api_key=config.OPENAI_API_KEY,
-        temperature=0,
-    ).with_structured_output(Intent)
+async def llm_intent(message: str) -> str:
+    llm = intent_llm()
     prompt: str = f"""
     You are provided with additional tools as a chatbot.
     
@@ -59,30 +100,169 @@ def intent_identifier(message: str) -> str:
     user input:
     {message}
     """
-    res = llm.invoke(message)
+    res = await limited_call(normalise(message), None, lambda: llm.ainvoke(prompt), kind="intent")
     return res.intent
 
-def chat(messages: List[str], course_id: int = 1) -> str:
-    intent = intent_identifier(messages[-1])
-
-    if intent == 'summary':
-        # Call the summarizer function here
-        return "Summary function called"
-    elif intent == 'course_question':
-        # Call the course question function here
-        return do_rag(messages[-1], course_id)
-    else:
-        llm = ChatOpenAI(
-            model="gpt-4o-mini",
-            api_key=config.OPENAI_API_KEY,
-            temperature=0,
-        )
-        prompt = f"""
-        Provide response to the user query.
-        {messages}
-        """
-        res = llm.invoke(prompt)
-        return f"Assistant: {res.content}"
+async def intent_identifier(message: str) -> str:
+    if not config.INTENT_FAST_PATH_ENABLED:
+        return await llm_intent(message)
+    # The message embedding is shared with the answer cache and retrieval through the embedding cache
+    tm = await async_transcript_provider.get()
+    return await intent_classifier.classify(message, tm.create_embedding, llm_intent)
+
+async def cached_answer(question: str, course_id: int) -> Tuple[Optional[str], Optional[List[float]]]:
+    """
+    Look the question up in the semantic answer cache.
+
+    Returns the cached answer (or None) and the question embedding for storing a new answer.
+    """
+    if not config.ANSWER_CACHE_ENABLED:
+        return None, None
+    tm = await async_transcript_provider.get()
+    question_vector = await tm.create_embedding(question)
+    return await answer_cache.lookup(course_id, question_vector), question_vector
+
+async def timed(awaitable: Awaitable[T], timings: Dict[str, float], stage: str) -> T:
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = time.perf_counter() - started
+
+def report_timings(intent: Optional[str], timings: Dict[str, float]) -> None:
+    for stage, seconds in timings.items():
+        CHAT_STAGE_LATENCY.labels(stage=stage).observe(seconds)
+    stages = " ".join(f"{stage}={seconds * 1000:.0f}ms" for stage, seconds in timings.items())
+    logger.info(f"Chat timings ({intent or 'unclassified'}): {stages}")
+
+async def plan_answer(message: str, course_id: int, timings: Dict[str, float]) -> Tuple[str, Optional[str]]:
+    """
+    Classify the message and fetch course context for course questions.
+
+    With CHAT_SPECULATIVE_RETRIEVAL the retrieval starts alongside intent classification
+    and is cancelled if the intent is not `course_question`, taking a round trip off the
+    critical path of course questions. `retrieval_wait` is the part of the retrieval
+    still left once the intent is known.
+
+    Returns the intent and the retrieved context (None for other intents).
+    """
+    async def retrieve() -> str:
+        return await timed(retrieve_context(message, course_id), timings, "retrieval")
+
+    retrieval = None
+    if config.CHAT_SPECULATIVE_RETRIEVAL:
+        # Created inside the task, so a task cancelled before it starts leaves no coroutine unawaited
+        retrieval = asyncio.create_task(retrieve())
+        # A failed speculative retrieval only matters if its result is awaited
+        retrieval.add_done_callback(lambda task: task.cancelled() or task.exception())
+    try:
+        intent = await timed(intent_identifier(message), timings, "intent")
+        if intent != 'course_question':
+            return intent, None
+        if retrieval is None:
+            return intent, await retrieve()
+        return intent, await timed(retrieval, timings, "retrieval_wait")
+    finally:
+        if retrieval is not None and not retrieval.done():
+            retrieval.cancel()
+
+async def general_history(messages: List[str], conversation_id: Optional[str]) -> str:
+    window = await conversation_history.window(messages, conversation_id, model=config.LLM_CHAT_MODEL)
+    return window.render()
+
+async def course_summary(course_id: int, summary_loader: Optional[SummaryLoader]) -> str:
+    summary = await summary_loader(course_id) if summary_loader is not None else None
+    return summary or NO_SUMMARY_MESSAGE
+
+async def chat(messages: List[str], course_id: int = 1, conversation_id: Optional[str] = None,
+               summary_loader: Optional[SummaryLoader] = None) -> str:
+    with ai_call_context("course_chat", course_id):
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        intent = None
+        try:
+            # Near-identical course questions are answered from the semantic cache,
+            # skipping the intent, retrieval and generation calls
+            cached, question_vector = await timed(cached_answer(messages[-1], course_id), timings, "cache")
+            if cached is not None:
+                intent = "cached"
+                return cached
+
+            intent, context = await plan_answer(messages[-1], course_id, timings)
+
+            if intent == 'summary':
+                # Summaries are generated offline; answering is a storage read
+                return await timed(course_summary(course_id, summary_loader), timings, "summary")
+            elif intent == 'course_question':
+                # Call the course question function here
+                answer = await timed(do_rag(messages[-1], course_id, context), timings, "generation")
+                if question_vector is not None:
+                    await answer_cache.store(course_id, question_vector, answer)
+                return answer
+            else:
+                prompt = general_prompt(await timed(general_history(messages, conversation_id), timings, "history"))
+                prompt_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+                res = await timed(limited_call(
+                    prompt_key, course_id, lambda: chat_llm().ainvoke(prompt), kind="general"
+                ), timings, "generation")
+                return f"Assistant: {res.content}"
+        finally:
+            timings["total"] = time.perf_counter() - started
+            report_timings(intent, timings)
+
+async def stream_tokens(prompt: str, course_id: int, timings: Dict[str, float]) -> AsyncIterator[str]:
+    started = time.perf_counter()
+    try:
+        # Streams cannot be shared, but they hold a concurrency slot until they finish
+        async with llm_limiter.slot(course_id, kind="stream"), aclosing(chat_llm().astream(prompt)) as stream:
+            async for chunk in stream:
+                if chunk.content:
+                    timings.setdefault("first_token", time.perf_counter() - started)
+                    yield chunk.content
+    finally:
+        timings["generation"] = time.perf_counter() - started
+
+async def chat_stream(messages: List[str], course_id: int = 1, conversation_id: Optional[str] = None,
+                      summary_loader: Optional[SummaryLoader] = None) -> AsyncIterator[str]:
+    """
+    Streaming variant of `chat` yielding the answer as text deltas.
+
+    The concatenated deltas equal what `chat` returns. Closing the generator (e.g. when
+    the client disconnects) cancels the upstream LLM stream.
+    """
+    with ai_call_context("course_chat_stream", course_id):
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+        intent = None
+        try:
+            cached, question_vector = await timed(cached_answer(messages[-1], course_id), timings, "cache")
+            if cached is not None:
+                intent = "cached"
+                yield cached
+                return
+
+            intent, context = await plan_answer(messages[-1], course_id, timings)
+
+            if intent == 'summary':
+                yield await timed(course_summary(course_id, summary_loader), timings, "summary")
+            elif intent == 'course_question':
+                parts = []
+                async with aclosing(stream_tokens(rag_prompt(messages[-1], context), course_id, timings)) as stream:
+                    async for token in stream:
+                        parts.append(token)
+                        yield token
+                # Only complete answers are cached
+                if question_vector is not None:
+                    await answer_cache.store(course_id, question_vector, "".join(parts))
+            else:
+                yield "Assistant: "
+                prompt = general_prompt(await timed(general_history(messages, conversation_id), timings, "history"))
+                async with aclosing(stream_tokens(prompt, course_id, timings)) as stream:
+                    async for token in stream:
+                        yield token
+        finally:
+            timings["total"] = time.perf_counter() - started
+            report_timings(intent, timings)
 
 if __name__ == '__main__':
     messages = [
@@ -90,6 +270,6 @@ if __name__ == '__main__':
         "Assistant: The capital of France is Paris.",
         "User: what is taught in the current course?",
     ]
-    res = chat(messages)
+    res = asyncio.run(chat(messages))
     print(res)
 
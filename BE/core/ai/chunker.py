@@ -0,0 +1,397 @@
+import hashlib
+import math
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterable, Iterator, List, Optional
+
+from core.ai.tokens import count_tokens
+
+# SRT (00:01:02,500) and WebVTT (01:02.500 or 00:01:02.500) timestamps
+TIMESTAMP_PATTERN = re.compile(r"(?:(\d+):)?(\d{1,2}):(\d{2})[.,](\d{1,3})")
+CUE_TIMING_PATTERN = re.compile(rf"({TIMESTAMP_PATTERN.pattern})\s*-->\s*({TIMESTAMP_PATTERN.pattern})")
+# Inline caption markup such as <v Speaker>, <c.yellow> or <00:00:01.000>
+CAPTION_TAG_PATTERN = re.compile(r"<[^>]+>")
+# A sentence runs up to terminal punctuation followed by whitespace, or to a line break,
+# so identifiers and numbers such as np.argmax or 3.5 stay intact
+SENTENCE_PATTERN = re.compile(r"\S.*?(?:[.!?]+(?=\s|$)|(?=\n)|$)")
+# In prose, line breaks inside a paragraph are wrapping, not sentence ends
+PROSE_SENTENCE_PATTERN = re.compile(r"\S.*?(?:[.!?]+(?=\s|$)|$)", re.DOTALL)
+PARAGRAPH_BREAK_PATTERN = re.compile(r"\n[^\S\n]*\n\s*")
+
+
+@dataclass
+class Cue:
+    """
+    A piece of transcript text with its time range in seconds.
+
+    `paragraph_start` marks the first sentence of a paragraph in plain text.
+    """
+    start: float
+    end: float
+    text: str
+    paragraph_start: bool = False
+
+
+@dataclass
+class TranscriptChunk:
+    """
+    A time-aligned transcript chunk ready to be embedded.
+
+    `content_hash` identifies the chunk by its text alone, so unchanged chunks are
+    recognised across ingestion runs even when estimated times shift.
+    """
+    index: int
+    text: str
+    start_time: int
+    end_time: int
+    token_count: int
+    content_hash: str
+
+
+def content_hash(text: str) -> str:
+    """
+    Hash a chunk's text.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def is_anchor(cue: Cue, tokens: int, anchor_tokens: int) -> bool:
+    """
+    Whether a chunk may start at this cue, decided by the cue's own content.
+
+    Paragraph starts are always anchors. Other cues are picked by a hash of their text
+    with a probability proportional to their size, about one per `anchor_tokens` tokens;
+    0 disables them.
+    """
+    if cue.paragraph_start:
+        return True
+    if anchor_tokens < 1:
+        return False
+    digest = int.from_bytes(hashlib.blake2b(cue.text.encode("utf-8"), digest_size=4).digest(), "big")
+    return digest * anchor_tokens < tokens * 2 ** 32
+
+
+def parse_timestamp(value: str) -> float:
+    """
+    Convert an SRT or WebVTT timestamp to seconds.
+    """
+    match = TIMESTAMP_PATTERN.fullmatch(value.strip())
+    if not match:
+        raise ValueError(f"Invalid caption timestamp: {value}")
+    hours, minutes, seconds, fraction = match.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds) + int(fraction.ljust(3, "0")) / 1000
+
+
+def parse_duration(value: Optional[str]) -> Optional[int]:
+    """
+    Convert a "mm:ss" or "hh:mm:ss" duration, as stored in `content_data`, to seconds.
+    """
+    if not value:
+        return None
+    try:
+        seconds = 0
+        for part in str(value).split(":"):
+            seconds = seconds * 60 + int(part)
+        return seconds
+    except ValueError:
+        return None
+
+
+def parse_captions(lines: Iterable[str]) -> Iterator[Cue]:
+    """
+    Parse SRT or WebVTT captions into cues, one cue at a time.
+
+    Cue numbers, the WEBVTT header, NOTE/STYLE blocks and inline markup are skipped.
+
+    Args:
+        lines: Caption lines, e.g. an open caption file
+
+    Returns:
+        Iterator over the cues in file order
+    """
+    timing = None
+    text: List[str] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            if timing is not None and text:
+                yield Cue(start=timing[0], end=timing[1], text=" ".join(text))
+            timing, text = None, []
+            continue
+
+        match = CUE_TIMING_PATTERN.search(line)
+        if match:
+            timing = (parse_timestamp(match.group(1)), parse_timestamp(match.group(6)))
+            text = []
+        elif timing is not None:
+            cleaned = CAPTION_TAG_PATTERN.sub("", line).strip()
+            if cleaned:
+                text.append(cleaned)
+
+    if timing is not None and text:
+        yield Cue(start=timing[0], end=timing[1], text=" ".join(text))
+
+
+def text_cues(text: str, duration: Optional[float] = None) -> Iterator[Cue]:
+    """
+    Split plain transcript text into sentence cues.
+
+    Without captions the timing is estimated by spreading `duration` over the text in
+    proportion to character offsets; without a duration every cue is at 0. The first
+    sentence after a blank line starts a paragraph.
+
+    Args:
+        text: The transcript text
+        duration: Length of the media in seconds, if known
+
+    Returns:
+        Iterator over the sentence cues
+    """
+    length = len(text) or 1
+    previous_end = 0
+    for match in SENTENCE_PATTERN.finditer(text):
+        sentence = match.group().strip()
+        if not sentence:
+            continue
+        if duration:
+            start, end = duration * match.start() / length, duration * match.end() / length
+        else:
+            start = end = 0.0
+        paragraph_start = bool(PARAGRAPH_BREAK_PATTERN.search(text, previous_end, match.start()))
+        previous_end = match.end()
+        yield Cue(start=start, end=end, text=sentence, paragraph_start=paragraph_start)
+
+
+def _split_cue(cue: Cue, max_tokens: int, count: Callable[[str], int]) -> Iterator[Cue]:
+    """
+    Split a cue that exceeds the token budget into word runs with interpolated times.
+    """
+    words = cue.text.split()
+    total = len(cue.text) or 1
+    span = cue.end - cue.start
+    offset = 0
+    piece: List[str] = []
+
+    def emit(words_in_piece: List[str], start_offset: int) -> Cue:
+        piece_text = " ".join(words_in_piece)
+        end_offset = min(total, start_offset + len(piece_text))
+        return Cue(
+            start=cue.start + span * start_offset / total,
+            end=cue.start + span * end_offset / total,
+            text=piece_text,
+            paragraph_start=cue.paragraph_start and start_offset == 0,
+        )
+
+    # Add up the tokens of each word with its separating space instead of re-counting the
+    # growing piece. Tokenizers split on whitespace first, so the sum matches the joined
+    # text; when it is only an overestimate (e.g. counts estimated from the length), the
+    # joined text is counted before splitting, which closes the gap geometrically.
+    piece_tokens = 0
+    for word in words:
+        piece_tokens += count(f" {word}") if piece else count(word)
+        if piece and piece_tokens > max_tokens:
+            piece_tokens = count(" ".join(piece + [word]))
+            if piece_tokens > max_tokens:
+                yield emit(piece, offset)
+                offset += len(" ".join(piece)) + 1
+                piece = []
+                piece_tokens = count(word)
+        piece.append(word)
+    if piece:
+        yield emit(piece, offset)
+
+
+def chunk_cues(cues: Iterable[Cue], max_tokens: int = 256, overlap_tokens: int = 32,
+               count: Callable[[str], int] = count_tokens,
+               anchor_tokens: int = 64) -> Iterator[TranscriptChunk]:
+    """
+    Merge cues into overlapping chunks within a token budget.
+
+    Only the cues of the current chunk are held in memory. Consecutive chunks share
+    trailing cues worth up to `overlap_tokens` tokens, so an answer spanning a chunk
+    boundary is still found whole in one of them. A cue larger than the budget is
+    split on word boundaries.
+
+    Once a chunk holds at least half the budget of new cues, it closes before the next
+    anchor cue (see `is_anchor`). Boundaries therefore follow the content rather than
+    the running token count: after an edit the chunking falls back in step at the next
+    anchor, and only the chunks around the edit get a new hash.
+
+    Args:
+        cues: Time-ordered cues, e.g. from `parse_captions` or `text_cues`
+        max_tokens: Maximum number of tokens per chunk
+        overlap_tokens: Maximum number of tokens repeated from the previous chunk
+        count: Token counting function
+        anchor_tokens: Average spacing in tokens of content-defined anchors; 0 keeps
+            only paragraph starts
+
+    Returns:
+        Iterator over the chunks in time order
+    """
+    if max_tokens < 1 or overlap_tokens < 0 or overlap_tokens >= max_tokens:
+        raise ValueError("max_tokens must be positive and larger than overlap_tokens")
+
+    window: Deque[tuple] = deque()
+    window_tokens = 0
+    # Tokens of the cues added since the last chunk, i.e. excluding the overlap
+    fresh_tokens = 0
+    index = 0
+
+    def build() -> TranscriptChunk:
+        text = " ".join(cue.text for cue, _ in window)
+        start_time = math.floor(window[0][0].start)
+        end_time = math.ceil(max(cue.end for cue, _ in window))
+        return TranscriptChunk(
+            index=index,
+            text=text,
+            start_time=start_time,
+            end_time=end_time,
+            token_count=window_tokens,
+            content_hash=content_hash(text),
+        )
+
+    def pieces() -> Iterator[tuple]:
+        for cue in cues:
+            tokens = count(cue.text)
+            if tokens > max_tokens:
+                for piece in _split_cue(cue, max_tokens, count):
+                    yield piece, count(piece.text)
+            elif tokens:
+                yield cue, tokens
+
+    for cue, tokens in pieces():
+        anchored = fresh_tokens * 2 >= max_tokens and is_anchor(cue, tokens, anchor_tokens)
+        if window and (anchored or window_tokens + tokens > max_tokens):
+            yield build()
+            index += 1
+            # Keep the trailing cues that fit the overlap and still leave room for this cue
+            kept: Deque[tuple] = deque()
+            kept_tokens = 0
+            for item in reversed(window):
+                if kept_tokens + item[1] > overlap_tokens or kept_tokens + item[1] + tokens > max_tokens:
+                    break
+                kept.appendleft(item)
+                kept_tokens += item[1]
+            window, window_tokens, fresh_tokens = kept, kept_tokens, 0
+
+        window.append((cue, tokens))
+        window_tokens += tokens
+        fresh_tokens += tokens
+
+    if window and fresh_tokens:
+        yield build()
+
+
+def chunk_content(content_text: Optional[str] = None, captions: Optional[Iterable[str]] = None,
+                  duration: Optional[float] = None, max_tokens: int = 256,
+                  overlap_tokens: int = 32) -> Iterator[TranscriptChunk]:
+    """
+    Chunk a course content's transcript, preferring captions over plain text.
+
+    Args:
+        content_text: Plain transcript text (`CourseContents.content_text`)
+        captions: SRT or WebVTT caption lines with exact timings
+        duration: Media length in seconds, used to estimate times for plain text
+        max_tokens: Maximum number of tokens per chunk
+        overlap_tokens: Maximum number of tokens repeated from the previous chunk
+
+    Returns:
+        Iterator over the chunks in time order
+    """
+    if captions is not None:
+        cues = parse_captions(captions)
+    else:
+        cues = text_cues(content_text or "", duration)
+    return chunk_cues(cues, max_tokens=max_tokens, overlap_tokens=overlap_tokens)
+
+
+def iter_paragraphs(texts: Iterable[str]) -> Iterator[str]:
+    """
+    Split texts into paragraphs on blank lines, one paragraph at a time.
+    """
+    for text in texts:
+        start = 0
+        for match in PARAGRAPH_BREAK_PATTERN.finditer(text):
+            if text[start:match.start()].strip():
+                yield text[start:match.start()]
+            start = match.end()
+        if text[start:].strip():
+            yield text[start:]
+
+
+def chunk_text(texts: Iterable[str], max_tokens: int, overlap_tokens: int = 0,
+               count: Callable[[str], int] = count_tokens) -> Iterator[str]:
+    """
+    Pack prose into chunks within a token budget, on sentence and paragraph boundaries.
+
+    Texts are walked one paragraph and sentence at a time and only the current chunk is
+    held in memory. Sentences are never cut unless one alone exceeds the budget, in
+    which case it is split on word boundaries. A chunk at least half full closes at a
+    paragraph break rather than starting the next paragraph it cannot hold. Chunks
+    closed mid-paragraph repeat trailing sentences worth up to `overlap_tokens` tokens.
+
+    Args:
+        texts: Texts in order, e.g. the transcripts of a course
+        max_tokens: Maximum number of tokens per chunk
+        overlap_tokens: Maximum number of tokens repeated from the previous chunk
+        count: Token counting function
+
+    Returns:
+        Iterator over the chunk texts; paragraphs inside a chunk are separated by a blank line
+    """
+    if max_tokens < 1 or overlap_tokens < 0 or overlap_tokens >= max_tokens:
+        raise ValueError("max_tokens must be positive and larger than overlap_tokens")
+
+    # Sentences of the current chunk as (text, tokens, starts a paragraph)
+    window: Deque[tuple] = deque()
+    window_tokens = 0
+    fresh = False
+
+    def build() -> str:
+        parts = []
+        for position, (sentence, _, paragraph_start) in enumerate(window):
+            if position:
+                parts.append("\n\n" if paragraph_start else " ")
+            parts.append(sentence)
+        return "".join(parts)
+
+    for paragraph in iter_paragraphs(texts):
+        sentences = []
+        for match in PROSE_SENTENCE_PATTERN.finditer(paragraph):
+            sentence = " ".join(match.group().split())
+            tokens = count(sentence)
+            if tokens > max_tokens:
+                pieces = _split_cue(Cue(0, 0, sentence), max_tokens, count)
+                sentences.extend((piece.text, count(piece.text)) for piece in pieces)
+            elif tokens:
+                sentences.append((sentence, tokens))
+        if not sentences:
+            continue
+
+        # One more token per separator between sentences
+        paragraph_tokens = sum(tokens + 1 for _, tokens in sentences)
+        if window and fresh and window_tokens + paragraph_tokens > max_tokens and window_tokens * 2 >= max_tokens:
+            yield build()
+            window, window_tokens, fresh = deque(), 0, False
+
+        for position, (sentence, tokens) in enumerate(sentences):
+            if window and window_tokens + tokens + 1 > max_tokens:
+                yield build()
+                # Keep the trailing sentences that fit the overlap and still leave room for this one
+                kept: Deque[tuple] = deque()
+                kept_tokens = 0
+                for item in reversed(window):
+                    # kept_tokens includes the separator after each kept sentence
+                    if kept_tokens + item[1] > overlap_tokens or kept_tokens + item[1] + 1 + tokens > max_tokens:
+                        break
+                    kept.appendleft(item)
+                    kept_tokens += item[1] + 1
+                window, window_tokens, fresh = kept, max(kept_tokens - 1, 0), False
+
+            window.append((sentence, tokens, position == 0))
+            window_tokens += tokens + (1 if len(window) > 1 else 0)
+            fresh = True
+
+    if window and fresh:
+        yield build()
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from core.ai.metrics import LLM_IN_FLIGHT, LLM_QUEUE_WAIT, SINGLEFLIGHT_CALLS
+from core.config import config
+from core.exceptions import CustomException
+
+T = TypeVar("T")
+
+
+class AIBusyException(CustomException):
+    code = 503
+    error_code = "AI__BUSY"
+    message = "too many AI requests in progress, try again shortly"
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls onto one upstream call.
+
+    The first caller of a key starts the call; callers arriving while it is in flight
+    await the same result (or exception). A caller being cancelled does not cancel the
+    shared call for the others. Nothing is cached once the call finishes.
+    """
+
+    def __init__(self, name: str = "default"):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `call`, or join the in-flight call of the same key.
+
+        Args:
+            key: Identity of the call, e.g. (kind, course ID, normalized question)
+            call: Factory of the awaitable to run if no call with this key is in flight
+
+        Returns:
+            The result of the shared call
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            SINGLEFLIGHT_CALLS.labels(flight=self.name, result="coalesced").inc()
+            return await asyncio.shield(task)
+
+        SINGLEFLIGHT_CALLS.labels(flight=self.name, result="leader").inc()
+        task = asyncio.ensure_future(call())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Retrieve the exception even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+class ConcurrencyLimiter:
+    """
+    Global and per-course limits on concurrent upstream calls, with queueing.
+
+    A call first waits for a slot of its course, then for a global slot, so a burst on
+    one course queues behind its own limit instead of occupying the global slots other
+    courses need. Waiting longer than `queue_timeout` raises AIBusyException.
+    """
+
+    def __init__(self, *, global_limit: int = config.LLM_GLOBAL_CONCURRENCY,
+                 course_limit: int = config.LLM_COURSE_CONCURRENCY,
+                 queue_timeout: Optional[float] = config.LLM_QUEUE_TIMEOUT):
+        """
+        Initialize the limiter.
+
+        Args:
+            global_limit: Maximum concurrent calls in the process
+            course_limit: Maximum concurrent calls per course
+            queue_timeout: Maximum seconds to wait for a slot, or None to wait indefinitely
+        """
+        self.logger = logging.getLogger(__name__)
+        self.course_limit = course_limit
+        self.queue_timeout = queue_timeout
+        self._global = asyncio.Semaphore(global_limit)
+        self._courses: Dict[Hashable, asyncio.Semaphore] = {}
+        self._users: Dict[Hashable, int] = {}
+
+    @asynccontextmanager
+    async def slot(self, course_id: Optional[Hashable] = None, kind: str = "llm") -> AsyncIterator[None]:
+        """
+        Hold a concurrency slot for the duration of the block.
+
+        Args:
+            course_id: Course the call belongs to, or None for the global limit only
+            kind: Label of the call in the metrics
+        """
+        semaphores = [self._global] if course_id is None else [self._course(course_id), self._global]
+        acquired = []
+        started = time.perf_counter()
+        try:
+            try:
+                async with asyncio.timeout(self.queue_timeout):
+                    for semaphore in semaphores:
+                        await semaphore.acquire()
+                        acquired.append(semaphore)
+            except TimeoutError:
+                self.logger.warning(f"No {kind} slot for course {course_id} within {self.queue_timeout}s")
+                raise AIBusyException
+            LLM_QUEUE_WAIT.labels(kind=kind).observe(time.perf_counter() - started)
+
+            LLM_IN_FLIGHT.labels(kind=kind).inc()
+            try:
+                yield
+            finally:
+                LLM_IN_FLIGHT.labels(kind=kind).dec()
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+            if course_id is not None:
+                self._release_course(course_id)
+
+    async def run(self, course_id: Optional[Hashable], call: Callable[[], Awaitable[T]], kind: str = "llm") -> T:
+        """
+        Await `call()` while holding a slot.
+        """
+        async with self.slot(course_id, kind):
+            return await call()
+
+    def _course(self, course_id: Hashable) -> asyncio.Semaphore:
+        # Semaphores are kept only while a course has calls running or queued
+        self._users[course_id] = self._users.get(course_id, 0) + 1
+        if course_id not in self._courses:
+            self._courses[course_id] = asyncio.Semaphore(self.course_limit)
+        return self._courses[course_id]
+
+    def _release_course(self, course_id: Hashable) -> None:
+        self._users[course_id] -= 1
+        if not self._users[course_id]:
+            del self._users[course_id]
+            del self._courses[course_id]
+
+
+single_flight = SingleFlight(name="chat")
+llm_limiter = ConcurrencyLimiter()
+
+
+async def limited_call(key: Optional[Hashable], course_id: Optional[Hashable],
+                       call: Callable[[], Awaitable[T]], kind: str = "llm") -> T:
+    """
+    Run an upstream call under the concurrency limits, coalescing identical in-flight calls.
+
+    Args:
+        key: Singleflight key, or None to never coalesce
+        course_id: Course the call belongs to, or None for the global limit only
+        call: Factory of the awaitable making the upstream call
+        kind: Label of the call in the metrics
+
+    Returns:
+        The result of the call
+    """
+    if key is None:
+        return await llm_limiter.run(course_id, call, kind)
+    return await single_flight.do((kind, key), lambda: llm_limiter.run(course_id, call, kind))
@@ -0,0 +1,238 @@
+import hashlib
+import logging
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+
+from core.config import config
+from core.helpers.redis import async_binary_redis_client, sync_redis_client
+
+
+def pack_vector(vector: List[float]) -> bytes:
+    """
+    Encode a vector as raw float32 bytes (4 bytes per dimension).
+    """
+    return array("f", vector).tobytes()
+
+
+def unpack_vector(data: bytes) -> List[float]:
+    """
+    Decode raw float32 bytes produced by `pack_vector`.
+    """
+    vector = array("f")
+    vector.frombytes(data)
+    return vector.tolist()
+
+
+def embedding_namespace(model: str, dimensions: Optional[int] = None) -> str:
+    """
+    Cache namespace of an embedding space; vectors of different sizes never mix.
+    """
+    return f"{model}:{dimensions}" if dimensions else model
+
+
+class EmbeddingCache:
+    """
+    Two-tier, content-hash keyed cache for embedding vectors.
+
+    Lookups go to an in-process LRU first and to Redis second; Redis hits are promoted
+    into the LRU. Vectors are stored as float32 bytes in both tiers. The LRU evicts by
+    size and TTL, Redis entries expire by TTL. Redis failures degrade to cache misses.
+    The `a`-prefixed methods are the asyncio equivalents and share the in-process tier.
+    """
+
+    def __init__(self, *, namespace: str,
+                 max_entries: int = config.EMBEDDING_CACHE_SIZE,
+                 ttl: int = config.EMBEDDING_CACHE_TTL,
+                 redis: Optional[Redis] = sync_redis_client,
+                 async_redis: Optional[AsyncRedis] = async_binary_redis_client,
+                 key_prefix: str = "embedding"):
+        """
+        Initialize the cache.
+
+        Args:
+            namespace: Identifies the embedding space (model and settings); part of every key
+            max_entries: Maximum number of vectors kept in the in-process tier
+            ttl: Time to live in seconds for both tiers
+            redis: Synchronous Redis client for the shared tier, or None to disable it
+            async_redis: Asyncio Redis client for the shared tier, or None to disable it
+            key_prefix: Prefix for Redis keys
+        """
+        self.logger = logging.getLogger(__name__)
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.redis = redis
+        self.async_redis = async_redis
+        self.key_prefix = key_prefix
+        self._local: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(self, text: str) -> str:
+        """
+        Build the cache key for a text from the hash of its content.
+
+        Args:
+            text: The embedded text
+
+        Returns:
+            Redis/LRU key for the text
+        """
+        digest = hashlib.sha256(f"{self.namespace}\x00{text}".encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}:{digest}"
+
+    def get_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up cached vectors for several texts.
+
+        Args:
+            texts: The texts to look up
+
+        Returns:
+            One vector per text, or None where the text is not cached
+        """
+        keys = [self.make_key(text) for text in texts]
+        found = self._get_local(keys)
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing and self.redis is not None:
+            try:
+                self._promote(found, missing, self.redis.mget(missing))
+            except Exception as e:
+                self.logger.warning(f"Embedding cache read from Redis failed: {e}")
+
+        return [unpack_vector(found[key]) if key in found else None for key in keys]
+
+    async def aget_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Async variant of `get_many`.
+        """
+        keys = [self.make_key(text) for text in texts]
+        found = self._get_local(keys)
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing and self.async_redis is not None:
+            try:
+                self._promote(found, missing, await self.async_redis.mget(missing))
+            except Exception as e:
+                self.logger.warning(f"Embedding cache read from Redis failed: {e}")
+
+        return [unpack_vector(found[key]) if key in found else None for key in keys]
+
+    def set_many(self, texts: List[str], vectors: List[List[float]]) -> None:
+        """
+        Store vectors for several texts in both tiers.
+
+        Args:
+            texts: The embedded texts
+            vectors: The vectors, in the same order as the texts
+        """
+        packed = self._set_local(texts, vectors)
+
+        if self.redis is not None and packed:
+            try:
+                pipeline = self.redis.pipeline(transaction=False)
+                for key, data in packed.items():
+                    pipeline.set(name=key, value=data, ex=self.ttl)
+                pipeline.execute()
+            except Exception as e:
+                self.logger.warning(f"Embedding cache write to Redis failed: {e}")
+
+    async def aset_many(self, texts: List[str], vectors: List[List[float]]) -> None:
+        """
+        Async variant of `set_many`.
+        """
+        packed = self._set_local(texts, vectors)
+
+        if self.async_redis is not None and packed:
+            try:
+                pipeline = self.async_redis.pipeline(transaction=False)
+                for key, data in packed.items():
+                    pipeline.set(name=key, value=data, ex=self.ttl)
+                await pipeline.execute()
+            except Exception as e:
+                self.logger.warning(f"Embedding cache write to Redis failed: {e}")
+
+    def get_or_create(self, texts: List[str],
+                      embed: Callable[[List[str]], List[List[float]]]) -> List[List[float]]:
+        """
+        Return vectors for the texts, embedding only the ones not cached yet.
+
+        Duplicate texts are embedded once.
+
+        Args:
+            texts: The texts to embed
+            embed: Batch embedding function called with the uncached texts
+
+        Returns:
+            One vector per text, in input order
+        """
+        vectors = self.get_many(texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if not missing:
+            return vectors
+
+        created = dict(zip(missing, embed(missing)))
+        self.set_many(missing, [created[text] for text in missing])
+        return [vector if vector is not None else created[text] for text, vector in zip(texts, vectors)]
+
+    async def aget_or_create(self, texts: List[str],
+                             embed: Callable[[List[str]], Awaitable[List[List[float]]]]) -> List[List[float]]:
+        """
+        Async variant of `get_or_create`; `embed` is awaited.
+        """
+        vectors = await self.aget_many(texts)
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if not missing:
+            return vectors
+
+        created = dict(zip(missing, await embed(missing)))
+        await self.aset_many(missing, [created[text] for text in missing])
+        return [vector if vector is not None else created[text] for text, vector in zip(texts, vectors)]
+
+    def clear(self) -> None:
+        """
+        Drop every entry from the in-process tier.
+        """
+        with self._lock:
+            self._local.clear()
+
+    def _get_local(self, keys: List[str]) -> Dict[str, bytes]:
+        found: Dict[str, bytes] = {}
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                entry = self._local.get(key)
+                if entry is None:
+                    continue
+                expires_at, data = entry
+                if expires_at <= now:
+                    del self._local[key]
+                    continue
+                self._local.move_to_end(key)
+                found[key] = data
+        return found
+
+    def _promote(self, found: Dict[str, bytes], keys: List[str], values: List[Optional[bytes]]) -> None:
+        for key, data in zip(keys, values):
+            if data is not None:
+                found[key] = data
+                self._remember(key, data)
+
+    def _set_local(self, texts: List[str], vectors: List[List[float]]) -> Dict[str, bytes]:
+        packed = {self.make_key(text): pack_vector(vector) for text, vector in zip(texts, vectors)}
+        for key, data in packed.items():
+            self._remember(key, data)
+        return packed
+
+    def _remember(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.ttl, data)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
@@ -0,0 +1,232 @@
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from redis.asyncio import Redis as AsyncRedis
+
+from core.ai.concurrency import limited_call
+from core.ai.llm import llm_registry
+from core.ai.tokens import count_tokens, truncate_tokens
+from core.config import config
+from core.helpers.redis import redis_client
+
+SUMMARY_PROMPT = """
+Update the running summary of a conversation between a student and a course assistant.
+Keep names, facts, decisions and open questions; drop greetings and filler.
+Answer with the updated summary only, in at most {max_words} words.
+
+Current summary:
+{summary}
+
+New turns:
+{turns}
+"""
+
+Summarise = Callable[[str, List[str], int], Awaitable[str]]
+
+
+async def summarise_turns(summary: str, turns: List[str], max_tokens: int) -> str:
+    """
+    Fold conversation turns into a running summary with the summary LLM, under the
+    global LLM concurrency limit.
+    """
+    prompt = SUMMARY_PROMPT.format(
+        max_words=max(1, max_tokens * 3 // 4),
+        summary=summary or "(empty)",
+        turns="\n".join(turns),
+    )
+    res = await limited_call(None, None, lambda: llm_registry.chat("summary").ainvoke(prompt), kind="history")
+    return res.content.strip()
+
+
+def messages_digest(messages: List[str]) -> str:
+    return hashlib.sha256("\x1e".join(messages).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class HistoryWindow:
+    """
+    Conversation history that fits the prompt budget.
+
+    Attributes:
+        summary: Rolling summary of the older turns, empty if none were summarised yet
+        turns: Turns kept verbatim, oldest first; the last one is the current message
+        tokens: Token count of the rendered window
+        dropped: Number of older turns neither summarised yet nor kept verbatim
+    """
+    summary: str = ""
+    turns: List[str] = field(default_factory=list)
+    tokens: int = 0
+    dropped: int = 0
+
+    def render(self) -> str:
+        parts = [f"Summary of the earlier conversation: {self.summary}"] if self.summary else []
+        return "\n".join(parts + self.turns)
+
+
+class ConversationHistory:
+    """
+    Token-budgeted conversation history with a rolling summary per conversation.
+
+    The most recent turns are kept verbatim; older turns are covered by a summary cached
+    in Redis together with how many turns it covers. Folding newly aged-out turns into
+    the summary runs in the background, so the request path never waits for it: until
+    the refresh lands, aged-out turns are kept verbatim as far as the budget allows and
+    the oldest are dropped. The rendered window never exceeds the token budget of the
+    chat model, so prompt size stays flat however long the conversation gets.
+    """
+
+    def __init__(self, *, budget: int = config.CHAT_HISTORY_TOKEN_BUDGET,
+                 model_budgets: Optional[Dict[str, int]] = None,
+                 recent_turns: int = config.CHAT_HISTORY_RECENT_TURNS,
+                 summary_tokens: int = config.CHAT_HISTORY_SUMMARY_TOKENS,
+                 refresh_turns: int = config.CHAT_HISTORY_REFRESH_TURNS,
+                 ttl: int = config.CHAT_HISTORY_TTL,
+                 redis: Optional[AsyncRedis] = redis_client,
+                 summarise: Summarise = summarise_turns,
+                 key_prefix: str = "chat_history"):
+        """
+        Initialize the history manager.
+
+        Args:
+            budget: Maximum tokens of rendered history in a prompt, for models without their own
+            model_budgets: Budgets of specific chat models (defaults to CHAT_HISTORY_MODEL_TOKEN_BUDGETS)
+            recent_turns: Number of latest turns always kept verbatim when they fit
+            summary_tokens: Maximum tokens of the rolling summary
+            refresh_turns: Aged-out turns collected before they are folded into the summary
+            ttl: Time to live of a cached summary in seconds
+            redis: Asyncio Redis client (decoded responses) holding the summaries, or None
+            summarise: Async function folding turns into a summary
+            key_prefix: Prefix for Redis keys
+        """
+        self.logger = logging.getLogger(__name__)
+        self.budget = budget
+        self.model_budgets = config.CHAT_HISTORY_MODEL_TOKEN_BUDGETS if model_budgets is None else model_budgets
+        self.recent_turns = recent_turns
+        self.summary_tokens = summary_tokens
+        self.refresh_turns = refresh_turns
+        self.ttl = ttl
+        self.redis = redis
+        self.summarise = summarise
+        self.key_prefix = key_prefix
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def conversation_key(self, messages: List[str], conversation_id: Optional[str] = None) -> str:
+        """
+        Redis key of a conversation; without an ID the first message identifies it.
+        """
+        identity = conversation_id or messages_digest(messages[:1])
+        return f"{self.key_prefix}:{identity}"
+
+    async def _load(self, key: str, messages: List[str]) -> tuple:
+        """
+        Cached (summary, covered turn count), or ("", 0) if missing or for another history.
+        """
+        if self.redis is None:
+            return "", 0
+        try:
+            data = await self.redis.get(key)
+            if data is None:
+                return "", 0
+            state = json.loads(data)
+            covered = state["count"]
+            # The client may have edited or truncated the history since
+            if covered > len(messages) or messages_digest(messages[:covered]) != state["digest"]:
+                return "", 0
+            return state["summary"], covered
+        except Exception as e:
+            self.logger.warning(f"Failed to load conversation summary: {e}")
+            return "", 0
+
+    def budget_for(self, model: str) -> int:
+        """
+        Token budget of the history in prompts for a chat model.
+        """
+        return self.model_budgets.get(model, self.budget)
+
+    async def window(self, messages: List[str], conversation_id: Optional[str] = None,
+                     model: Optional[str] = None) -> HistoryWindow:
+        """
+        Select the history to put into the prompt.
+
+        Args:
+            messages: Conversation turns, oldest first; the last one is the current message
+            conversation_id: Optional client conversation ID
+            model: Chat model whose budget applies and whose tokenizer measures it
+                (defaults to LLM_CHAT_MODEL)
+
+        Returns:
+            The history window
+        """
+        if not messages:
+            return HistoryWindow()
+
+        model = model or config.LLM_CHAT_MODEL
+        budget = self.budget_for(model)
+
+        key = self.conversation_key(messages, conversation_id)
+        summary, covered = await self._load(key, messages)
+        covered = min(covered, len(messages) - 1)
+        summary = truncate_tokens(summary, self.summary_tokens, model)
+
+        # The current message is always kept, cut to the budget if it alone exceeds it
+        used = count_tokens(HistoryWindow(summary=summary).render(), model)
+        current = truncate_tokens(messages[-1], max(budget - used - 1, 1), model)
+        used += count_tokens(current, model) + 1
+        turns = [current]
+
+        # Then earlier turns newest first while they fit; those not yet summarised come last
+        aged_out = max(len(messages) - self.recent_turns, covered)
+        for index in range(len(messages) - 2, covered - 1, -1):
+            # One more token for the separating newline
+            tokens = count_tokens(messages[index], model) + 1
+            if used + tokens > budget:
+                break
+            turns.insert(0, messages[index])
+            used += tokens
+        dropped = len(messages) - covered - len(turns)
+
+        # Summaries are refreshed in batches of turns, or as soon as turns no longer fit
+        if aged_out - covered >= self.refresh_turns or (dropped and aged_out > covered):
+            self._schedule_refresh(key, summary, messages, covered, aged_out, model)
+        if dropped:
+            self.logger.info(f"History over budget: {dropped} turns awaiting summarisation were left out")
+        return HistoryWindow(summary=summary, turns=turns, tokens=used, dropped=dropped)
+
+    def _schedule_refresh(self, key: str, summary: str, messages: List[str], covered: int, upto: int,
+                          model: str) -> None:
+        if self.redis is None or key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, summary, messages[:upto], covered, model))
+        self._refreshing[key] = task
+        self._tasks.add(task)
+        task.add_done_callback(lambda done: (self._tasks.discard(done), self._refreshing.pop(key, None)))
+
+    async def _refresh(self, key: str, summary: str, messages: List[str], covered: int, model: str) -> None:
+        """
+        Fold messages[covered:] into the summary and cache it.
+        """
+        try:
+            updated = await self.summarise(summary, messages[covered:], self.summary_tokens)
+            state = {
+                "count": len(messages),
+                "digest": messages_digest(messages),
+                "summary": truncate_tokens(updated, self.summary_tokens, model),
+            }
+            await self.redis.set(key, json.dumps(state), ex=self.ttl)
+        except Exception as e:
+            self.logger.warning(f"Failed to refresh conversation summary: {e}")
+
+    async def drain(self) -> None:
+        """
+        Wait for summary refreshes in flight, e.g. before shutdown.
+        """
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+
+conversation_history = ConversationHistory()
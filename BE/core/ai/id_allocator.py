@@ -0,0 +1,93 @@
+import logging
+from typing import Callable
+
+from redis import Redis
+
+from core.ai.vector_store import NumpyVectorStore
+from core.helpers.redis import sync_redis_client
+
+
+class TranscriptIdAllocator:
+    """
+    Atomic, Redis-backed allocator for transcript IDs.
+
+    Each counter stores the next free ID. Reserving a block is a single INCRBY, so
+    allocation is constant time and safe across concurrent ingestion workers. A counter
+    that does not exist yet is seeded once from the vector store (SET NX), after which
+    the store is never scanned again. Redis errors are raised: handing out IDs from
+    anywhere else could overlap with the blocks other workers reserve.
+    """
+
+    def __init__(self, *, redis: Redis = sync_redis_client, key_prefix: str = "transcripts:next_id"):
+        """
+        Initialize the allocator.
+
+        Args:
+            redis: Synchronous Redis client holding the counters
+            key_prefix: Prefix for the counter keys
+        """
+        self.logger = logging.getLogger(__name__)
+        self.redis = redis
+        self.key_prefix = key_prefix
+
+    def reserve(self, name: str, count: int, seed: Callable[[], int]) -> range:
+        """
+        Reserve a block of consecutive IDs from a named counter.
+
+        Args:
+            name: Counter name, appended to the key prefix
+            count: Number of IDs to reserve
+            seed: Returns the next free ID; only called when the counter does not exist yet
+
+        Returns:
+            The reserved IDs
+        """
+        if count < 1:
+            return range(0)
+
+        key = f"{self.key_prefix}:{name}"
+        if not self.redis.exists(key):
+            start = seed()
+            if self.redis.set(key, start, nx=True):
+                self.logger.info(f"Seeded transcript ID counter '{key}' at {start}")
+
+        end = self.redis.incrby(key, count)
+        return range(end - count, end)
+
+    def reserve_transcript_ids(self, count: int, seed: Callable[[], int]) -> range:
+        """
+        Reserve global transcript IDs.
+        """
+        return self.reserve("global", count, seed)
+
+    def reserve_course_transcript_ids(self, course_id: int, count: int, seed: Callable[[], int]) -> range:
+        """
+        Reserve per-course transcript IDs.
+        """
+        return self.reserve(f"course:{course_id}", count, seed)
+
+
+class StoreIdAllocator(TranscriptIdAllocator):
+    """
+    Transcript ID allocator for the NumPy backend, without Redis.
+
+    The counters are kept by the store itself, next to its partitions and under the same
+    file lock, so every process sharing the store's path draws from the same counters.
+    """
+
+    def __init__(self, store: NumpyVectorStore, *, key_prefix: str = "transcripts:next_id"):
+        """
+        Initialize the allocator.
+
+        Args:
+            store: NumPy store holding the counters
+            key_prefix: Prefix for the counter names
+        """
+        self.logger = logging.getLogger(__name__)
+        self.store = store
+        self.key_prefix = key_prefix
+
+    def reserve(self, name: str, count: int, seed: Callable[[], int]) -> range:
+        if count < 1:
+            return range(0)
+        return self.store.reserve_ids(f"{self.key_prefix}:{name}", count, seed)
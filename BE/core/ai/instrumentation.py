@@ -0,0 +1,193 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+import httpx
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_openai import OpenAIEmbeddings
+
+from core.ai.metrics import AI_CALL_LATENCY, AI_CALLS, AI_COST, AI_RETRYABLE_RESPONSES, AI_TOKENS
+from core.ai.tokens import count_tokens
+
+logger = logging.getLogger(__name__)
+
+# Endpoint and course of the work currently calling OpenAI, used as metric labels
+ai_endpoint: ContextVar[str] = ContextVar("ai_endpoint", default="none")
+ai_course: ContextVar[str] = ContextVar("ai_course", default="none")
+
+# USD per million (prompt, completion) tokens
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+    "text-embedding-3-small": (0.02, 0.0),
+    "text-embedding-3-large": (0.13, 0.0),
+    "text-embedding-ada-002": (0.10, 0.0),
+}
+
+# Statuses the OpenAI client retries
+RETRYABLE_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+@contextmanager
+def ai_call_context(endpoint: str, course_id: Optional[Any] = None) -> Iterator[None]:
+    """
+    Label the OpenAI calls made inside the block with an endpoint and course.
+    """
+    tokens = [ai_endpoint.set(endpoint)]
+    if course_id is not None:
+        tokens.append(ai_course.set(str(course_id)))
+    try:
+        yield
+    finally:
+        for token in reversed(tokens):
+            try:
+                token.var.reset(token)
+            except ValueError:
+                # An async generator finalized from another context; that context is discarded anyway
+                pass
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+    """
+    Estimated USD cost of a call, or None for a model without a known price.
+    """
+    for name in sorted(MODEL_PRICES, key=len, reverse=True):
+        # Dated snapshots such as gpt-4o-mini-2024-07-18 use their base model's price
+        if model == name or model.startswith(f"{name}-"):
+            prompt_price, completion_price = MODEL_PRICES[name]
+            return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+    return None
+
+
+def record_call(kind: str, model: str, seconds: float, prompt_tokens: int = 0, completion_tokens: int = 0,
+                error: bool = False) -> None:
+    """
+    Record one OpenAI call under the current endpoint and course.
+
+    Args:
+        kind: Role of the call, e.g. chat, intent, summary or embedding
+        model: Model name
+        seconds: Call latency
+        prompt_tokens: Prompt (input) tokens
+        completion_tokens: Completion (output) tokens
+        error: Whether the call failed
+    """
+    endpoint, course = ai_endpoint.get(), ai_course.get()
+    AI_CALL_LATENCY.labels(kind=kind, model=model, endpoint=endpoint).observe(seconds)
+    AI_CALLS.labels(kind=kind, model=model, endpoint=endpoint, course=course,
+                    result="error" if error else "ok").inc()
+    if prompt_tokens:
+        AI_TOKENS.labels(kind=kind, model=model, endpoint=endpoint, course=course, type="prompt").inc(prompt_tokens)
+    if completion_tokens:
+        AI_TOKENS.labels(kind=kind, model=model, endpoint=endpoint, course=course,
+                         type="completion").inc(completion_tokens)
+    cost = estimate_cost(model, prompt_tokens, completion_tokens)
+    if cost:
+        AI_COST.labels(model=model, endpoint=endpoint, course=course).inc(cost)
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain callback recording latency, token usage, cost and errors of chat model calls.
+
+    The call's kind comes from the `ai_role` metadata set by the LLM registry.
+    """
+
+    # Cheap enough to run on the event loop instead of a worker thread
+    run_inline = True
+
+    def __init__(self):
+        self._runs: Dict[UUID, Tuple[float, str, str]] = {}
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *, run_id: UUID,
+                            metadata: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
+        self._start(run_id, metadata, kwargs)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID,
+                     metadata: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
+        self._start(run_id, metadata, kwargs)
+
+    def _start(self, run_id: UUID, metadata: Optional[Dict[str, Any]], kwargs: Dict[str, Any]) -> None:
+        params = kwargs.get("invocation_params") or {}
+        model = params.get("model") or params.get("model_name") or "unknown"
+        self._runs[run_id] = (time.perf_counter(), (metadata or {}).get("ai_role", "llm"), model)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        started, kind, model = run
+        prompt_tokens, completion_tokens = self._usage(response)
+        model = (response.llm_output or {}).get("model_name") or model
+        record_call(kind, model, time.perf_counter() - started, prompt_tokens, completion_tokens)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        started, kind, model = run
+        record_call(kind, model, time.perf_counter() - started, error=True)
+
+    @staticmethod
+    def _usage(response: LLMResult) -> Tuple[int, int]:
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    return usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        return usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+
+
+metrics_callback = MetricsCallbackHandler()
+
+
+class InstrumentedOpenAIEmbeddings(OpenAIEmbeddings):
+    """
+    OpenAIEmbeddings recording latency, tokens, cost and errors of every embedding request.
+
+    Token counts are computed locally with the model's tokenizer.
+    """
+
+    def _record(self, texts: List[str], started: float, error: bool = False) -> None:
+        tokens = 0 if error else sum(count_tokens(text, self.model) for text in texts)
+        record_call("embedding", self.model, time.perf_counter() - started, prompt_tokens=tokens, error=error)
+
+    def embed_documents(self, texts: List[str], chunk_size: Optional[int] = None) -> List[List[float]]:
+        started = time.perf_counter()
+        try:
+            embeddings = super().embed_documents(texts, chunk_size)
+        except Exception:
+            self._record(texts, started, error=True)
+            raise
+        self._record(texts, started)
+        return embeddings
+
+    async def aembed_documents(self, texts: List[str], chunk_size: Optional[int] = None) -> List[List[float]]:
+        started = time.perf_counter()
+        try:
+            embeddings = await super().aembed_documents(texts, chunk_size)
+        except Exception:
+            self._record(texts, started, error=True)
+            raise
+        self._record(texts, started)
+        return embeddings
+
+
+def record_response(response: httpx.Response) -> None:
+    """
+    httpx response hook counting responses the OpenAI client retries (rate limits, overload).
+    """
+    if response.status_code in RETRYABLE_STATUSES:
+        AI_RETRYABLE_RESPONSES.labels(endpoint=ai_endpoint.get(), status=str(response.status_code)).inc()
+
+
+async def arecord_response(response: httpx.Response) -> None:
+    record_response(response)
@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.ai.metrics import INTENT_CENTROID_SIMILARITY, INTENT_DECISIONS, INTENT_LATENCY
+from core.config import config
+
+INTENTS = ("summary", "course_question", "general_question")
+
+# Parts of a course a summary request can refer to
+COURSE_UNITS = r"(course|class|lectures?|lessons?|videos?|modules?|chapters?|sections?)"
+COURSE_REFERENCE = rf"(this|the|that|these|today'?s|last|previous|whole|entire)\s+(\w+\s+)?{COURSE_UNITS}"
+
+# Checked in order; a message matching a rule is classified without any network call.
+# The summary rule only takes requests to summarise the course itself: naming it, or a bare
+# "give me a summary" with nothing after it. Other mentions of summaries or key points
+# ("summary statistics", "a summary of how quicksort works") are left to the centroid and
+# LLM stages.
+KEYWORD_RULES: Sequence[Tuple[str, re.Pattern]] = (
+    ("summary", re.compile(
+        rf"\b(summari[sz]e|recap)\s+{COURSE_REFERENCE}\b"
+        rf"|\b(summary|recap|overview|key (points|takeaways)) of {COURSE_REFERENCE}\b"
+        r"|^\W*(please\s+)?(give|show|send|write) me an? (\w+ )?(summary|recap|overview|tl;?dr)(\s+please)?\W*$"
+        r"|^\W*(summary|recap|tl;?dr)\W*$",
+        re.I,
+    )),
+    ("general_question", re.compile(
+        r"^\W*(hi|hello|hey|thanks|thank you|thx|ok(ay)?|bye|good (morning|afternoon|evening))\W*$", re.I
+    )),
+    ("course_question", re.compile(
+        r"\b(this|the|current|last|previous|next) (course|lecture|lesson|module|video|chapter|section)\b"
+        r"|\b(instructor|professor|teacher) (said|says|mentioned|explained|showed)\b",
+        re.I,
+    )),
+)
+
+# Labelled examples whose embeddings form one centroid per intent
+INTENT_EXAMPLES: Dict[str, List[str]] = {
+    "summary": [
+        "Give me a short version of everything covered so far",
+        "What are the main ideas of this course in a few lines",
+        "Condense the lectures into bullet points",
+        "I missed the class, what did it cover overall",
+        "Briefly describe what the whole course is about",
+    ],
+    "course_question": [
+        "How does the algorithm explained in the video work",
+        "Why did we use a hash map in the example",
+        "Can you explain the formula from the slides again",
+        "What is the difference between the two approaches shown",
+        "I did not understand the part about gradient descent",
+        "Which function was used to sort the array",
+    ],
+    "general_question": [
+        "What is the capital of France",
+        "Tell me a joke",
+        "What's the weather like today",
+        "Who won the football world cup",
+        "Can you help me write an email to my friend",
+        "What time is it in Tokyo",
+    ],
+}
+
+Embed = Callable[[str], Awaitable[List[float]]]
+Classify = Callable[[str], Awaitable[str]]
+
+
+class IntentClassifier:
+    """
+    Local fast path in front of the LLM intent call.
+
+    Keyword rules decide obvious messages in microseconds. Otherwise the message
+    embedding (which the chat path needs anyway and the embedding cache shares) is
+    compared with one centroid per intent, built once per process from labelled
+    examples; a clear nearest centroid decides. Anything uncertain goes to the LLM.
+    """
+
+    def __init__(self, *, threshold: float = config.INTENT_CENTROID_THRESHOLD,
+                 margin: float = config.INTENT_CENTROID_MARGIN,
+                 examples: Optional[Dict[str, List[str]]] = None,
+                 rules: Sequence[Tuple[str, re.Pattern]] = KEYWORD_RULES):
+        """
+        Initialize the classifier.
+
+        Args:
+            threshold: Minimum cosine similarity to the nearest intent centroid
+            margin: Minimum similarity gap between the nearest and second nearest centroid
+            examples: Labelled example messages per intent, defaults to INTENT_EXAMPLES
+            rules: Ordered (intent, pattern) keyword rules
+        """
+        self.logger = logging.getLogger(__name__)
+        self.threshold = threshold
+        self.margin = margin
+        self.examples = examples or INTENT_EXAMPLES
+        self.rules = rules
+        self._labels: List[str] = []
+        self._centroids: Optional[np.ndarray] = None
+        self._lock = asyncio.Lock()
+
+    def match_rules(self, message: str) -> Optional[str]:
+        """
+        Intent of the first keyword rule matching the message, or None.
+        """
+        for intent, pattern in self.rules:
+            if pattern.search(message):
+                return intent
+        return None
+
+    async def _ensure_centroids(self, embed: Embed) -> np.ndarray:
+        if self._centroids is not None:
+            return self._centroids
+        async with self._lock:
+            if self._centroids is None:
+                labels, centroids = [], []
+                for intent, examples in self.examples.items():
+                    vectors = np.asarray(await asyncio.gather(*(embed(text) for text in examples)), dtype=np.float32)
+                    vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+                    centroid = vectors.mean(axis=0)
+                    labels.append(intent)
+                    centroids.append(centroid / max(float(np.linalg.norm(centroid)), 1e-12))
+                self._labels = labels
+                self._centroids = np.vstack(centroids)
+        return self._centroids
+
+    def nearest_centroid(self, vector: List[float]) -> Tuple[str, float, float]:
+        """
+        Nearest intent centroid as (intent, similarity, gap to the second nearest).
+        """
+        query = np.asarray(vector, dtype=np.float32)
+        similarities = self._centroids @ (query / max(float(np.linalg.norm(query)), 1e-12))
+        order = np.argsort(-similarities)
+        best = float(similarities[order[0]])
+        second = float(similarities[order[1]]) if len(order) > 1 else -1.0
+        return self._labels[order[0]], best, best - second
+
+    async def classify(self, message: str, embed: Optional[Embed], fallback: Classify) -> str:
+        """
+        Classify a user message as one of INTENTS.
+
+        Args:
+            message: The user message
+            embed: Async function embedding a text, or None to skip the centroid stage
+            fallback: Async LLM classifier used when the local stages are uncertain
+
+        Returns:
+            The intent
+        """
+        started = time.perf_counter()
+        intent = self.match_rules(message)
+        if intent is not None:
+            return self._decided("rule", intent, started)
+
+        if embed is not None:
+            try:
+                await self._ensure_centroids(embed)
+                intent, similarity, gap = self.nearest_centroid(await embed(message))
+                INTENT_CENTROID_SIMILARITY.observe(similarity)
+                if similarity >= self.threshold and gap >= self.margin:
+                    return self._decided("centroid", intent, started)
+            except Exception as e:
+                self.logger.warning(f"Intent fast path failed, falling back to the LLM: {e}")
+
+        intent = await fallback(message)
+        return self._decided("llm", intent, started)
+
+    def _decided(self, stage: str, intent: str, started: float) -> str:
+        INTENT_DECISIONS.labels(stage=stage, intent=intent).inc()
+        INTENT_LATENCY.labels(stage=stage).observe(time.perf_counter() - started)
+        self.logger.debug(f"Intent {intent} decided by {stage}")
+        return intent
+
+
+intent_classifier = IntentClassifier()
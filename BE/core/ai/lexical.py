@@ -0,0 +1,72 @@
+import math
+import re
+from collections import Counter
+from typing import Iterable, List, Set
+
+import numpy as np
+
+# Words, numbers and code identifiers such as snake_case, np.argmax or utf-8
+TOKEN_PATTERN = re.compile(r"[a-z0-9_]+(?:[.\-][a-z0-9_]+)*")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how i in is it of on or the this to was what "
+    "when where which who why will with you your me my we our explain tell about".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word and identifier tokens.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def query_terms(text: str) -> Set[str]:
+    """
+    Distinct content terms of a query, without stopwords.
+    """
+    return {token for token in tokenize(text) if token not in STOPWORDS}
+
+
+def term_coverage(terms: Set[str], text: str) -> float:
+    """
+    Fraction of the query terms that occur verbatim in the text.
+    """
+    if not terms:
+        return 0.0
+    return len(terms.intersection(tokenize(text))) / len(terms)
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a fixed list of documents.
+    """
+
+    def __init__(self, documents: Iterable[str], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.term_freqs = [Counter(tokenize(document)) for document in documents]
+        self.lengths = np.array([sum(freqs.values()) for freqs in self.term_freqs], dtype=np.float32)
+        self.avg_length = float(self.lengths.mean()) if len(self.lengths) else 0.0
+        self.doc_freq: Counter = Counter()
+        for freqs in self.term_freqs:
+            self.doc_freq.update(freqs.keys())
+
+    def scores(self, query: str) -> np.ndarray:
+        """
+        BM25 score of every document for the query, in document order.
+        """
+        scores = np.zeros(len(self.term_freqs), dtype=np.float32)
+        if not self.term_freqs or self.avg_length == 0:
+            return scores
+
+        count = len(self.term_freqs)
+        norm = self.k1 * (1 - self.b + self.b * self.lengths / self.avg_length)
+        for term in query_terms(query):
+            df = self.doc_freq.get(term)
+            if not df:
+                continue
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            tf = np.fromiter((freqs.get(term, 0) for freqs in self.term_freqs), dtype=np.float32, count=count)
+            scores += idf * tf * (self.k1 + 1) / (tf + norm)
+        return scores
@@ -0,0 +1,151 @@
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+import httpx
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+
+from core.ai.instrumentation import InstrumentedOpenAIEmbeddings, arecord_response, metrics_callback, record_response
+from core.config import config
+
+
+class LLMRegistry:
+    """
+    Process-level OpenAI chat and embedding clients for everything in `core/ai`.
+
+    Clients are created once per role (or embedding model and size) and share one
+    synchronous and one asyncio keep-alive HTTP connection pool, so requests reuse open
+    TLS connections instead of handshaking on every message. Timeouts and retries come
+    from the configuration. Every client is instrumented (see `core.ai.instrumentation`).
+    """
+
+    def __init__(self, *, api_key: Optional[str] = None, timeout: float = config.LLM_TIMEOUT,
+                 max_retries: int = config.LLM_MAX_RETRIES,
+                 max_connections: int = config.LLM_MAX_CONNECTIONS,
+                 max_keepalive_connections: int = config.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                 keepalive_expiry: float = config.LLM_KEEPALIVE_EXPIRY):
+        """
+        Initialize the registry; no client or connection is created until first use.
+
+        Args:
+            api_key: OpenAI API key, defaults to OPENAI_API_KEY
+            timeout: Request timeout in seconds
+            max_retries: Retries of failed or rate-limited requests, with exponential backoff
+            max_connections: Maximum open connections per HTTP pool
+            max_keepalive_connections: Maximum idle connections kept open per HTTP pool
+            keepalive_expiry: Seconds an idle connection is kept open
+        """
+        self.logger = logging.getLogger(__name__)
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http_client: Optional[httpx.Client] = None
+        self._async_http_client: Optional[httpx.AsyncClient] = None
+        self._chat_models: Dict[str, ChatOpenAI] = {}
+        self._embedding_models: Dict[Tuple[str, Optional[int]], OpenAIEmbeddings] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def models(self) -> Dict[str, str]:
+        """
+        Chat model per role.
+        """
+        return {
+            "chat": config.LLM_CHAT_MODEL,
+            "intent": config.LLM_INTENT_MODEL,
+            "summary": config.LLM_SUMMARY_MODEL,
+        }
+
+    def _http_clients(self) -> Tuple[httpx.Client, httpx.AsyncClient]:
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                limits=self.limits, timeout=self.timeout, event_hooks={"response": [record_response]}
+            )
+            self._async_http_client = httpx.AsyncClient(
+                limits=self.limits, timeout=self.timeout, event_hooks={"response": [arecord_response]}
+            )
+        return self._http_client, self._async_http_client
+
+    def chat(self, role: str = "chat") -> ChatOpenAI:
+        """
+        Shared chat model of a role.
+
+        Args:
+            role: "chat" (answers), "intent" (intent classification) or "summary" (summariser)
+
+        Returns:
+            The ChatOpenAI client of the role
+        """
+        model = self._chat_models.get(role)
+        if model is not None:
+            return model
+
+        with self._lock:
+            if role not in self._chat_models:
+                if role not in self.models:
+                    raise ValueError(f"Unknown LLM role: {role}")
+                http_client, async_http_client = self._http_clients()
+                self._chat_models[role] = ChatOpenAI(
+                    model=self.models[role],
+                    api_key=self.api_key or config.OPENAI_API_KEY,
+                    temperature=0,
+                    timeout=self.timeout,
+                    max_retries=self.max_retries,
+                    http_client=http_client,
+                    http_async_client=async_http_client,
+                    stream_usage=True,
+                    callbacks=[metrics_callback],
+                    metadata={"ai_role": role},
+                )
+                self.logger.info(f"Created {role} LLM client: {self.models[role]}")
+            return self._chat_models[role]
+
+    def embeddings(self, model: str = config.EMBEDDING_MODEL,
+                   dimensions: Optional[int] = config.EMBEDDING_DIMENSIONS) -> OpenAIEmbeddings:
+        """
+        Shared embedding model.
+
+        Args:
+            model: Embedding model name
+            dimensions: Optional reduced embedding size
+
+        Returns:
+            The OpenAIEmbeddings client
+        """
+        key = (model, dimensions)
+        embeddings = self._embedding_models.get(key)
+        if embeddings is not None:
+            return embeddings
+
+        with self._lock:
+            if key not in self._embedding_models:
+                http_client, async_http_client = self._http_clients()
+                self._embedding_models[key] = InstrumentedOpenAIEmbeddings(
+                    model=model,
+                    dimensions=dimensions,
+                    api_key=self.api_key or config.OPENAI_API_KEY,
+                    request_timeout=self.timeout,
+                    max_retries=self.max_retries,
+                    http_client=http_client,
+                    http_async_client=async_http_client,
+                )
+            return self._embedding_models[key]
+
+    async def aclose(self) -> None:
+        """
+        Close the shared connection pools at shutdown.
+        """
+        with self._lock:
+            http_client, async_http_client = self._http_client, self._async_http_client
+        if async_http_client is not None:
+            await async_http_client.aclose()
+        if http_client is not None:
+            http_client.close()
+
+
+llm_registry = LLMRegistry()
@@ -0,0 +1,104 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+SCORE_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.5)
+
+RETRIEVAL_LATENCY = Histogram(
+    "ai_retrieval_latency_seconds",
+    "Transcript retrieval latency by search mode and stage",
+    ["mode", "stage"],
+)
+RETRIEVAL_TOP_SCORE = Histogram(
+    "ai_retrieval_top_score",
+    "Score of the best transcript returned per query",
+    ["mode"],
+    buckets=SCORE_BUCKETS,
+)
+RETRIEVAL_SCORE_MARGIN = Histogram(
+    "ai_retrieval_score_margin",
+    "Score gap between the first and second transcript returned per query",
+    ["mode"],
+    buckets=(0.01, 0.02, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0),
+)
+RETRIEVAL_TERM_COVERAGE = Histogram(
+    "ai_retrieval_term_coverage",
+    "Fraction of query terms found verbatim in the best transcript returned",
+    ["mode"],
+    buckets=(0.0, 0.25, 0.5, 0.75, 1.0),
+)
+ANSWER_CACHE_REQUESTS = Counter(
+    "ai_answer_cache_requests_total",
+    "Semantic answer cache lookups by result (hit, miss or error)",
+    ["result"],
+)
+ANSWER_CACHE_SIMILARITY = Histogram(
+    "ai_answer_cache_best_similarity",
+    "Similarity of the closest cached question per lookup",
+    buckets=(0.5, 0.7, 0.8, 0.85, 0.9, 0.93, 0.95, 0.97, 0.99, 1.0),
+)
+SUMMARY_NODES = Counter(
+    "ai_summary_nodes_total",
+    "Summary tree nodes by result (cached or generated)",
+    ["result"],
+)
+INTENT_DECISIONS = Counter(
+    "ai_intent_decisions_total",
+    "Chat intent decisions by deciding stage (rule, centroid or llm) and intent",
+    ["stage", "intent"],
+)
+INTENT_LATENCY = Histogram(
+    "ai_intent_latency_seconds",
+    "Chat intent classification latency by deciding stage",
+    ["stage"],
+)
+INTENT_CENTROID_SIMILARITY = Histogram(
+    "ai_intent_centroid_similarity",
+    "Similarity of a message to its nearest intent centroid",
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+)
+CHAT_STAGE_LATENCY = Histogram(
+    "ai_chat_stage_latency_seconds",
+    "Course chat latency by pipeline stage",
+    ["stage"],
+)
+SINGLEFLIGHT_CALLS = Counter(
+    "ai_singleflight_calls_total",
+    "Coalescable upstream calls by whether they started the call (leader) or joined one in flight (coalesced)",
+    ["flight", "result"],
+)
+LLM_QUEUE_WAIT = Histogram(
+    "ai_upstream_queue_wait_seconds",
+    "Time upstream AI calls waited for a concurrency slot, by call kind",
+    ["kind"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+LLM_IN_FLIGHT = Gauge(
+    "ai_upstream_in_flight",
+    "Upstream AI calls currently holding a concurrency slot, by call kind",
+    ["kind"],
+)
+AI_CALL_LATENCY = Histogram(
+    "ai_openai_call_latency_seconds",
+    "Latency of OpenAI chat and embedding calls by kind, model and endpoint",
+    ["kind", "model", "endpoint"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0),
+)
+AI_CALLS = Counter(
+    "ai_openai_calls_total",
+    "OpenAI chat and embedding calls by kind, model, endpoint, course and result (ok or error)",
+    ["kind", "model", "endpoint", "course", "result"],
+)
+AI_TOKENS = Counter(
+    "ai_openai_tokens_total",
+    "OpenAI tokens by kind, model, endpoint, course and type (prompt or completion)",
+    ["kind", "model", "endpoint", "course", "type"],
+)
+AI_COST = Counter(
+    "ai_openai_cost_usd_total",
+    "Estimated OpenAI cost in USD by model, endpoint and course",
+    ["model", "endpoint", "course"],
+)
+AI_RETRYABLE_RESPONSES = Counter(
+    "ai_openai_retryable_responses_total",
+    "OpenAI responses the client retries (rate limited, overloaded or failed) by endpoint and status",
+    ["endpoint", "status"],
+)
@@ -1,245 +1,241 @@
+import asyncio
+import hashlib
+import logging
 import os
-from langchain_openai import ChatOpenAI
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
-
+from functools import lru_cache
+from typing import Callable, Iterator, List, Optional
+
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import Runnable
+from redis.asyncio import Redis as AsyncRedis
+
+from core.ai.chunker import chunk_text
+from core.ai.llm import llm_registry
+from core.ai.metrics import SUMMARY_NODES
+from core.ai.tokens import count_tokens, truncate_tokens
 from core.config import config
+from core.helpers.redis import redis_client
 
+logger = logging.getLogger(__name__)
 
-def create_course_summarizer():
-    """
-    Creates a function that summarizes course transcripts into key points.
+# Called with (completed chunks, total chunks) after every chunk summary
+ProgressCallback = Callable[[int, int], None]
 
-    Returns:
-        function: A function that takes a transcript and returns a summary of key points.
-    """
+SUMMARY_TEMPLATE = """
+You are an expert course notes creator. Your task is to extract the most important points from a course transcript.
 
-    # Create an instance of ChatOpenAI
-    llm = ChatOpenAI(
-        api_key=config.OPENAI_API_KEY,
-        model="gpt-4o-mini",  # You can use gpt-3.5-turbo for a cheaper but less capable option
-        temperature=0.0  # Lower temperature for more consistent, focused responses
-    )
+Please analyze the following transcript and produce:
+1. A concise list of the most important key points and concepts
+2. Any critical definitions or formulas mentioned
+3. The main learning objectives or takeaways
 
-    # Create a prompt template for summarization
-    summary_template = """
-    You are an expert course notes creator. Your task is to extract the most important points from a course transcript.
+Make sure to focus on substantive content and disregard introductory remarks, tangents, or filler content.
 
-    Please analyze the following transcript and produce:
-    1. A concise list of the most important key points and concepts
-    2. Any critical definitions or formulas mentioned
-    3. The main learning objectives or takeaways
+TRANSCRIPT:
+{transcript}
 
-    Make sure to focus on substantive content and disregard introductory remarks, tangents, or filler content.
+KEY POINTS SUMMARY:
+"""
 
-    TRANSCRIPT:
-    {transcript}
 
-    KEY POINTS SUMMARY:
+@lru_cache(maxsize=None)
+def summary_chain() -> Runnable:
+    """
+    The summarisation chain, built once per process on the shared summary LLM client.
     """
-
-    # Create the prompt with the template
     summary_prompt = PromptTemplate(
         input_variables=["transcript"],
-        template=summary_template
+        template=SUMMARY_TEMPLATE
     )
+    return summary_prompt | llm_registry.chat("summary") | StrOutputParser()
 
-    # Create the chain for summarization
-    summary_chain = LLMChain(llm=llm, prompt=summary_prompt)
-
-    def summarize_transcript(transcript, max_tokens=4000):
-        """
-        Summarizes a course transcript into key points.
-
-        Args:
-            transcript (str): The course transcript text.
-            max_tokens (int, optional): Maximum transcript length to process at once.
-                                       Longer transcripts will be split and processed in chunks.
-
-        Returns:
-            str: A summary of the key points from the transcript.
-        """
-        # If transcript is too long, process it in chunks
-        if len(transcript.split()) > max_tokens:
-            # Split into chunks (this is a simple split, you might want a more sophisticated approach)
-            chunks = split_into_chunks(transcript, max_tokens)
-
-            # Process each chunk
-            chunk_summaries = []
-            for i, chunk in enumerate(chunks):
-                print(f"Processing chunk {i + 1}/{len(chunks)}...")
-                chunk_summary = summary_chain.run(transcript=chunk)
-                chunk_summaries.append(chunk_summary)
-
-            # Combine chunk summaries for a final summary
-            combined_summary = "\n\n".join(chunk_summaries)
-
-            # If combined summary is still too long, summarize it again
-            if len(combined_summary.split()) > max_tokens:
-                final_summary = summary_chain.run(transcript=combined_summary)
-                return final_summary
-            return combined_summary
-        else:
-            # Process the entire transcript at once
-            return summary_chain.run(transcript=transcript)
-
-    def split_into_chunks(text, max_tokens):
-        """Split text into chunks of approximately max_tokens."""
-        words = text.split()
-        chunks = []
-        current_chunk = []
-
-        for word in words:
-            current_chunk.append(word)
-            if len(current_chunk) >= max_tokens:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = []
-
-        # Add the last chunk if there's anything left
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
-
-        return chunks
-
-    return summarize_transcript
-
-
-# Example usage
-if __name__ == "__main__":
-    # Create the summarizer function
-    summarize = create_course_summarizer()
-
-    # Example transcript (replace with an actual transcript)
-    sample_transcript = """
-    Welcome to our course on Machine Learning Fundamentals. Today we'll cover supervised learning...
-    Python Programming Course Transcript
-
-Introduction:
-
-Welcome to the Python Programming Course! In this session, we'll cover the foundational aspects of Python, which is a powerful, easy-to-learn programming language known for its readability and efficiency. By the end of this session, you'll understand Python syntax, control flow, data structures, and basic object-oriented programming.
-
-1. Setting Up Python:
-
-To get started, you'll need Python installed on your system. You can download it from python.org. It's recommended to use Python 3.x as Python 2.x is no longer supported.
-
-You can verify the installation by running:
-
-python --version
-
-If you get a version number, you're good to go!
-
-2. Python Basics:
-
-Hello World:
-
-Let's write your first Python program:
-
-print("Hello, World!")
-
-When you run this code, it simply outputs:
-
-Hello, World!
-
-Variables and Data Types:
-
-In Python, variables are dynamically typed, meaning you don't need to explicitly declare their type:
 
-x = 10          # Integer
-y = 3.14        # Float
-name = "Alice"  # String
-is_active = True  # Boolean
-
-You can use the type() function to check the type of a variable:
-
-print(type(x))  # Output: <class 'int'>
-
-3. Control Flow:
-
-Python supports standard control flow operations:
-
-If-Else Statements:
-
-age = 18
-if age >= 18:
-    print("You are an adult.")
-else:
-    print("You are not an adult.")
-
-Loops:
-
-For Loop:
-
-for i in range(5):
-    print(i)
-
-While Loop:
-
-count = 0
-while count < 5:
-    print(count)
-    count += 1
-
-4. Data Structures:
-
-Lists:
-
-Lists are ordered and mutable collections:
-
-fruits = ['apple', 'banana', 'cherry']
-fruits.append('orange')
-print(fruits)
-
-Dictionaries:
+def summary_tokens(text: str) -> int:
+    """
+    Token count of a text for the summary model.
+    """
+    return count_tokens(text, config.LLM_SUMMARY_MODEL)
 
-Dictionaries are key-value pairs:
 
-person = {'name': 'John', 'age': 30}
-print(person['name'])
+def split_into_chunks(text: str, max_tokens: int,
+                      overlap_tokens: int = config.SUMMARY_CHUNK_OVERLAP_TOKENS) -> Iterator[str]:
+    """
+    Split text into chunks of at most max_tokens summary-model tokens.
 
-Sets:
+    Chunks end on sentence or paragraph boundaries and overlap by up to `overlap_tokens`
+    tokens (see `core.ai.chunker.chunk_text`); they are produced lazily.
+    """
+    return chunk_text([text], max_tokens, min(overlap_tokens, max_tokens - 1), count=summary_tokens)
 
-Sets are unordered collections of unique elements:
 
-unique_numbers = {1, 2, 3, 3, 4}
-print(unique_numbers)  # Output: {1, 2, 3, 4}
+class SummaryTree:
+    """
+    Hierarchical summariser with a content-addressed cache of every node.
+
+    Each section (e.g. one course content) is split into token-bounded chunks, the
+    leaves. Leaf summaries are reduced recursively: consecutive summaries are grouped
+    `fan_in` at a time and each group is summarised into a parent, until their
+    combination fits in `max_tokens`; after `max_depth` levels the result is truncated,
+    so the output always fits. Sections are reduced on their own first, so group
+    boundaries of one section do not depend on the others.
+
+    Every node's summary is cached in Redis under the hash of its input (and of the
+    model and prompt), so editing one section only calls the LLM for that section's
+    changed leaves and the nodes above them; everything else is a cache hit.
+    """
 
-5. Functions:
+    def __init__(self, *, max_tokens: int = config.SUMMARY_CHUNK_TOKENS,
+                 overlap_tokens: int = config.SUMMARY_CHUNK_OVERLAP_TOKENS,
+                 fan_in: int = config.SUMMARY_TREE_FAN_IN,
+                 max_depth: int = config.SUMMARY_TREE_MAX_DEPTH,
+                 max_concurrency: int = config.SUMMARY_MAX_CONCURRENCY,
+                 ttl: int = config.SUMMARY_CACHE_TTL,
+                 redis: Optional[AsyncRedis] = redis_client,
+                 key_prefix: str = "summary_node"):
+        """
+        Initialize the summariser.
 
-Functions in Python allow for code reusability:
+        Args:
+            max_tokens: Maximum tokens of a leaf chunk, and of the final summary
+            overlap_tokens: Maximum tokens repeated between consecutive leaf chunks
+            fan_in: Maximum number of summaries reduced into one parent
+            max_depth: Maximum reduce levels; a summary still too long is then truncated
+            max_concurrency: Maximum LLM calls in flight at once per summarisation
+            ttl: Time to live of a cached node summary in seconds
+            redis: Asyncio Redis client (decoded responses) caching node summaries, or None
+            key_prefix: Prefix for Redis keys
+        """
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2")
+        self.logger = logging.getLogger(__name__)
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.fan_in = fan_in
+        self.max_depth = max_depth
+        self.max_concurrency = max_concurrency
+        self.ttl = ttl
+        self.redis = redis
+        self.key_prefix = key_prefix
+
+    def node_key(self, text: str) -> str:
+        """
+        Redis key of the summary of a node's input text.
+        """
+        digest = hashlib.sha256()
+        for part in (config.LLM_SUMMARY_MODEL, SUMMARY_TEMPLATE, text):
+            data = part.encode("utf-8")
+            digest.update(len(data).to_bytes(8, "big") + data)
+        return f"{self.key_prefix}:{digest.hexdigest()}"
+
+    async def _cached(self, key: str) -> Optional[str]:
+        if self.redis is None:
+            return None
+        try:
+            return await self.redis.get(key)
+        except Exception as e:
+            self.logger.warning(f"Failed to load cached summary: {e}")
+            return None
+
+    async def _store(self, key: str, summary: str) -> None:
+        if self.redis is None:
+            return
+        try:
+            await self.redis.set(key, summary, ex=self.ttl)
+        except Exception as e:
+            self.logger.warning(f"Failed to cache summary: {e}")
+
+    async def summarise_node(self, text: str, semaphore: asyncio.Semaphore) -> str:
+        """
+        Summary of one node's input, from the cache or the LLM.
+        """
+        key = self.node_key(text)
+        summary = await self._cached(key)
+        if summary is not None:
+            SUMMARY_NODES.labels(result="cached").inc()
+            return summary
+
+        async with semaphore:
+            summary = await summary_chain().ainvoke({"transcript": text})
+        SUMMARY_NODES.labels(result="generated").inc()
+        await self._store(key, summary)
+        return summary
+
+    async def _summarise_group(self, group: List[str], semaphore: asyncio.Semaphore) -> str:
+        # A lone summary that already fits moves up a level unchanged
+        if len(group) == 1 and summary_tokens(group[0]) <= self.max_tokens:
+            return group[0]
+        return await self.summarise_node("\n\n".join(group), semaphore)
+
+    async def reduce(self, summaries: List[str], semaphore: asyncio.Semaphore) -> str:
+        """
+        Reduce summaries level by level until their combination fits the budget.
 
-def greet(name):
-    return f"Hello, {name}!"
+        Args:
+            summaries: Summaries in document order
+            semaphore: Bound on concurrent LLM calls
 
-print(greet('Alice'))
+        Returns:
+            A summary of at most `max_tokens` tokens
+        """
+        for depth in range(self.max_depth + 1):
+            combined = "\n\n".join(summaries)
+            if summary_tokens(combined) <= self.max_tokens:
+                return combined
+            if depth == self.max_depth:
+                break
+            groups = [summaries[start:start + self.fan_in] for start in range(0, len(summaries), self.fan_in)]
+            summaries = await asyncio.gather(*(self._summarise_group(group, semaphore) for group in groups))
+
+        self.logger.warning(f"Summary still over {self.max_tokens} tokens after {self.max_depth} levels, truncating")
+        return truncate_tokens(combined, self.max_tokens, config.LLM_SUMMARY_MODEL)
+
+    async def summarise(self, sections: List[str], on_progress: Optional[ProgressCallback] = None) -> str:
+        """
+        Summarise sections into one summary within the token budget.
 
-You can also have default arguments:
+        Args:
+            sections: Section texts in order, e.g. the transcripts of a course's contents
+            on_progress: Called with (completed, total) after every leaf chunk
 
-def add(x, y=10):
-    return x + y
+        Returns:
+            The summary
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        chunks = [list(split_into_chunks(section, self.max_tokens, self.overlap_tokens)) for section in sections]
+        chunks = [section_chunks for section_chunks in chunks if section_chunks]
+        total = sum(len(section_chunks) for section_chunks in chunks)
+        completed = 0
 
-print(add(5))  # Output: 15
+        async def summarise_leaf(chunk: str) -> str:
+            nonlocal completed
+            summary = await self.summarise_node(chunk, semaphore)
+            completed += 1
+            if on_progress is not None:
+                on_progress(completed, total)
+            return summary
 
-6. Object-Oriented Programming:
+        async def summarise_section(section_chunks: List[str]) -> str:
+            leaves = await asyncio.gather(*(summarise_leaf(chunk) for chunk in section_chunks))
+            return await self.reduce(leaves, semaphore)
 
-Python supports OOP principles like inheritance, polymorphism, and encapsulation.
+        section_summaries = await asyncio.gather(*(summarise_section(section_chunks) for section_chunks in chunks))
+        return await self.reduce(section_summaries, semaphore)
 
-class Animal:
-    def __init__(self, name):
-        self.name = name
 
-    def speak(self):
-        print(f"{self.name} makes a sound")
+summary_tree = SummaryTree()
 
-cat = Animal("Cat")
-cat.speak()
 
-Conclusion:
+async def asummarize_transcript(transcript: str, on_progress: Optional[ProgressCallback] = None) -> str:
+    """
+    Summarise a transcript with the hierarchical summariser.
 
-We covered the basics of Python, including syntax, control flow, data structures, functions, and OOP. Next, we'll dive deeper into modules, error handling, and advanced data manipulation.
+    Args:
+        transcript: The course transcript text
+        on_progress: Called with (completed, total) after every chunk
 
-Thank you for attending this session, and happy coding!
+    Returns:
+        A summary of the key points from the transcript, within SUMMARY_CHUNK_TOKENS tokens
     """
+    return await summary_tree.summarise([transcript], on_progress)
 
-    # Get the summary
-    summary = summarize(sample_transcript)
-    print(summary)
\ No newline at end of file
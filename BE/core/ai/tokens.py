@@ -0,0 +1,77 @@
+import logging
+import math
+from functools import lru_cache
+from typing import Optional
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+# Encoding used when a model name is unknown to tiktoken
+DEFAULT_ENCODING = "cl100k_base"
+
+# Rough characters per token for English text, used when no encoding can be loaded
+CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> Optional[tiktoken.Encoding]:
+    """
+    Load the tiktoken encoding of a model.
+
+    Args:
+        model: OpenAI model name
+
+    Returns:
+        The encoding, or None when it cannot be loaded (e.g. the BPE file is not cached offline)
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(f"Could not load tokenizer for {model}, estimating token counts instead: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str = "text-embedding-3-small") -> int:
+    """
+    Count the tokens of a text for a model.
+
+    Args:
+        text: The text to measure
+        model: OpenAI model name whose tokenizer is used
+
+    Returns:
+        Number of tokens, estimated from the text length if the tokenizer is unavailable
+    """
+    if not text:
+        return 0
+    encoding = get_encoding(model)
+    if encoding is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int, model: str = "text-embedding-3-small") -> str:
+    """
+    Cut a text to at most `max_tokens` tokens of a model, keeping its beginning.
+
+    Args:
+        text: The text to shorten
+        max_tokens: Maximum number of tokens to keep
+        model: OpenAI model name whose tokenizer is used
+
+    Returns:
+        The text itself if it fits, otherwise its longest prefix that does
+    """
+    if max_tokens <= 0:
+        return ""
+    encoding = get_encoding(model)
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
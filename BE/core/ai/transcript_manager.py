@@ -1,74 +1,330 @@
 import logging
-from typing import Dict, List, Any, Optional, Union
-import weaviate
-from weaviate import Client
-from weaviate.classes.query import Filter
-from weaviate.auth import Auth
-from weaviate.classes.config import Configure, Property, DataType
-from langchain_openai import OpenAIEmbeddings
-import weaviate.classes.query as wq
-
+import os
+import threading
+import time
+import uuid as uuid_lib
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, List, Any, Optional, Union, Iterable, Iterator
+from weaviate.classes.config import DataType
+
+from core.ai.answer_cache import answer_cache
+from core.ai.chunker import TranscriptChunk
+from core.ai.embedding_cache import EmbeddingCache, embedding_namespace
+from core.ai.id_allocator import StoreIdAllocator, TranscriptIdAllocator
+from core.ai.lexical import query_terms, term_coverage
+from core.ai.llm import llm_registry
+from core.ai.metrics import RETRIEVAL_LATENCY, RETRIEVAL_SCORE_MARGIN, RETRIEVAL_TERM_COVERAGE, RETRIEVAL_TOP_SCORE
+from core.ai.vector_store import NumpyVectorStore, VectorObject, VectorStore, WeaviateVectorStore
 from core.config import config
 
-# Headers for OpenAI integration with Weaviate
-headers = {
-    "X-OpenAI-Api-Key": config.OPENAI_API_KEY,
-}
+# Property schema of the transcript collection
+TRANSCRIPT_PROPERTIES = [
+    {
+        "name": "course_id",
+        "data_type": DataType.INT,
+        "description": "The ID of the course",
+    },
+    {
+        "name": "course_transcript_id",
+        "data_type": DataType.INT,
+        "description": "The ID of the transcript within the course (0 to n)",
+    },
+    {
+        "name": "transcript_id",  # Renamed from 'id' as it's a reserved name
+        "data_type": DataType.INT,
+        "description": "Global continuous ID for the transcript",
+    },
+    {
+        "name": "text",
+        "data_type": DataType.TEXT,
+        "description": "The content of the transcript",
+    },
+    {
+        "name": "start_time",
+        "data_type": DataType.INT,
+        "description": "Start time of the transcript in seconds",
+    },
+    {
+        "name": "end_time",
+        "data_type": DataType.INT,
+        "description": "End time of the transcript in seconds",
+    },
+    {
+        "name": "content_hash",
+        "data_type": DataType.TEXT,
+        "description": "Hash of the chunk text, used for incremental reindexing",
+    },
+]
+
+
+@dataclass
+class TranscriptSegment:
+    """
+    A single transcript segment to be ingested through the bulk API.
+    """
+    course_id: int
+    text: str
+    start_time: Optional[int] = None
+    end_time: Optional[int] = None
+    transcript_id: Optional[int] = None
+    course_transcript_id: Optional[int] = None
+    content_hash: Optional[str] = None
+
+
+@dataclass
+class BulkInsertResult:
+    """
+    Outcome of a bulk ingestion run.
+
+    `created` holds the stored transcript data (with UUID) in input order, and
+    `errors` holds one entry per failed segment with its input index and message.
+    """
+    created: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class BulkUpdateResult:
+    """
+    Outcome of a bulk update.
+
+    `updated` counts stored transcripts, `reembedded` how many of them got a new vector
+    because their text changed, `missing` lists transcript IDs that do not exist and
+    `errors` holds one entry per failed transcript ID with its message.
+    """
+    updated: int = 0
+    reembedded: int = 0
+    missing: List[int] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class TranscriptRecord:
+    """
+    Lightweight view of a stored transcript yielded by `iter_transcripts`.
+
+    `text` and `vector` are None unless they were requested.
+    """
+    uuid: str
+    course_id: int
+    course_transcript_id: int
+    transcript_id: int
+    start_time: int = 0
+    end_time: int = 0
+    content_hash: str = ""
+    text: Optional[str] = None
+    vector: Optional[List[float]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Transcript data in the shape returned by the other read methods.
+        """
+        data = {
+            "uuid": self.uuid,
+            "course_id": self.course_id,
+            "course_transcript_id": self.course_transcript_id,
+            "transcript_id": self.transcript_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "content_hash": self.content_hash,
+        }
+        if self.text is not None:
+            data["text"] = self.text
+        return data
+
+
+@dataclass
+class SyncResult:
+    """
+    Outcome of an incremental course reindex.
+
+    `created` and `errors` come from inserting the new or changed chunks (error indices
+    count only those chunks), `unchanged` is the number of chunks that were already
+    stored, `retimed` how many of those only got a new time range and `deleted` the
+    number of stale transcripts removed.
+    """
+    created: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    unchanged: int = 0
+    retimed: int = 0
+    deleted: int = 0
+
+
+@dataclass
+class RetrievalReport:
+    """
+    Quality and latency figures of a single retrieval query.
+
+    `timings` holds seconds per stage (embed, search, rerank, total). `top_score` and
+    `margin` describe the best result and its lead over the runner-up, and `term_coverage`
+    is the fraction of query terms found verbatim in the best result.
+    """
+    mode: str
+    candidates: int
+    returned: int
+    timings: Dict[str, float] = field(default_factory=dict)
+    top_score: Optional[float] = None
+    margin: Optional[float] = None
+    term_coverage: Optional[float] = None
+
+    def record(self) -> None:
+        """
+        Export the report to the retrieval metrics.
+        """
+        for stage, seconds in self.timings.items():
+            RETRIEVAL_LATENCY.labels(mode=self.mode, stage=stage).observe(seconds)
+        if self.top_score is not None:
+            RETRIEVAL_TOP_SCORE.labels(mode=self.mode).observe(self.top_score)
+        if self.margin is not None:
+            RETRIEVAL_SCORE_MARGIN.labels(mode=self.mode).observe(self.margin)
+        if self.term_coverage is not None:
+            RETRIEVAL_TERM_COVERAGE.labels(mode=self.mode).observe(self.term_coverage)
+
+
+# NumPy stores of this process by path (or collection when in memory), so the sync and
+# async managers share one instance instead of overwriting each other's partitions, with
+# the number of users of each
+_numpy_stores: Dict[str, NumpyVectorStore] = {}
+_numpy_store_users: Dict[str, int] = {}
+_numpy_stores_lock = threading.Lock()
+
+
+def create_numpy_store(collection_name: str) -> NumpyVectorStore:
+    """
+    Get the process-wide in-process store for a collection, created from the
+    VECTOR_STORE_* settings on first use.
+
+    Every call must be paired with one `release_numpy_store` call rather than closing the
+    store, which other users may still hold.
+    """
+    path = os.path.join(config.VECTOR_STORE_PATH, collection_name) if config.VECTOR_STORE_PATH else None
+    registry_key = os.path.abspath(path) if path else f":memory:{collection_name}"
+    with _numpy_stores_lock:
+        store = _numpy_stores.get(registry_key)
+        if store is None:
+            store = _numpy_stores[registry_key] = NumpyVectorStore(
+                path=path,
+                quantization=config.VECTOR_STORE_QUANTIZATION,
+                pq_subspaces=config.VECTOR_STORE_PQ_SUBSPACES,
+                rerank_factor=config.VECTOR_STORE_RERANK_FACTOR,
+                retrain_writes=config.VECTOR_STORE_RETRAIN_WRITES,
+                dimensions=config.EMBEDDING_DIMENSIONS,
+            )
+        _numpy_store_users[registry_key] = _numpy_store_users.get(registry_key, 0) + 1
+        return store
+
+
+def release_numpy_store(store: NumpyVectorStore) -> None:
+    """
+    Release a store from `create_numpy_store`, closing it once its last user is gone.
+
+    Stores created outside the registry are closed right away; a store still in use
+    elsewhere is only flushed.
+    """
+    with _numpy_stores_lock:
+        registry_key = next((key for key, shared in _numpy_stores.items() if shared is store), None)
+        if registry_key is not None:
+            _numpy_store_users[registry_key] -= 1
+            if _numpy_store_users[registry_key] > 0:
+                store.flush()
+                return
+            del _numpy_stores[registry_key], _numpy_store_users[registry_key]
+    store.close()
+
+
+def rerank(query_text: str, candidates: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """
+    Cheaply rerank hybrid search candidates and keep the best `limit`.
+
+    Each candidate's score gets a bonus of RETRIEVAL_RERANK_WEIGHT times the share of
+    query terms its text contains verbatim; `term_coverage` is added to each candidate.
+    Candidates are sorted in place.
+    """
+    terms = query_terms(query_text)
+    for candidate in candidates:
+        coverage = term_coverage(terms, candidate.get("text") or "")
+        candidate["term_coverage"] = round(coverage, 4)
+        candidate["score"] = round(candidate["score"] + config.RETRIEVAL_RERANK_WEIGHT * coverage, 4)
+    candidates.sort(key=lambda candidate: candidate["score"], reverse=True)
+    return candidates[:limit]
+
+
+def report_retrieval(logger: logging.Logger, mode: str, query_text: str, candidates: List[Dict[str, Any]],
+                     results: List[Dict[str, Any]], score_key: str, **timings: float) -> RetrievalReport:
+    """
+    Build, log and record the retrieval report of a query.
+    """
+    report = RetrievalReport(mode=mode, candidates=len(candidates), returned=len(results), timings=timings)
+    if results:
+        report.top_score = results[0][score_key]
+        report.term_coverage = term_coverage(query_terms(query_text), results[0].get("text") or "")
+    if len(results) > 1:
+        report.margin = round(results[0][score_key] - results[1][score_key], 4)
+
+    logger.info(
+        f"Retrieval mode={mode} candidates={report.candidates} returned={report.returned} "
+        f"top_score={report.top_score} margin={report.margin} coverage={report.term_coverage} "
+        + " ".join(f"{stage}_ms={seconds * 1000:.1f}" for stage, seconds in timings.items())
+    )
+    report.record()
+    return report
 
 
 class TranscriptManager:
     """
-    Class to manage course transcripts in a Weaviate vector database.
-    It handles the creation of schema, and provides CRUD operations for transcripts.
+    Class to manage course transcripts in a vector store.
+    It embeds transcript text and provides CRUD operations for transcripts on top of
+    a VectorStore backend (Weaviate by default, or the in-process NumPy store).
     """
 
-    def __init__(self, weaviate_url: str, collection_name: str = "Transcripts"):
+    def __init__(self, weaviate_url: Optional[str] = None, collection_name: str = "Transcripts",
+                 id_allocator: Optional[TranscriptIdAllocator] = None,
+                 store: Optional[VectorStore] = None):
         """
-        Initialize TranscriptManager with connection to Weaviate.
+        Initialize TranscriptManager with its vector store.
 
         Args:
-            weaviate_url: URL to the Weaviate instance
+            weaviate_url: URL to the Weaviate instance (used by the Weaviate backend)
             collection_name: Name of the collection to store transcripts
+            id_allocator: Allocator for transcript IDs (defaults to the Redis-backed one, or
+                counters kept by the store with the NumPy backend)
+            store: Vector store to use (defaults to the backend selected by VECTOR_STORE_BACKEND)
         """
         self.logger = logging.getLogger(__name__)
         self.collection_name = collection_name
-        self.client = None
-        self.collection = None
 
-        # Connect to the Weaviate instance
-        self._connect_to_weaviate(weaviate_url)
+        # Connect to the vector store
+        self.store = store or self._create_store(weaviate_url)
+
+        key_prefix = f"{collection_name.lower()}:next_id"
+        if id_allocator is None and isinstance(self.store, NumpyVectorStore):
+            id_allocator = StoreIdAllocator(self.store, key_prefix=key_prefix)
+        self.id_allocator = id_allocator or TranscriptIdAllocator(key_prefix=key_prefix)
 
         # Initialize the embedding model
         self._initialize_embedding_model()
 
-        # Ensure the schema exists
-        self._ensure_schema_exists()
-
-    def _connect_to_weaviate(self, weaviate_url: str) -> None:
+    def _create_store(self, weaviate_url: Optional[str]) -> VectorStore:
         """
-        Connect to Weaviate and verify the connection.
+        Create the vector store selected by configuration.
 
         Args:
             weaviate_url: URL to the Weaviate instance
 
-        Raises:
-            Exception: If connection fails
+        Returns:
+            The configured VectorStore
         """
-        try:
-            self.client = weaviate.connect_to_weaviate_cloud(
-                cluster_url=weaviate_url,
-                auth_credentials=Auth.api_key(config.WEAVIATE_API_KEY),
-                headers=headers,
-            )
+        if config.VECTOR_STORE_BACKEND == "numpy":
+            return create_numpy_store(self.collection_name)
 
-            # Verify connection by checking if the client is alive
-            if not self.client.is_ready():
-                raise ConnectionError("Weaviate server is not ready")
-
-            self.logger.info(f"Successfully connected to Weaviate at {weaviate_url}")
-        except Exception as e:
-            self.logger.error(f"Failed to connect to Weaviate: {e}")
-            raise
+        return WeaviateVectorStore(
+            weaviate_url or config.WEAVIATE_URL,
+            collection_name=self.collection_name,
+            properties=TRANSCRIPT_PROPERTIES,
+        )
 
     def _initialize_embedding_model(self) -> None:
         """
@@ -78,92 +334,53 @@ class TranscriptManager:
             Exception: If initialization fails
         """
         try:
-            self.embedding_model = OpenAIEmbeddings(
-                model="text-embedding-3-small",
-                api_key=config.OPENAI_API_KEY,
+            self.embedding_model = llm_registry.embeddings(config.EMBEDDING_MODEL, config.EMBEDDING_DIMENSIONS)
+            self.embedding_cache = EmbeddingCache(
+                namespace=embedding_namespace(config.EMBEDDING_MODEL, config.EMBEDDING_DIMENSIONS)
+            )
+            self.logger.info(
+                f"Initialized OpenAI embedding model: {config.EMBEDDING_MODEL} "
+                f"({config.EMBEDDING_DIMENSIONS or 'full'} dimensions)"
             )
-            self.logger.info("Initialized OpenAI embedding model: text-embedding-3-small")
         except Exception as e:
             self.logger.error(f"Failed to initialize OpenAI embedding model: {e}")
             raise
 
-    def _ensure_schema_exists(self) -> None:
-        """
-        Check if the collection exists, if not create it with the required schema.
+    def create_embedding(self, text: str) -> List[float]:
         """
-        try:
-            # Check if collection exists
-            collections = self.client.collections.list_all()
-
-            # Check if 'Transcripts' exists as a key in the collections dictionary
-            collection_exists = self.collection_name in collections
-
-            print(collection_exists)
-
-            if not collection_exists:
-                self.logger.info(f"Creating collection '{self.collection_name}'")
-                # Define the transcript schema with correct property format
-                self.client.collections.create(
-                    name=self.collection_name,
-                    properties=[
-                        {
-                            "name": "course_id",
-                            "data_type": DataType.INT,
-                            "description": "The ID of the course",
-                        },
-                        {
-                            "name": "course_transcript_id",
-                            "data_type": DataType.INT,
-                            "description": "The ID of the transcript within the course (0 to n)",
-                        },
-                        {
-                            "name": "transcript_id",  # Renamed from 'id' as it's a reserved name
-                            "data_type": DataType.INT,
-                            "description": "Global continuous ID for the transcript",
-                        },
-                        {
-                            "name": "text",
-                            "data_type": DataType.TEXT,
-                            "description": "The content of the transcript",
-                        },
-                        {
-                            "name": "start_time",
-                            "data_type": DataType.INT,
-                            "description": "Start time of the transcript in seconds",
-                        },
-                        {
-                            "name": "end_time",
-                            "data_type": DataType.INT,
-                            "description": "End time of the transcript in seconds",
-                        },
-                    ],
-                )
-                self.logger.info(f"Collection '{self.collection_name}' created successfully")
-            else:
-                self.logger.info(f"Collection '{self.collection_name}' already exists")
+        Generate embedding for the given text using the OpenAI embedding model.
+        Previously embedded texts are served from the embedding cache.
 
-            # Get a reference to the collection for subsequent operations
-            self.collection = self.client.collections.get(self.collection_name)
+        Args:
+            text: The text to generate embeddings for
 
+        Returns:
+            The embedding vector as a list of floats
+        """
+        try:
+            embeddings = self.embedding_cache.get_or_create(
+                [text], lambda texts: [self.embedding_model.embed_query(texts[0])]
+            )
+            return embeddings[0]
         except Exception as e:
-            self.logger.error(f"Error ensuring schema exists: {e}")
+            self.logger.error(f"Error generating embedding: {e}")
             raise
 
-    def create_embedding(self, text: str) -> List[float]:
+    def create_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
-        Generate embedding for the given text using the OpenAI embedding model.
+        Generate embeddings for several texts with a single batched model call.
+        Only texts missing from the embedding cache are sent to the model.
 
         Args:
-            text: The text to generate embeddings for
+            texts: The texts to generate embeddings for
 
         Returns:
-            The embedding vector as a list of floats
+            The embedding vectors in the same order as the texts
         """
         try:
-            embeddings = self.embedding_model.embed_query(text)
-            return embeddings
+            return self.embedding_cache.get_or_create(texts, self.embedding_model.embed_documents)
         except Exception as e:
-            self.logger.error(f"Error generating embedding: {e}")
+            self.logger.error(f"Error generating embeddings: {e}")
             raise
 
     def vector_insert(self, properties: Dict[str, Any], text: str) -> str:
@@ -181,11 +398,9 @@ class TranscriptManager:
             # Generate vector embedding
             vector = self.create_embedding(text)
 
-            # Insert into Weaviate with the vector
-            uuid = self.collection.data.insert(
-                properties=properties,
-                vector=vector
-            )
+            # Insert into the store with the vector
+            uuid = self.store.insert(properties, vector)
+            self._invalidate_answers([properties.get("course_id")])
 
             self.logger.info(f"Inserted object with properties: {properties}")
             return uuid
@@ -204,99 +419,94 @@ class TranscriptManager:
             True if deletion was successful
         """
         try:
-            self.collection.data.delete(uuid)
+            self.store.delete(uuid)
             self.logger.info(f"Deleted object with UUID: {uuid}")
             return True
         except Exception as e:
             self.logger.error(f"Error deleting object: {e}")
             raise
 
-    def build_filters(self, **kwargs) -> Optional[Filter]:
+    def vector_search(self, query_text: str, limit: int = 5, **filter_kwargs) -> List[Dict[str, Any]]:
         """
-        Build filters for Weaviate queries based on keyword arguments.
-        Multiple filters are combined with AND operators.
+        Search for objects by vector similarity with optional filters.
 
         Args:
-            **kwargs: Key-value pairs for filtering where key is the property name
-                    and value is the value to filter by
+            query_text: The search query text
+            limit: Maximum number of results to return
+            **filter_kwargs: Keyword arguments for filtering results (property=value)
 
         Returns:
-            Weaviate Filter object or None if no filters provided
+            List of matching objects sorted by relevance
         """
-        if not kwargs:
-            return None
+        try:
+            started = time.perf_counter()
 
-        combined_filter = None
-
-        for key, value in kwargs.items():
-            # Create a filter for this key-value pair
-            current_filter = Filter.by_property(key).equal(value)
-
-            # If this is the first filter, use it as the starting point
-            if combined_filter is None:
-                combined_filter = current_filter
-            # Combine with AND operator
-            else:
-                combined_filter = Filter.by_operator("and").add_filter(
-                    combined_filter
-                ).add_filter(
-                    current_filter
-                )
+            # Generate query embedding
+            query_vector = self.create_embedding(query_text)
+            embedded = time.perf_counter()
 
-        return combined_filter
+            # Perform vector search
+            results = self.store.search(query_vector, limit=limit, filters=filter_kwargs)
+            finished = time.perf_counter()
 
-    def vector_search(self, query_text: str, limit: int = 5, **filter_kwargs) -> List[Dict[str, Any]]:
+            report_retrieval(
+                self.logger, "vector", query_text, results, results, "similarity",
+                embed=embedded - started, search=finished - embedded, total=finished - started,
+            )
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Error searching objects: {e}")
+            raise
+
+    def hybrid_search(self, query_text: str, limit: Optional[int] = None,
+                      alpha: Optional[float] = None, **filter_kwargs) -> List[Dict[str, Any]]:
         """
-        Search for objects by vector similarity with optional filters.
+        Search for objects by fused keyword (BM25) and vector scores with optional filters.
+
+        A candidate set of `limit * RETRIEVAL_CANDIDATE_MULTIPLIER` objects is fetched
+        and reranked by adding a bonus for the share of query terms each text contains
+        verbatim, so exact identifiers and formulas rise to the top.
 
         Args:
             query_text: The search query text
-            limit: Maximum number of results to return
+            limit: Maximum number of results to return (defaults to RETRIEVAL_TOP_K)
+            alpha: Weight of the vector score; 0 is pure keyword, 1 is pure vector search
+                (defaults to RETRIEVAL_ALPHA)
             **filter_kwargs: Keyword arguments for filtering results (property=value)
 
         Returns:
-            List of matching objects sorted by relevance
+            List of matching objects sorted by relevance, each with `score`,
+            `term_coverage`, `start_time` and `end_time`
         """
+        limit = config.RETRIEVAL_TOP_K if limit is None else limit
+        alpha = config.RETRIEVAL_ALPHA if alpha is None else alpha
         try:
-            # Generate query embedding
+            started = time.perf_counter()
             query_vector = self.create_embedding(query_text)
+            embedded = time.perf_counter()
+
+            candidates = self.store.hybrid_search(
+                query_text,
+                query_vector,
+                alpha=alpha,
+                limit=limit * config.RETRIEVAL_CANDIDATE_MULTIPLIER,
+                filters=filter_kwargs,
+            )
+            searched = time.perf_counter()
 
-            # Build filters from kwargs
-            filters = self.build_filters(**filter_kwargs)
-
-            # Perform vector search
-            if filters:
-                response = self.collection.query.near_vector(
-                    near_vector=query_vector,
-                    filters=filters,
-                    limit=limit,
-                    return_metadata=wq.MetadataQuery(distance=True),
-                )
-            else:
-                response = self.collection.query.near_vector(
-                    near_vector=query_vector,
-                    limit=limit,
-                    return_metadata=wq.MetadataQuery(distance=True),
-                )
-
-            if not response or len(response.objects) == 0:
-                return []
-
-            # Format results
-            results = []
-            for obj in response.objects:
-                distance = obj.metadata.distance
-                similarity = 1 - distance  # Convert distance to similarity score
-                results.append({
-                    "uuid": obj.uuid,
-                    "similarity": round(similarity, 4),
-                    **obj.properties
-                })
+            results = rerank(query_text, candidates, limit)
+            finished = time.perf_counter()
 
+            report_retrieval(
+                self.logger, "hybrid", query_text, candidates, results, "score",
+                embed=embedded - started, search=searched - embedded,
+                rerank=finished - searched, total=finished - started,
+            )
             return results
 
         except Exception as e:
-            self.logger.error(f"Error searching objects: {e}")
+            self.logger.error(f"Error in hybrid search: {e}")
             raise
 
     def most_similar_content(self, query_text: str, **filter_kwargs) -> Optional[str]:
@@ -311,8 +521,7 @@ class TranscriptManager:
             The text of the most similar transcript or None if no results are found
         """
         try:
-            # Call vector_search with limit as 1
-            results = self.vector_search(query_text, limit=1, **filter_kwargs)
+            results = self.hybrid_search(query_text, limit=1, **filter_kwargs)
 
             # Return the text key's data from the first result
             if results:
@@ -324,30 +533,33 @@ class TranscriptManager:
 
     def get_next_id(self) -> int:
         """
-        Get the next available global ID.
+        Get the next available global ID from the highest stored transcript_id.
+
+        This reads the single highest object and is only used to seed
+        the ID allocator.
 
         Returns:
             The next available global ID
         """
         try:
-            # Query to find the maximum transcript_id value (renamed from 'id')
-            response = self.collection.query.aggregate(aggregate_property="transcript_id", group_by=["transcript_id"])
+            objects = self.store.fetch(limit=1, sort_by="transcript_id", descending=True)
 
             # If no records exist yet, start with ID 1
-            if not response or len(response) == 0:
+            if not objects:
                 return 1
 
-            # Find the maximum ID
-            max_id = max([item.transcript_id for item in response])
-            return max_id + 1
+            return objects[0]["transcript_id"] + 1
 
         except Exception as e:
             self.logger.error(f"Error getting next ID: {e}")
-            return 1  # Default to 1 if something goes wrong
+            raise
 
     def get_next_course_transcript_id(self, course_id: int) -> int:
         """
-        Get the next available course_transcript_id for a specific course.
+        Get the next available course_transcript_id for a specific course from the
+        highest stored one.
+
+        This reads the single highest object and is only used to seed the ID allocator.
 
         Args:
             course_id: The ID of the course
@@ -356,22 +568,39 @@ class TranscriptManager:
             The next available course_transcript_id (0 to n)
         """
         try:
-            # Query to find transcripts for this course
-            response = self.collection.query.fetch_objects(
-                filters=Filter.by_property("course_id").equal(course_id)
+            objects = self.store.fetch(
+                filters={"course_id": course_id},
+                limit=1,
+                sort_by="course_transcript_id",
+                descending=True,
             )
 
             # If no transcripts exist for this course, start with ID 0
-            if not response or len(response.objects) == 0:
+            if not objects:
                 return 0
 
-            # Find the maximum course_transcript_id
-            transcript_ids = [obj.properties["course_transcript_id"] for obj in response.objects]
-            return max(transcript_ids) + 1
+            return objects[0]["course_transcript_id"] + 1
 
         except Exception as e:
             self.logger.error(f"Error getting next course transcript ID: {e}")
-            return 0  # Default to 0 if something goes wrong
+            raise
+
+    def reserve_ids(self, course_id: int, count: int = 1) -> List[tuple]:
+        """
+        Atomically reserve global and per-course IDs for new transcripts.
+
+        Args:
+            course_id: The ID of the course
+            count: Number of transcripts to reserve IDs for
+
+        Returns:
+            List of (transcript_id, course_transcript_id) pairs
+        """
+        transcript_ids = self.id_allocator.reserve_transcript_ids(count, seed=self.get_next_id)
+        course_transcript_ids = self.id_allocator.reserve_course_transcript_ids(
+            course_id, count, seed=lambda: self.get_next_course_transcript_id(course_id)
+        )
+        return list(zip(transcript_ids, course_transcript_ids))
 
     def create_transcript(self, course_id: int, text: str,
                           transcript_id: Optional[int] = None,
@@ -395,10 +624,12 @@ class TranscriptManager:
         try:
             # Auto-generate IDs if not provided
             if transcript_id is None:
-                transcript_id = self.get_next_id()
+                transcript_id = self.id_allocator.reserve_transcript_ids(1, seed=self.get_next_id)[0]
 
             if course_transcript_id is None:
-                course_transcript_id = self.get_next_course_transcript_id(course_id)
+                course_transcript_id = self.id_allocator.reserve_course_transcript_ids(
+                    course_id, 1, seed=lambda: self.get_next_course_transcript_id(course_id)
+                )[0]
 
             # Prepare transcript data
             transcript_data = {
@@ -420,6 +651,226 @@ class TranscriptManager:
             self.logger.error(f"Error creating transcript: {e}")
             raise
 
+    def bulk_create_transcripts(self, segments: Iterable[Union[TranscriptSegment, Dict[str, Any]]],
+                                batch_size: int = 100,
+                                max_concurrency: int = 4) -> BulkInsertResult:
+        """
+        Create many transcripts with batched embeddings and batch inserts.
+
+        Segments are consumed lazily in windows of `batch_size * max_concurrency`. Each window
+        is embedded with up to `max_concurrency` parallel `embed_documents` calls and streamed
+        into the store's batch insert (a fixed-size Weaviate batch by default). A failing
+        segment or batch is reported in the result instead of aborting the whole run.
+
+        Args:
+            segments: Iterable of TranscriptSegment objects or dicts with the same keys
+            batch_size: Number of segments per embedding request and per Weaviate batch
+            max_concurrency: Maximum number of parallel embedding and store requests
+
+        Returns:
+            BulkInsertResult with the created transcripts and per-item errors
+        """
+        if batch_size < 1 or max_concurrency < 1:
+            raise ValueError("batch_size and max_concurrency must be positive")
+
+        result = BulkInsertResult()
+        pending: Dict[str, tuple] = {}
+
+        def embedded_objects(executor: ThreadPoolExecutor) -> Iterator[VectorObject]:
+            rows = enumerate(segments)
+            while True:
+                window = list(islice(rows, batch_size * max_concurrency))
+                if not window:
+                    return
+
+                valid = []
+                for index, segment in window:
+                    try:
+                        valid.append((index, self._validate_segment(segment)))
+                    except Exception as e:
+                        result.errors.append({"index": index, "error": str(e)})
+                prepared = self._assign_ids(valid)
+
+                chunks = [prepared[i:i + batch_size] for i in range(0, len(prepared), batch_size)]
+                # Worker threads keep the caller's context, e.g. the metric labels of the call
+                futures = [
+                    executor.submit(copy_context().run, self.create_embeddings, [data["text"] for _, data in chunk])
+                    for chunk in chunks
+                ]
+
+                for chunk, future in zip(chunks, futures):
+                    try:
+                        vectors = future.result()
+                    except Exception as e:
+                        result.errors.extend({"index": index, "error": str(e)} for index, _ in chunk)
+                        continue
+
+                    for (index, data), vector in zip(chunk, vectors):
+                        object_uuid = str(uuid_lib.uuid4())
+                        pending[object_uuid] = (index, data)
+                        yield VectorObject(uuid=object_uuid, properties=data, vector=vector)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                failed = self.store.bulk_insert(
+                    embedded_objects(executor), batch_size=batch_size, concurrency=max_concurrency
+                )
+
+            for object_uuid, message in failed.items():
+                index, _ = pending.pop(object_uuid)
+                result.errors.append({"index": index, "error": message})
+
+            result.created = [{**data, "uuid": object_uuid} for object_uuid, (_, data) in pending.items()]
+            result.errors.sort(key=lambda error: error["index"])
+            self._invalidate_answers(data["course_id"] for data in result.created)
+
+            self.logger.info(
+                f"Bulk created {len(result.created)} transcripts with {len(result.errors)} errors"
+            )
+            return result
+
+        except Exception as e:
+            self.logger.error(f"Error bulk creating transcripts: {e}")
+            raise
+
+    @staticmethod
+    def _validate_segment(segment: Union[TranscriptSegment, Dict[str, Any]]) -> TranscriptSegment:
+        """
+        Normalize a bulk segment and reject unusable ones.
+
+        Args:
+            segment: TranscriptSegment or dict with the same keys
+
+        Returns:
+            The segment as a TranscriptSegment
+        """
+        if isinstance(segment, dict):
+            segment = TranscriptSegment(**segment)
+        if not segment.text:
+            raise ValueError("Transcript text must not be empty")
+        return segment
+
+    def _assign_ids(self, segments: List[tuple]) -> List[tuple]:
+        """
+        Fill in missing IDs for a window of bulk segments.
+
+        IDs are reserved as one block per course, so a window costs a couple of
+        counter increments rather than one lookup per segment.
+
+        Args:
+            segments: List of (index, TranscriptSegment) pairs
+
+        Returns:
+            List of (index, transcript properties) pairs
+        """
+        missing: Dict[int, int] = {}
+        for _, segment in segments:
+            if segment.transcript_id is None or segment.course_transcript_id is None:
+                missing[segment.course_id] = missing.get(segment.course_id, 0) + 1
+
+        reserved = {course_id: iter(self.reserve_ids(course_id, count)) for course_id, count in missing.items()}
+
+        prepared = []
+        for index, segment in segments:
+            transcript_id, course_transcript_id = segment.transcript_id, segment.course_transcript_id
+            if transcript_id is None or course_transcript_id is None:
+                next_transcript_id, next_course_transcript_id = next(reserved[segment.course_id])
+                if transcript_id is None:
+                    transcript_id = next_transcript_id
+                if course_transcript_id is None:
+                    course_transcript_id = next_course_transcript_id
+
+            prepared.append((index, {
+                "course_id": segment.course_id,
+                "course_transcript_id": course_transcript_id,
+                "transcript_id": transcript_id,
+                "text": segment.text,
+                "start_time": segment.start_time or 0,
+                "end_time": segment.end_time or 0,
+                "content_hash": segment.content_hash or "",
+            }))
+        return prepared
+
+    def sync_course_chunks(self, course_id: int, chunks: Iterable[TranscriptChunk],
+                           batch_size: int = 100, max_concurrency: int = 4) -> SyncResult:
+        """
+        Incrementally reindex a course from its current transcript chunks.
+
+        Stored transcripts are matched to chunks by content hash. Only new or changed
+        chunks are embedded and inserted, unchanged ones whose time range moved are
+        updated in place, and transcripts whose hash no longer occurs are deleted
+        afterwards. Chunks are consumed lazily, so a generator from
+        `core.ai.chunker` is never materialized. If any insert fails, stale transcripts
+        are kept so the course is never left without content; the next run retries.
+
+        Args:
+            course_id: ID of the course being reindexed
+            chunks: Every current chunk of the course, e.g. from `chunk_content`
+            batch_size: Number of chunks per embedding request and per store batch
+            max_concurrency: Maximum number of parallel embedding and store requests
+
+        Returns:
+            SyncResult with the created, unchanged and deleted counts
+        """
+        try:
+            stored: Dict[str, List[TranscriptRecord]] = {}
+            for record in self.iter_transcripts(course_id, include_text=False):
+                stored.setdefault(record.content_hash, []).append(record)
+
+            result = SyncResult()
+            retimed: Dict[str, Dict[str, int]] = {}
+
+            def changed_segments() -> Iterator[TranscriptSegment]:
+                for chunk in chunks:
+                    matches = stored.get(chunk.content_hash)
+                    if matches:
+                        record = matches.pop()
+                        if (record.start_time, record.end_time) != (chunk.start_time, chunk.end_time):
+                            retimed[record.uuid] = {"start_time": chunk.start_time, "end_time": chunk.end_time}
+                        result.unchanged += 1
+                        continue
+                    yield TranscriptSegment(
+                        course_id=course_id,
+                        text=chunk.text,
+                        start_time=chunk.start_time,
+                        end_time=chunk.end_time,
+                        content_hash=chunk.content_hash,
+                    )
+
+            inserted = self.bulk_create_transcripts(
+                changed_segments(), batch_size=batch_size, max_concurrency=max_concurrency
+            )
+            result.created, result.errors = inserted.created, inserted.errors
+
+            stale = [record.uuid for records in stored.values() for record in records]
+            with self.store.deferred_flush():
+                for object_uuid, times in retimed.items():
+                    self.store.update(object_uuid, times)
+                result.retimed = len(retimed)
+
+                if result.errors:
+                    self.logger.warning(
+                        f"Keeping {len(stale)} stale transcripts of course {course_id} after {len(result.errors)} insert errors"
+                    )
+                else:
+                    for object_uuid in stale:
+                        self.store.delete(object_uuid)
+                    result.deleted = len(stale)
+
+            # Creating transcripts already invalidated the course's answers
+            if not result.created and (result.retimed or result.deleted):
+                self._invalidate_answers([course_id])
+
+            self.logger.info(
+                f"Synced course {course_id}: {len(result.created)} created, {result.unchanged} unchanged "
+                f"({result.retimed} retimed), {result.deleted} deleted"
+            )
+            return result
+
+        except Exception as e:
+            self.logger.error(f"Error syncing chunks of course {course_id}: {e}")
+            raise
+
     def get_transcript(self, transcript_id: int) -> Optional[Dict[str, Any]]:
         """
         Retrieve a transcript by its global ID.
@@ -431,50 +882,79 @@ class TranscriptManager:
             The transcript data or None if not found
         """
         try:
-            response = self.collection.query.fetch_objects(
-                filters=Filter.by_property("transcript_id").equal(transcript_id)
-            )
+            objects = self.store.fetch(filters={"transcript_id": transcript_id}, limit=1)
 
-            if not response or len(response.objects) == 0:
+            if not objects:
                 self.logger.warning(f"Transcript with ID {transcript_id} not found")
                 return None
 
-            obj = response.objects[0]
-            return {
-                "uuid": obj.uuid,
-                **obj.properties
-            }
+            return objects[0]
 
         except Exception as e:
             self.logger.error(f"Error retrieving transcript: {e}")
             raise
 
-    def get_course_transcripts(self, course_id: int) -> List[Dict[str, Any]]:
+    def iter_transcripts(self, course_id: Optional[int] = None, page_size: int = 500,
+                         include_text: bool = True, include_vector: bool = False) -> Iterator[TranscriptRecord]:
         """
-        Retrieve all transcripts for a specific course.
+        Lazily walk stored transcripts page by page, in constant memory.
+
+        A course is walked in `course_transcript_id` order, paging on that property
+        (Weaviate cursors cannot be filtered); the whole collection is walked with a
+        UUID cursor (`after=`) in storage order.
 
         Args:
-            course_id: The ID of the course
+            course_id: Restrict the walk to this course, or None for every transcript
+            page_size: Number of transcripts fetched per request
+            include_text: Also fetch the transcript text
+            include_vector: Also fetch the embedding vector
 
         Returns:
-            List of transcript data for the course
+            Iterator over TranscriptRecord objects
         """
+        properties = [prop["name"] for prop in TRANSCRIPT_PROPERTIES if include_text or prop["name"] != "text"]
+        objects = self.store.iterate(
+            filters={"course_id": course_id} if course_id is not None else None,
+            page_size=page_size,
+            order_by="course_transcript_id" if course_id is not None else None,
+            properties=properties,
+            include_vector=include_vector,
+        )
+
         try:
-            response = self.collection.query.fetch_objects(
-                filters=Filter.by_property("course_id").equal(course_id)
-            )
+            for obj in objects:
+                props = obj.properties
+                yield TranscriptRecord(
+                    uuid=obj.uuid,
+                    course_id=props["course_id"],
+                    course_transcript_id=props["course_transcript_id"],
+                    transcript_id=props["transcript_id"],
+                    start_time=props.get("start_time") or 0,
+                    end_time=props.get("end_time") or 0,
+                    content_hash=props.get("content_hash") or "",
+                    text=props.get("text") if include_text else None,
+                    vector=obj.vector,
+                )
+        except Exception as e:
+            self.logger.error(f"Error iterating transcripts: {e}")
+            raise
 
-            if not response or len(response.objects) == 0:
-                self.logger.info(f"No transcripts found for course {course_id}")
-                return []
+    def get_course_transcripts(self, course_id: int) -> List[Dict[str, Any]]:
+        """
+        Retrieve all transcripts for a specific course.
 
-            # Convert to list of dictionaries
-            transcripts = [{"uuid": obj.uuid, **obj.properties} for obj in response.objects]
-            return transcripts
+        Prefer `iter_transcripts` for large courses; this materializes every transcript.
 
-        except Exception as e:
-            self.logger.error(f"Error retrieving course transcripts: {e}")
-            raise
+        Args:
+            course_id: The ID of the course
+
+        Returns:
+            List of transcript data for the course, ordered by course_transcript_id
+        """
+        transcripts = [record.to_dict() for record in self.iter_transcripts(course_id)]
+        if not transcripts:
+            self.logger.info(f"No transcripts found for course {course_id}")
+        return transcripts
 
     def update_transcript(self, transcript_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -498,29 +978,128 @@ class TranscriptManager:
             uuid = existing.pop("uuid")
 
             # Merge existing data with updates
-            updated_data = {**existing, **data}
+            updated_data = self._merge_update(existing, data)
 
             # If text is updated, regenerate embedding
-            if "text" in data:
-                vector = self.create_embedding(data["text"])
-                self.collection.data.update(
-                    uuid=uuid,
-                    properties=updated_data,
-                    vector=vector
-                )
-            else:
-                self.collection.data.update(
-                    uuid=uuid,
-                    properties=updated_data
-                )
+            vector = self.create_embedding(data["text"]) if "text" in data else None
+            self.store.update(uuid, updated_data, vector=vector)
+            self._invalidate_answers([existing.get("course_id"), updated_data.get("course_id")])
 
             self.logger.info(f"Updated transcript with ID {transcript_id}")
-            return self.get_transcript(transcript_id)
+            return {**updated_data, "uuid": uuid}
 
         except Exception as e:
             self.logger.error(f"Error updating transcript: {e}")
             raise
 
+    def update_many(self, updates: Dict[int, Dict[str, Any]], batch_size: int = 100,
+                    max_concurrency: int = 4) -> BulkUpdateResult:
+        """
+        Update many transcripts with one read and one batch write per window.
+
+        Each window of `batch_size` transcripts is fetched with its vectors in a single
+        request, only the texts that actually changed are re-embedded (in one batched,
+        cached call), and the merged objects are written back with a batch upsert.
+
+        Args:
+            updates: Fields to update, keyed by global transcript ID
+            batch_size: Number of transcripts per fetch, embedding request and store batch
+            max_concurrency: Maximum number of parallel store requests
+
+        Returns:
+            BulkUpdateResult with counts instead of the updated objects
+        """
+        if batch_size < 1 or max_concurrency < 1:
+            raise ValueError("batch_size and max_concurrency must be positive")
+
+        result = BulkUpdateResult()
+        pending: Dict[str, int] = {}
+        # Course before and after the update, per object
+        courses: Dict[str, tuple] = {}
+        reembedded = set()
+
+        def upserts() -> Iterator[VectorObject]:
+            transcript_ids = list(updates)
+            for start in range(0, len(transcript_ids), batch_size):
+                window = transcript_ids[start:start + batch_size]
+                stored = {
+                    obj.properties["transcript_id"]: obj
+                    for obj in self.store.iterate(
+                        filters={"transcript_id": window},
+                        page_size=len(window),
+                        order_by="transcript_id",
+                        include_vector=True,
+                    )
+                }
+                result.missing.extend(transcript_id for transcript_id in window if transcript_id not in stored)
+
+                merged = {
+                    transcript_id: self._merge_update(stored[transcript_id].properties, updates[transcript_id])
+                    for transcript_id in window if transcript_id in stored
+                }
+                changed = [
+                    transcript_id for transcript_id, data in merged.items()
+                    if data["text"] != stored[transcript_id].properties.get("text")
+                ]
+                try:
+                    vectors = dict(zip(changed, self.create_embeddings([merged[tid]["text"] for tid in changed])))
+                except Exception as e:
+                    result.errors.extend({"transcript_id": tid, "error": str(e)} for tid in changed)
+                    vectors = None
+
+                for transcript_id, data in merged.items():
+                    if transcript_id in changed and vectors is None:
+                        continue
+                    obj = stored[transcript_id]
+                    pending[obj.uuid] = transcript_id
+                    courses[obj.uuid] = (obj.properties.get("course_id"), data.get("course_id"))
+                    if transcript_id in changed:
+                        reembedded.add(obj.uuid)
+                        yield VectorObject(uuid=obj.uuid, properties=data, vector=vectors[transcript_id])
+                    else:
+                        yield VectorObject(uuid=obj.uuid, properties=data, vector=obj.vector)
+
+        try:
+            failed = self.store.bulk_insert(upserts(), batch_size=batch_size, concurrency=max_concurrency)
+            for object_uuid, message in failed.items():
+                result.errors.append({"transcript_id": pending.pop(object_uuid), "error": message})
+                reembedded.discard(object_uuid)
+            result.updated = len(pending)
+            result.reembedded = len(reembedded)
+            self._invalidate_answers(course_id for object_uuid in pending for course_id in courses[object_uuid])
+
+            self.logger.info(
+                f"Bulk updated {result.updated} transcripts ({result.reembedded} re-embedded), "
+                f"{len(result.missing)} missing, {len(result.errors)} errors"
+            )
+            return result
+
+        except Exception as e:
+            self.logger.error(f"Error bulk updating transcripts: {e}")
+            raise
+
+    @staticmethod
+    def _merge_update(existing: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge updated fields into stored transcript properties.
+
+        A changed text invalidates the stored content hash unless a new one is given,
+        so the next incremental reindex replaces the edited transcript.
+        """
+        merged = {**existing, **data}
+        merged.pop("uuid", None)
+        if data.get("text", existing.get("text")) != existing.get("text") and "content_hash" not in data:
+            merged["content_hash"] = ""
+        return merged
+
+    @staticmethod
+    def _invalidate_answers(course_ids: Iterable[Any]) -> None:
+        """
+        Drop the cached chat answers of every course whose transcripts changed.
+        """
+        for course_id in {course_id for course_id in course_ids if course_id is not None}:
+            answer_cache.invalidate(course_id)
+
     def delete_transcript(self, transcript_id: int) -> bool:
         """
         Delete a transcript by its global ID.
@@ -529,45 +1108,100 @@ class TranscriptManager:
             transcript_id: Global ID of the transcript
 
         Returns:
-            True if deletion was successful, False otherwise
+            True if a transcript was deleted, False if it was not found
         """
         try:
-            # First get the transcript to delete
-            existing = self.get_transcript(transcript_id)
-            if not existing:
+            deleted = self.store.fetch(filters={"transcript_id": transcript_id})
+            if not deleted:
                 self.logger.warning(f"Cannot delete: Transcript with ID {transcript_id} not found")
                 return False
 
-            # Get UUID for the delete operation
-            uuid = existing["uuid"]
+            self.store.delete_by_filter({"transcript_id": transcript_id})
+            self._invalidate_answers(transcript["course_id"] for transcript in deleted)
 
-            # Delete using vector_delete function
-            return self.vector_delete(uuid)
+            self.logger.info(f"Deleted transcript with ID {transcript_id}")
+            return True
 
         except Exception as e:
             self.logger.error(f"Error deleting transcript: {e}")
             raise
 
+    def delete_many(self, **filter_kwargs) -> int:
+        """
+        Delete every transcript matching the filters in a single request.
+
+        Args:
+            **filter_kwargs: Keyword arguments for filtering transcripts (property=value),
+                e.g. `course_id=3`; a list value matches any of its items
+
+        Returns:
+            Number of deleted transcripts
+        """
+        if not filter_kwargs:
+            raise ValueError("delete_many needs at least one filter")
+
+        try:
+            course_ids = filter_kwargs.get("course_id")
+            if course_ids is None:
+                # Find the affected courses before their transcripts are gone, walking every
+                # match: a single fetch is capped by the store's default query limit
+                course_ids = {
+                    obj.properties["course_id"]
+                    for obj in self.store.iterate(
+                        filters=filter_kwargs,
+                        page_size=1000,
+                        order_by="transcript_id",
+                        properties=["course_id"],
+                    )
+                }
+            elif not isinstance(course_ids, (list, tuple, set)):
+                course_ids = [course_ids]
+
+            deleted = self.store.delete_by_filter(filter_kwargs)
+            self.logger.info(f"Deleted {deleted} transcripts matching {filter_kwargs}")
+
+            if deleted:
+                self._invalidate_answers(course_ids)
+            return deleted
+
+        except Exception as e:
+            self.logger.error(f"Error deleting transcripts: {e}")
+            raise
+
+    def is_ready(self) -> bool:
+        """
+        Check whether the vector store is connected and ready.
+
+        Returns:
+            True if the store can serve requests, False otherwise
+        """
+        return self.store is not None and self.store.is_ready()
+
+    def _close_store(self) -> None:
+        # NumPy stores may be shared with the other managers of the process
+        if isinstance(self.store, NumpyVectorStore):
+            release_numpy_store(self.store)
+        else:
+            self.store.close()
+
     def __del__(self):
         """
         Destructor method to ensure proper connection cleanup.
         """
         try:
-            if self.client is not None:
-                self.client.close()
-                self.logger.info("Weaviate client connection closed properly")
+            if getattr(self, "store", None) is not None:
+                self._close_store()
         except Exception as e:
-            self.logger.error(f"Error closing Weaviate client: {e}")
+            self.logger.error(f"Error closing vector store: {e}")
 
     def close(self):
         """
-        Explicitly close the Weaviate client connection.
+        Explicitly close the vector store connection.
         """
         try:
-            if self.client is not None:
-                self.client.close()
-                self.client = None
-                self.logger.info("Weaviate client connection closed properly")
+            if self.store is not None:
+                self._close_store()
+                self.store = None
         except Exception as e:
-            self.logger.error(f"Error closing Weaviate client: {e}")
-            raise
\ No newline at end of file
+            self.logger.error(f"Error closing vector store: {e}")
+            raise
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from core.ai.async_transcript_manager import AsyncTranscriptManager
+from core.config import config
+
+
+class AsyncTranscriptManagerProvider:
+    """
+    Process-wide holder of a shared AsyncTranscriptManager for async request handlers.
+
+    The manager is created once (normally from the FastAPI lifespan), handed out to every
+    request and closed on shutdown, so RAG requests reuse a warm Weaviate connection and
+    embedding client instead of opening new ones per call. It connects, probes and
+    closes with the asyncio Weaviate client so none of it blocks the event loop.
+    """
+
+    def __init__(self, health_check_interval: float = 30.0):
+        """
+        Initialize an empty provider.
+
+        Args:
+            health_check_interval: Minimum number of seconds between readiness probes in `get`
+        """
+        self.logger = logging.getLogger(__name__)
+        self.health_check_interval = health_check_interval
+        self.manager: Optional[AsyncTranscriptManager] = None
+        self.weaviate_url: Optional[str] = None
+        self.collection_name = "Transcripts"
+        self._last_health_check = 0.0
+        self._lock = asyncio.Lock()
+
+    async def init(self, *, weaviate_url: str, collection_name: str = "Transcripts") -> AsyncTranscriptManager:
+        """
+        Create the shared manager if it does not exist yet.
+
+        Args:
+            weaviate_url: URL to the Weaviate instance
+            collection_name: Name of the collection to store transcripts
+
+        Returns:
+            The shared AsyncTranscriptManager
+        """
+        async with self._lock:
+            self.weaviate_url = weaviate_url
+            self.collection_name = collection_name
+            if self.manager is None:
+                self.manager = await AsyncTranscriptManager.connect(weaviate_url, collection_name=collection_name)
+                self._last_health_check = time.monotonic()
+            return self.manager
+
+    async def get(self) -> AsyncTranscriptManager:
+        """
+        Return the shared manager, connecting or reconnecting when needed.
+
+        The readiness probe runs at most once per `health_check_interval`, so the common
+        path is a plain attribute read.
+
+        Returns:
+            A ready AsyncTranscriptManager
+        """
+        manager = self.manager
+        if manager is None:
+            return await self.init(
+                weaviate_url=self.weaviate_url or config.WEAVIATE_URL,
+                collection_name=self.collection_name,
+            )
+
+        if time.monotonic() - self._last_health_check >= self.health_check_interval:
+            if not await self.health_check():
+                self.logger.warning("Shared async Weaviate connection is not ready, reconnecting")
+                await self.close()
+                return await self.get()
+
+        return manager
+
+    async def health_check(self) -> bool:
+        """
+        Probe the shared manager's Weaviate connection.
+
+        Returns:
+            True if a manager exists and its server is ready
+        """
+        manager = self.manager
+        self._last_health_check = time.monotonic()
+        return manager is not None and await manager.is_ready()
+
+    async def close(self) -> None:
+        """
+        Close the shared manager's connection and drop it.
+        """
+        async with self._lock:
+            manager, self.manager = self.manager, None
+
+        if manager is not None:
+            try:
+                await manager.close()
+            except Exception as e:
+                self.logger.error(f"Error closing shared AsyncTranscriptManager: {e}")
+
+
+async_transcript_provider = AsyncTranscriptManagerProvider()
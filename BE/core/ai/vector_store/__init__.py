@@ -0,0 +1,14 @@
+from .base import AsyncVectorStore, VectorObject, VectorStore
+from .numpy_backend import NumpyVectorStore
+from .threaded import ThreadedVectorStore
+from .weaviate_backend import AsyncWeaviateVectorStore, WeaviateVectorStore
+
+__all__ = [
+    "VectorStore",
+    "AsyncVectorStore",
+    "VectorObject",
+    "NumpyVectorStore",
+    "ThreadedVectorStore",
+    "WeaviateVectorStore",
+    "AsyncWeaviateVectorStore",
+]
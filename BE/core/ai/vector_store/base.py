@@ -0,0 +1,141 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+@dataclass
+class VectorObject:
+    """
+    An object to store: its UUID, properties and embedding vector.
+    Objects read back without their vector have `vector` set to None.
+    """
+    uuid: str
+    properties: Dict[str, Any]
+    vector: Optional[List[float]]
+
+
+class VectorStore(ABC):
+    """
+    Storage backend for embedded objects.
+
+    Filters are passed as a dict of property name to value; all of them must match, and a
+    list value matches any of its items.
+    Search and fetch results are dicts with a `uuid` key plus the object properties.
+    Vector search results also carry a `similarity` score and hybrid search results a
+    fused `score` in [0, 1] (higher is more relevant).
+    """
+
+    @abstractmethod
+    def insert(self, properties: Dict[str, Any], vector: List[float]) -> str:
+        """Insert one object and return its UUID"""
+
+    @abstractmethod
+    def bulk_insert(self, objects: Iterable[VectorObject], batch_size: int = 100,
+                    concurrency: int = 2) -> Dict[str, str]:
+        """
+        Insert objects lazily in batches and return failed UUIDs mapped to error messages.
+        An object whose UUID already exists replaces the stored one.
+        """
+
+    @abstractmethod
+    def search(self, vector: List[float], limit: int = 5,
+               filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Return the objects most similar to the vector"""
+
+    @abstractmethod
+    def hybrid_search(self, query_text: str, vector: List[float], alpha: float = 0.5, limit: int = 5,
+                      filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Return objects ranked by a fusion of BM25 (weight 1 - alpha) and vector (weight alpha) scores"""
+
+    @abstractmethod
+    def fetch(self, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+              sort_by: Optional[str] = None, descending: bool = False) -> List[Dict[str, Any]]:
+        """Return objects matching the filters, optionally sorted by a property"""
+
+    @abstractmethod
+    def iterate(self, filters: Optional[Dict[str, Any]] = None, page_size: int = 100,
+                order_by: Optional[str] = None, properties: Optional[List[str]] = None,
+                include_vector: bool = False) -> Iterator[VectorObject]:
+        """
+        Lazily walk every object matching the filters, one page at a time.
+
+        Filtered walks need `order_by`, a property that is unique among the matches, and page
+        through it in ascending order; unfiltered walks follow a UUID cursor. `properties`
+        restricts the returned properties (all when None).
+        """
+
+    @abstractmethod
+    def update(self, uuid: str, properties: Dict[str, Any], vector: Optional[List[float]] = None) -> None:
+        """Update an object's properties and, if given, its vector"""
+
+    @abstractmethod
+    def delete(self, uuid: str) -> None:
+        """Delete an object by UUID"""
+
+    @abstractmethod
+    def delete_by_filter(self, filters: Dict[str, Any]) -> int:
+        """Delete every object matching the filters and return how many were deleted"""
+
+    def deferred_flush(self) -> AbstractContextManager:
+        """
+        Group the writes made inside the block so they are persisted once at its end.
+        Backends that persist every write on their own ignore it.
+        """
+        return nullcontext()
+
+    @abstractmethod
+    def is_ready(self) -> bool:
+        """Whether the backend can serve requests"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release connections and flush pending state"""
+
+
+class AsyncVectorStore(ABC):
+    """
+    Asyncio counterpart of VectorStore for the request path.
+
+    It covers the single-object and query operations used while serving requests;
+    bulk ingestion and full walks stay on the synchronous VectorStore.
+    """
+
+    @abstractmethod
+    async def insert(self, properties: Dict[str, Any], vector: List[float]) -> str:
+        """Insert one object and return its UUID"""
+
+    @abstractmethod
+    async def search(self, vector: List[float], limit: int = 5,
+                     filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Return the objects most similar to the vector"""
+
+    @abstractmethod
+    async def hybrid_search(self, query_text: str, vector: List[float], alpha: float = 0.5, limit: int = 5,
+                            filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Return objects ranked by a fusion of BM25 (weight 1 - alpha) and vector (weight alpha) scores"""
+
+    @abstractmethod
+    async def fetch(self, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+                    sort_by: Optional[str] = None, descending: bool = False) -> List[Dict[str, Any]]:
+        """Return objects matching the filters, optionally sorted by a property"""
+
+    @abstractmethod
+    async def update(self, uuid: str, properties: Dict[str, Any], vector: Optional[List[float]] = None) -> None:
+        """Update an object's properties and, if given, its vector"""
+
+    @abstractmethod
+    async def delete(self, uuid: str) -> None:
+        """Delete an object by UUID"""
+
+    @abstractmethod
+    async def delete_by_filter(self, filters: Dict[str, Any]) -> int:
+        """Delete every object matching the filters and return how many were deleted"""
+
+    @abstractmethod
+    async def is_ready(self) -> bool:
+        """Whether the backend can serve requests"""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections and flush pending state"""
@@ -0,0 +1,124 @@
+"""
+Compare embedding sizes and vector quantization for the NumPy vector store.
+
+For every (dimensions, quantization) setting it reports the resident index memory per
+million segments, the on-disk size, recall@k against an exact search over the full-size
+vectors, and the mean query latency.
+
+    python -m core.ai.vector_store.benchmark --count 50000 --queries 200 --k 5
+    python -m core.ai.vector_store.benchmark --input embeddings.npy
+
+Without `--input`, synthetic clustered vectors with a decaying per-dimension variance are
+used, mimicking text-embedding-3 vectors whose leading dimensions carry most of the
+signal. Reduced sizes are produced the way the API does it: by truncating the
+full-size vectors and re-normalizing.
+"""
+import argparse
+import time
+import uuid as uuid_lib
+from typing import Dict, List
+
+import numpy as np
+
+from core.ai.vector_store.base import VectorObject
+from core.ai.vector_store.numpy_backend import NumpyVectorStore
+
+MILLION = 1_000_000
+
+
+def synthetic_embeddings(count: int, dimensions: int, clusters: int = 200, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    decay = (1.0 / np.sqrt(1 + np.arange(dimensions) / 64)).astype(np.float32)
+    centers = rng.standard_normal((clusters, dimensions)).astype(np.float32) * decay
+    noise = rng.standard_normal((count, dimensions)).astype(np.float32) * decay * 0.6
+    vectors = centers[rng.integers(clusters, size=count)] + noise
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def truncate(vectors: np.ndarray, dimensions: int) -> np.ndarray:
+    reduced = np.ascontiguousarray(vectors[:, :dimensions])
+    return reduced / np.linalg.norm(reduced, axis=1, keepdims=True)
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> List[set]:
+    scores = queries @ corpus.T
+    return [set(np.argpartition(-row, k - 1)[:k].tolist()) for row in scores]
+
+
+def run_setting(corpus: np.ndarray, queries: np.ndarray, truth: List[set], k: int, quantization: str,
+                rerank_factor: int) -> Dict[str, float]:
+    dimensions = corpus.shape[1]
+    store = NumpyVectorStore(
+        quantization=quantization,
+        pq_subspaces=max(1, dimensions // 16),
+        rerank_factor=rerank_factor,
+        autoflush=False,
+    )
+    ids = [str(uuid_lib.UUID(int=index)) for index in range(len(corpus))]
+    store.bulk_insert(
+        VectorObject(uuid=ids[index], properties={"course_id": 0, "row": index}, vector=vector)
+        for index, vector in enumerate(corpus)
+    )
+
+    # Quantizers train in the background; train them up front to measure quantized search
+    store.train_quantizers()
+    started = time.perf_counter()
+    hits = 0
+    for query, expected in zip(queries, truth):
+        found = {result["row"] for result in store.search(query.tolist(), limit=k)}
+        hits += len(found & expected)
+    latency = (time.perf_counter() - started) / len(queries)
+
+    # Codes grow with the corpus, codebooks and scales are a fixed cost
+    partition = next(iter(store._partitions.values()))
+    full_bytes = partition.matrix().nbytes
+    if partition.quantizer is not None:
+        codes = partition.quantizer.codes.nbytes
+        resident = codes / len(corpus) * MILLION + partition.quantizer.nbytes - codes
+    else:
+        resident = full_bytes / len(corpus) * MILLION
+    return {
+        "ram_mb_per_million": resident / 2 ** 20,
+        "disk_mb_per_million": full_bytes / len(corpus) * MILLION / 2 ** 20,
+        "recall": hits / (len(queries) * k),
+        "latency_ms": latency * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", help="Optional .npy matrix of full-size embeddings to use as the corpus")
+    parser.add_argument("--count", type=int, default=20000, help="Synthetic corpus size")
+    parser.add_argument("--full-dimensions", type=int, default=1536)
+    parser.add_argument("--dimensions", type=int, nargs="+", default=[1536, 512, 256])
+    parser.add_argument("--quantization", nargs="+", default=["none", "int8", "pq"])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--rerank-factor", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.input:
+        full = np.load(args.input).astype(np.float32)
+        full /= np.linalg.norm(full, axis=1, keepdims=True)
+    else:
+        full = synthetic_embeddings(args.count + args.queries, args.full_dimensions)
+    corpus, queries = full[:-args.queries], full[-args.queries:]
+
+    # Ground truth is an exact search over the full-size vectors
+    truth = exact_top_k(corpus, queries, args.k)
+
+    print(f"{len(corpus)} segments, {len(queries)} queries, recall@{args.k} vs exact {corpus.shape[1]}-dim search")
+    print(f"{'dims':>6} {'quant':>6} {'RAM MB/1M':>10} {'disk MB/1M':>11} {'recall':>7} {'ms/query':>9}")
+    for dimensions in args.dimensions:
+        reduced_corpus = truncate(corpus, dimensions)
+        reduced_queries = truncate(queries, dimensions)
+        for quantization in args.quantization:
+            result = run_setting(reduced_corpus, reduced_queries, truth, args.k, quantization, args.rerank_factor)
+            print(
+                f"{dimensions:>6} {quantization:>6} {result['ram_mb_per_million']:>10.0f} "
+                f"{result['disk_mb_per_million']:>11.0f} {result['recall']:>7.3f} {result['latency_ms']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,709 @@
+import fcntl
+import json
+import logging
+import os
+import threading
+import uuid as uuid_lib
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from core.ai.lexical import BM25Index
+from core.ai.vector_store.base import VectorObject, VectorStore
+from core.ai.vector_store.quantization import Quantizer, make_quantizer
+
+
+class _Partition:
+    """
+    Contiguous float32 vectors and their properties for one partition key value.
+
+    Rows `[0, size)` of `vectors` are live; the array grows by doubling. Vectors loaded
+    from disk start as a read-only memory map and are copied into RAM on first write.
+    The BM25 index is derived lazily and dropped on every change. The quantizer is kept
+    across writes: rows written since it was trained are listed in `stale` and scored
+    exactly until the next training. While a training reads the vectors, `shared` is set
+    so removals copy them first, and the rows written meanwhile are gathered in `training`.
+    """
+
+    __slots__ = ("vectors", "size", "uuids", "properties", "lexical", "quantizer", "stale", "training", "shared")
+
+    def __init__(self, dimensions: int):
+        self.vectors = np.empty((0, dimensions), dtype=np.float32)
+        self.size = 0
+        self.uuids: List[str] = []
+        self.properties: List[Dict[str, Any]] = []
+        self.lexical: Optional[BM25Index] = None
+        self.quantizer: Optional[Quantizer] = None
+        self.stale: set = set()
+        self.training: Optional[set] = None
+        self.shared = False
+
+    def matrix(self) -> np.ndarray:
+        return self.vectors[:self.size]
+
+    def _touch(self, row: int) -> None:
+        self.stale.add(row)
+        if self.training is not None:
+            self.training.add(row)
+
+    def append(self, uuid: str, properties: Dict[str, Any], vector: np.ndarray) -> int:
+        if self.size == len(self.vectors) or not self.vectors.flags.writeable:
+            capacity = max(16, 2 * self.size)
+            grown = np.empty((capacity, self.vectors.shape[1]), dtype=np.float32)
+            grown[:self.size] = self.vectors[:self.size]
+            self.vectors = grown
+
+        self.vectors[self.size] = vector
+        self.lexical = None
+        self._touch(self.size)
+        self.uuids.append(uuid)
+        self.properties.append(properties)
+        self.size += 1
+        return self.size - 1
+
+    def remove(self, row: int) -> Optional[str]:
+        """
+        Swap-remove a row and return the UUID of the object moved into it, if any.
+        """
+        if not self.vectors.flags.writeable or self.shared:
+            self.vectors = np.array(self.vectors[:self.size])
+            self.shared = False
+
+        last = self.size - 1
+        moved = None
+        if row != last:
+            self.vectors[row] = self.vectors[last]
+            self.uuids[row] = self.uuids[last]
+            self.properties[row] = self.properties[last]
+            moved = self.uuids[row]
+            self._touch(row)
+
+        self.stale.discard(last)
+        self.uuids.pop()
+        self.properties.pop()
+        self.size -= 1
+        self.lexical = None
+        return moved
+
+
+class NumpyVectorStore(VectorStore):
+    """
+    In-process VectorStore keeping float32 vectors in contiguous NumPy arrays.
+
+    Objects are partitioned by one property (the course by default), so a filtered search
+    is a single vectorized matrix-vector product over that course's vectors followed by a
+    top-k selection. Vectors are L2-normalized on insert, making the dot product the cosine
+    similarity. When a path is given, each partition is persisted as an `.npy` file that is
+    memory-mapped on load, next to a JSON file with UUIDs and properties.
+
+    Several processes may share a path (e.g. the API and an indexing script). Writes hold
+    an exclusive lock on the directory's `.lock` file and bump the counter in `.version`;
+    every operation compares that counter with the last one seen and first reloads the
+    partitions another process changed. Partitions with unflushed local changes are not
+    reloaded, so use autoflush when other processes write the same partitions.
+
+    With quantization ("int8" or "pq") searches scan compact in-memory codes instead of
+    the float32 vectors and rerank the best `limit * rerank_factor` candidates with the
+    full-precision vectors, which can then stay on disk behind the memory map. Quantizers
+    are trained in a background thread, never in a search: a partition is searched
+    exactly until its first training, and retrained once `retrain_writes` rows (or a
+    tenth of the partition, if fewer) were written since the last one.
+    """
+
+    def __init__(self, path: Optional[str] = None, partition_key: str = "course_id",
+                 text_property: str = "text", autoflush: bool = True, quantization: str = "none",
+                 pq_subspaces: int = 64, rerank_factor: int = 4, retrain_writes: int = 1000,
+                 dimensions: Optional[int] = None):
+        """
+        Initialize the store, loading persisted partitions when a path is given.
+
+        Args:
+            path: Directory for the persisted partitions, or None to keep everything in memory
+            partition_key: Property whose value selects the partition of an object
+            text_property: Property indexed for BM25 keyword scoring in hybrid search
+            autoflush: Persist changed partitions after every write operation (or once per
+                `deferred_flush` block and per bulk insert batch)
+            quantization: "none", "int8" or "pq" (product quantization)
+            pq_subspaces: Number of product quantization subspaces; must divide the dimensions
+            rerank_factor: Candidates per result rescored at full precision when quantized
+            retrain_writes: Rows written to a partition after which its quantizer is retrained
+            dimensions: Expected vector dimensions, checked against the quantization up front;
+                otherwise taken from the first vector stored
+
+        Raises:
+            ValueError: If the quantization is unknown or does not fit the dimensions
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.partition_key = partition_key
+        self.text_property = text_property
+        self.autoflush = autoflush
+        self.quantization = quantization
+        self.pq_subspaces = pq_subspaces
+        self.rerank_factor = rerank_factor
+        self.retrain_writes = retrain_writes
+        make_quantizer(quantization, pq_subspaces)  # Fail fast on an unknown setting
+        self.dimensions: Optional[int] = None
+        if dimensions is not None:
+            self._set_dimensions(dimensions)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._training: Dict[Any, Future] = {}
+        self._partitions: Dict[Any, _Partition] = {}
+        self._locations: Dict[str, Tuple[Any, int]] = {}
+        self._dirty: set = set()
+        self._deferred = 0
+        self._lock = threading.RLock()
+        # Change detection for a shared path: the last `.version` counter seen, and the
+        # (mtime, size) of each partition's JSON file as last read or written
+        self._version: Optional[int] = None
+        self._signatures: Dict[Any, Tuple[int, int]] = {}
+        self._lock_file = None
+        self._file_locked = False
+        self._counters: Dict[str, int] = {}  # ID counters of an in-memory store
+
+        if path:
+            os.makedirs(path, exist_ok=True)
+            self._lock_file = open(os.path.join(path, ".lock"), "a")
+            self._refresh()
+            self.logger.info(f"Loaded {len(self._locations)} vectors from {self.path}")
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool) -> Iterator[None]:
+        """
+        Lock the directory against other processes; reentrant under `self._lock`.
+        """
+        if self._lock_file is None or self._file_locked:
+            yield
+            return
+
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        self._file_locked = True
+        try:
+            yield
+        finally:
+            self._file_locked = False
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _read_version(self) -> int:
+        try:
+            with open(os.path.join(self.path, ".version")) as f:
+                return int(f.read() or 0)
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _signature(file_path: str) -> Tuple[int, int]:
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self) -> None:
+        """
+        Reload the partitions changed on disk since they were last read or written.
+        """
+        if not self.path or self._read_version() == self._version:
+            return
+
+        with self._file_lock(exclusive=False):
+            self._version = self._read_version()
+            on_disk = set()
+            for name in sorted(os.listdir(self.path)):
+                if not name.startswith("partition-") or not name.endswith(".json") or name.endswith(".tmp.json"):
+                    continue
+
+                file_path = os.path.join(self.path, name)
+                signature = self._signature(file_path)
+                with open(file_path) as f:
+                    meta = json.load(f)
+                key = meta["key"]
+                on_disk.add(key)
+                if self._signatures.get(key) == signature:
+                    continue
+                if key in self._dirty:
+                    self.logger.warning(f"Partition {key} changed on disk, keeping the unflushed local version")
+                    continue
+
+                vectors = np.load(f"{file_path[:-5]}.npy", mmap_mode="r")
+                partition = _Partition(vectors.shape[1])
+                partition.vectors = vectors
+                partition.size = len(meta["uuids"])
+                partition.uuids = meta["uuids"]
+                partition.properties = meta["properties"]
+
+                self._drop_partition(key)
+                if self.dimensions is None:
+                    self._set_dimensions(vectors.shape[1])
+                self._partitions[key] = partition
+                self._signatures[key] = signature
+                for row, uuid in enumerate(partition.uuids):
+                    self._locations[uuid] = (key, row)
+
+            for key in [key for key in self._signatures if key not in on_disk and key not in self._dirty]:
+                self._drop_partition(key)
+                del self._signatures[key]
+
+    def _drop_partition(self, key: Any) -> None:
+        partition = self._partitions.pop(key, None)
+        if partition is not None:
+            for uuid in partition.uuids:
+                if self._locations.get(uuid, (None,))[0] == key:
+                    del self._locations[uuid]
+
+    def _file_stem(self, key: Any) -> str:
+        return os.path.join(self.path, f"partition-{key}")
+
+    def flush(self) -> None:
+        """
+        Persist every partition changed since the last flush.
+        """
+        if not self.path:
+            self._dirty.clear()
+            return
+
+        with self._lock, self._file_lock(exclusive=True):
+            if not self._dirty:
+                return
+
+            # Pick up other processes' changes first, so the version written below is current
+            self._refresh()
+            for key in self._dirty:
+                stem = self._file_stem(key)
+                partition = self._partitions.get(key)
+                if partition is None or partition.size == 0:
+                    for suffix in (".npy", ".json"):
+                        if os.path.exists(stem + suffix):
+                            os.remove(stem + suffix)
+                    self._signatures.pop(key, None)
+                    continue
+
+                np.save(f"{stem}.tmp.npy", np.ascontiguousarray(partition.matrix()))
+                with open(f"{stem}.tmp.json", "w") as f:
+                    json.dump({"key": key, "uuids": partition.uuids, "properties": partition.properties}, f)
+                os.replace(f"{stem}.tmp.npy", f"{stem}.npy")
+                os.replace(f"{stem}.tmp.json", f"{stem}.json")
+                self._signatures[key] = self._signature(f"{stem}.json")
+
+            self._dirty.clear()
+            self._version = self._read_version() + 1
+            with open(os.path.join(self.path, ".version.tmp"), "w") as f:
+                f.write(str(self._version))
+            os.replace(os.path.join(self.path, ".version.tmp"), os.path.join(self.path, ".version"))
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        """
+        Hold both locks for a write, starting from the latest state on disk.
+        """
+        with self._lock, self._file_lock(exclusive=True):
+            self._refresh()
+            yield
+
+    def _set_dimensions(self, dimensions: int) -> None:
+        if self.quantization == "pq" and dimensions % self.pq_subspaces:
+            raise ValueError(
+                f"{dimensions} dimensions cannot be split into {self.pq_subspaces} product quantization subspaces"
+            )
+        self.dimensions = dimensions
+
+    def _prepare_vector(self, vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        if self.dimensions is None:
+            self._set_dimensions(array.shape[0])
+        elif array.shape != (self.dimensions,):
+            raise ValueError(f"Expected a vector with {self.dimensions} dimensions, got {array.shape}")
+
+        norm = np.linalg.norm(array)
+        return array / norm if norm > 0 else array
+
+    def _add(self, uuid: str, properties: Dict[str, Any], vector: List[float]) -> None:
+        if uuid in self._locations:
+            self._remove(uuid)
+
+        array = self._prepare_vector(vector)
+        key = properties.get(self.partition_key)
+        partition = self._partitions.get(key)
+        if partition is None:
+            partition = self._partitions[key] = _Partition(self.dimensions)
+
+        row = partition.append(uuid, dict(properties), array)
+        self._locations[uuid] = (key, row)
+        self._dirty.add(key)
+
+    def _remove(self, uuid: str) -> None:
+        key, row = self._locations.pop(uuid)
+        partition = self._partitions[key]
+        moved = partition.remove(row)
+        if moved is not None:
+            self._locations[moved] = (key, row)
+        if partition.size == 0:
+            del self._partitions[key]
+        self._dirty.add(key)
+
+    def _matches(self, filters: Optional[Dict[str, Any]]) -> List[Tuple[_Partition, Optional[np.ndarray]]]:
+        """
+        Resolve filters to partitions and, if needed, the matching row indices in each.
+        """
+        filters = dict(filters or {})
+        if self.partition_key in filters:
+            keys = filters.pop(self.partition_key)
+            keys = keys if isinstance(keys, (list, tuple, set)) else [keys]
+            partitions = [self._partitions[key] for key in keys if key in self._partitions]
+        else:
+            partitions = list(self._partitions.values())
+
+        if not filters:
+            return [(partition, None) for partition in partitions]
+
+        # List values match any of their items, like Weaviate's contains_any
+        tests = {
+            name: (lambda found, value=value: found in value)
+            if isinstance(value, (list, tuple, set)) else (lambda found, value=value: found == value)
+            for name, value in filters.items()
+        }
+        selected = []
+        for partition in partitions:
+            rows = np.fromiter(
+                (row for row, props in enumerate(partition.properties)
+                 if all(test(props.get(name)) for name, test in tests.items())),
+                dtype=np.int64,
+            )
+            if len(rows):
+                selected.append((partition, rows))
+        return selected
+
+    def _maybe_flush(self) -> None:
+        if self.autoflush and not self._deferred:
+            self.flush()
+
+    @contextmanager
+    def deferred_flush(self) -> Iterator[None]:
+        with self._lock:
+            self._deferred += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._deferred -= 1
+                self._maybe_flush()
+
+    def insert(self, properties: Dict[str, Any], vector: List[float]) -> str:
+        uuid = str(uuid_lib.uuid4())
+        with self._writing():
+            self._add(uuid, properties, vector)
+            self._maybe_flush()
+        return uuid
+
+    def bulk_insert(self, objects: Iterable[VectorObject], batch_size: int = 100,
+                    concurrency: int = 2) -> Dict[str, str]:
+        failed: Dict[str, str] = {}
+        objects = iter(objects)
+        # The objects are often produced lazily (embedded on the fly), so each batch is
+        # collected before taking the lock and readers are only blocked while it is added
+        while batch := list(islice(objects, max(batch_size, 1))):
+            with self._writing():
+                for obj in batch:
+                    try:
+                        self._add(str(obj.uuid), obj.properties, obj.vector)
+                    except Exception as e:
+                        failed[str(obj.uuid)] = str(e)
+                self._maybe_flush()
+        return failed
+
+    def search(self, vector: List[float], limit: int = 5,
+               filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+        if limit < 1 or self.dimensions is None:
+            return []
+
+        query = self._prepare_vector(vector)
+        candidates = []
+        with self._lock:
+            for partition, rows in self._matches(filters):
+                for score, row in self._top_rows(partition, rows, query, limit):
+                    candidates.append((score, partition.uuids[row], partition.properties[row]))
+
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        return [
+            {"uuid": uuid, "similarity": round(score, 4), **properties}
+            for score, uuid, properties in candidates[:limit]
+        ]
+
+    def hybrid_search(self, query_text: str, vector: List[float], alpha: float = 0.5, limit: int = 5,
+                      filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+        if limit < 1 or self.dimensions is None:
+            return []
+
+        query = self._prepare_vector(vector)
+        candidates = []
+        with self._lock:
+            for partition, rows in self._matches(filters):
+                if partition.lexical is None:
+                    partition.lexical = BM25Index(
+                        str(props.get(self.text_property) or "") for props in partition.properties
+                    )
+
+                keyword_scores = partition.lexical.scores(query_text)
+                if rows is not None:
+                    keyword_scores = keyword_scores[rows]
+
+                # Union of the best rows by each signal, as a wide candidate set for fusion
+                top = {row: score for score, row in self._top_rows(partition, rows, query, limit)}
+                for index in np.argsort(-keyword_scores)[:limit].tolist():
+                    row = index if rows is None else int(rows[index])
+                    if keyword_scores[index] > 0 and row not in top:
+                        top[row] = float(partition.vectors[row] @ query)
+                keyword_by_row = keyword_scores if rows is None else dict(zip(rows.tolist(), keyword_scores.tolist()))
+                for row, similarity in top.items():
+                    candidates.append((similarity, float(keyword_by_row[row]), partition, row))
+
+        if not candidates:
+            return []
+
+        vector_norm = self._min_max([candidate[0] for candidate in candidates])
+        keyword_norm = self._min_max([candidate[1] for candidate in candidates])
+        fused = sorted(
+            (
+                (alpha * vector_norm[i] + (1 - alpha) * keyword_norm[i], candidate)
+                for i, candidate in enumerate(candidates)
+            ),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        return [
+            {
+                "uuid": partition.uuids[row],
+                "score": round(score, 4),
+                "similarity": round(similarity, 4),
+                **partition.properties[row],
+            }
+            for score, (similarity, _, partition, row) in fused[:limit]
+        ]
+
+    def _top_rows(self, partition: _Partition, rows: Optional[np.ndarray], query: np.ndarray,
+                  limit: int) -> List[Tuple[float, int]]:
+        """
+        Best `limit` rows of a partition by cosine similarity, as (similarity, row) pairs.
+
+        Without quantization, or before the partition's quantizer is trained, this is an
+        exact scan. With it, the codes are scanned (rows written since the training are
+        scored exactly) and the best `limit * rerank_factor` rows are rescored against the
+        full-precision vectors.
+        """
+        quantized = self.quantization != "none" and partition.quantizer is not None
+        if self.quantization != "none":
+            self._schedule_training(partition)
+
+        if not quantized:
+            scores = partition.matrix() @ query if rows is None else partition.matrix()[rows] @ query
+            shortlist = limit
+        else:
+            scores = np.zeros(partition.size, dtype=np.float32)
+            coded = partition.quantizer.scores(query)[:partition.size]
+            scores[:len(coded)] = coded
+            if partition.stale:
+                stale = np.fromiter(partition.stale, dtype=np.int64)
+                scores[stale] = partition.vectors[stale] @ query
+            if rows is not None:
+                scores = scores[rows]
+            shortlist = limit * self.rerank_factor
+
+        top = np.argpartition(-scores, shortlist - 1)[:shortlist] if len(scores) > shortlist else np.arange(len(scores))
+        selected = top if rows is None else rows[top]
+        if quantized:
+            selected = np.sort(selected)  # Sequential reads from the memory map
+            exact = partition.vectors[selected] @ query
+            best = np.argsort(-exact)[:limit]
+            return [(float(exact[index]), int(selected[index])) for index in best]
+        return [(float(scores[index]), int(row)) for index, row in zip(top, selected)]
+
+    def _needs_training(self, partition: _Partition) -> bool:
+        if partition.quantizer is None:
+            return partition.size > 0
+        return len(partition.stale) >= max(1, min(self.retrain_writes, partition.size // 10))
+
+    def _schedule_training(self, partition: _Partition) -> None:
+        """
+        Train the partition's quantizer in the background if it is missing or stale.
+        """
+        if partition in self._training or not self._needs_training(partition):
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quantizer")
+        self._training[partition] = self._executor.submit(self._train, partition)
+
+    def _train(self, partition: _Partition) -> None:
+        try:
+            with self._lock:
+                if not any(live is partition for live in self._partitions.values()):
+                    return
+                # Appends only write past these rows and removals copy first, so k-means
+                # can read them without the lock
+                vectors = partition.matrix()
+                partition.shared = True
+                partition.training = set()
+
+            quantizer = make_quantizer(self.quantization, self.pq_subspaces).fit(vectors)
+
+            with self._lock:
+                partition.quantizer = quantizer
+                partition.stale = {row for row in partition.training if row < partition.size}
+        except Exception as e:
+            self.logger.error(f"Error training the {self.quantization} quantizer: {e}")
+        finally:
+            with self._lock:
+                partition.shared = False
+                partition.training = None
+                self._training.pop(partition, None)
+
+    def train_quantizers(self) -> None:
+        """
+        Train every missing or stale quantizer now, e.g. after a bulk load and before
+        serving searches.
+        """
+        if self.quantization == "none":
+            return
+
+        with self._lock:
+            self._refresh()
+            pending = list(self._training.values())
+            partitions = list(self._partitions.values())
+        for future in pending:
+            future.result()
+        for partition in partitions:
+            if self._needs_training(partition):
+                self._train(partition)
+
+    @staticmethod
+    def _min_max(values: List[float]) -> List[float]:
+        low, high = min(values), max(values)
+        if high == low:
+            return [1.0 if high > 0 else 0.0] * len(values)
+        return [(value - low) / (high - low) for value in values]
+
+    def fetch(self, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+              sort_by: Optional[str] = None, descending: bool = False) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+            results = [
+                {"uuid": partition.uuids[row], **partition.properties[row]}
+                for partition, rows in self._matches(filters)
+                for row in (range(partition.size) if rows is None else rows)
+            ]
+
+        if sort_by:
+            results.sort(key=lambda result: result.get(sort_by), reverse=descending)
+        return results[:limit] if limit is not None else results
+
+    def iterate(self, filters: Optional[Dict[str, Any]] = None, page_size: int = 100,
+                order_by: Optional[str] = None, properties: Optional[List[str]] = None,
+                include_vector: bool = False) -> Iterator[VectorObject]:
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+
+        # Snapshot only the UUIDs in walk order; objects are read page by page
+        with self._lock:
+            self._refresh()
+            matches = [
+                (partition.properties[row].get(order_by) if order_by else None, partition.uuids[row])
+                for partition, rows in self._matches(filters)
+                for row in (range(partition.size) if rows is None else rows)
+            ]
+        if order_by:
+            matches.sort(key=lambda match: match[0])
+
+        for start in range(0, len(matches), page_size):
+            with self._lock:
+                page = []
+                for _, object_uuid in matches[start:start + page_size]:
+                    location = self._locations.get(object_uuid)
+                    if location is None:
+                        continue
+                    partition = self._partitions[location[0]]
+                    props = partition.properties[location[1]]
+                    if properties is not None:
+                        props = {name: props[name] for name in properties if name in props}
+                    vector = partition.vectors[location[1]].tolist() if include_vector else None
+                    page.append(VectorObject(uuid=object_uuid, properties=dict(props), vector=vector))
+            yield from page
+
+    def update(self, uuid: str, properties: Dict[str, Any], vector: Optional[List[float]] = None) -> None:
+        with self._writing():
+            key, row = self._locations[uuid]
+            partition = self._partitions[key]
+            merged = {**partition.properties[row], **properties}
+
+            if vector is None and merged.get(self.partition_key) == key:
+                partition.properties[row] = merged
+                partition.lexical = None
+                self._dirty.add(key)
+            else:
+                stored = partition.matrix()[row].copy() if vector is None else vector
+                self._add(uuid, merged, stored)
+
+            self._maybe_flush()
+
+    def delete(self, uuid: str) -> None:
+        with self._writing():
+            self._remove(uuid)
+            self._maybe_flush()
+
+    def delete_by_filter(self, filters: Dict[str, Any]) -> int:
+        with self._writing():
+            uuids = [
+                partition.uuids[row]
+                for partition, rows in self._matches(filters)
+                for row in (range(partition.size) if rows is None else rows)
+            ]
+            for uuid in uuids:
+                self._remove(uuid)
+            self._maybe_flush()
+        return len(uuids)
+
+    def reserve_ids(self, name: str, count: int, seed: Callable[[], int]) -> range:
+        """
+        Reserve a block of consecutive IDs from a named counter kept with the store.
+
+        A persisted store keeps its counters in `counters.json` next to the partitions and
+        updates them under the exclusive file lock, so processes sharing the path never
+        reserve overlapping blocks.
+
+        Args:
+            name: Counter name
+            count: Number of IDs to reserve
+            seed: Returns the next free ID; only called when the counter does not exist yet
+
+        Returns:
+            The reserved IDs
+        """
+        with self._writing():
+            counters = self._counters
+            counters_path = os.path.join(self.path, "counters.json") if self.path else None
+            if counters_path and os.path.exists(counters_path):
+                with open(counters_path) as f:
+                    counters = json.load(f)
+
+            start = counters[name] if name in counters else seed()
+            counters[name] = start + count
+            if counters_path:
+                with open(f"{counters_path}.tmp", "w") as f:
+                    json.dump(counters, f)
+                os.replace(f"{counters_path}.tmp", counters_path)
+        return range(start, start + count)
+
+    def is_ready(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._training.clear()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
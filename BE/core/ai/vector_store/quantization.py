@@ -0,0 +1,153 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import numpy as np
+
+# Rows scored per step when decoding compressed codes, bounding the float32 scratch memory
+SCORE_BLOCK_ROWS = 65536
+
+
+class Quantizer(ABC):
+    """
+    Compressed, in-memory copy of a partition's L2-normalized vectors.
+
+    Scores are approximate dot products with the query; callers rerank the best
+    candidates against the full-precision vectors.
+    """
+
+    @abstractmethod
+    def fit(self, vectors: np.ndarray) -> "Quantizer":
+        """Train on and encode the vectors (rows of a float32 matrix)"""
+
+    @abstractmethod
+    def scores(self, query: np.ndarray) -> np.ndarray:
+        """Approximate dot product of every encoded vector with the query"""
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        """Memory held by the codes and any codebook"""
+
+
+class Int8Quantizer(Quantizer):
+    """
+    Scalar quantization of every component to int8 (4x smaller than float32).
+
+    Components of normalized vectors lie in [-1, 1], so one symmetric scale per
+    dimension, fitted to the largest magnitude seen, keeps the rounding error small.
+    """
+
+    def __init__(self):
+        self.scale: Optional[np.ndarray] = None
+        self.codes: Optional[np.ndarray] = None
+
+    def fit(self, vectors: np.ndarray) -> "Int8Quantizer":
+        peak = np.abs(vectors).max(axis=0) if len(vectors) else np.ones(vectors.shape[1], dtype=np.float32)
+        self.scale = (np.maximum(peak, 1e-8) / 127).astype(np.float32)
+        self.codes = np.clip(np.rint(vectors / self.scale), -127, 127).astype(np.int8)
+        return self
+
+    def scores(self, query: np.ndarray) -> np.ndarray:
+        weights = (query * self.scale).astype(np.float32)
+        out = np.empty(len(self.codes), dtype=np.float32)
+        for start in range(0, len(self.codes), SCORE_BLOCK_ROWS):
+            block = self.codes[start:start + SCORE_BLOCK_ROWS]
+            out[start:start + len(block)] = block.astype(np.float32) @ weights
+        return out
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.scale.nbytes
+
+
+class ProductQuantizer(Quantizer):
+    """
+    Product quantization: each vector is split into `subspaces` slices and every slice is
+    replaced by the index of its nearest of up to 256 k-means centroids (one byte).
+
+    With 1536 dimensions and 64 subspaces a vector takes 64 bytes instead of 6 KB; 64
+    also divides the reduced sizes 256, 512 and 1024.
+    Scoring uses asymmetric distance computation: the query is compared with every
+    centroid once, then each vector's score is a sum of table lookups.
+    """
+
+    def __init__(self, subspaces: int = 64, iterations: int = 12, sample_size: int = 20000, seed: int = 0):
+        self.subspaces = subspaces
+        self.iterations = iterations
+        self.sample_size = sample_size
+        self.seed = seed
+        self.centroids: Optional[np.ndarray] = None
+        self.codes: Optional[np.ndarray] = None
+
+    def fit(self, vectors: np.ndarray) -> "ProductQuantizer":
+        count, dimensions = vectors.shape
+        if dimensions % self.subspaces:
+            raise ValueError(f"{dimensions} dimensions cannot be split into {self.subspaces} subspaces")
+
+        width = dimensions // self.subspaces
+        clusters = max(1, min(256, count))
+        rng = np.random.default_rng(self.seed)
+        sample = vectors[rng.choice(count, size=min(count, self.sample_size), replace=False)] if count else vectors
+
+        self.centroids = np.empty((self.subspaces, clusters, width), dtype=np.float32)
+        self.codes = np.empty((count, self.subspaces), dtype=np.uint8)
+        for subspace in range(self.subspaces):
+            columns = slice(subspace * width, (subspace + 1) * width)
+            centroids = self._kmeans(np.ascontiguousarray(sample[:, columns]), clusters, rng)
+            self.centroids[subspace] = centroids
+            for start in range(0, count, SCORE_BLOCK_ROWS):
+                block = np.asarray(vectors[start:start + SCORE_BLOCK_ROWS, columns], dtype=np.float32)
+                self.codes[start:start + len(block), subspace] = self._nearest(block, centroids)
+        return self
+
+    def _kmeans(self, data: np.ndarray, clusters: int, rng: np.random.Generator) -> np.ndarray:
+        if len(data) == 0:
+            return np.zeros((clusters, data.shape[1]), dtype=np.float32)
+
+        centroids = data[rng.choice(len(data), size=clusters, replace=False)].copy()
+        for _ in range(self.iterations):
+            assignment = self._nearest(data, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, data)
+            counts = np.bincount(assignment, minlength=clusters)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+        return centroids
+
+    @staticmethod
+    def _nearest(data: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        distances = (centroids ** 2).sum(axis=1)[None, :] - 2 * data @ centroids.T
+        return distances.argmin(axis=1).astype(np.uint8)
+
+    def scores(self, query: np.ndarray) -> np.ndarray:
+        width = self.centroids.shape[2]
+        # Lookup table of every centroid's dot product with the matching query slice
+        table = np.einsum("skw,sw->sk", self.centroids, query.reshape(self.subspaces, width))
+        out = np.zeros(len(self.codes), dtype=np.float32)
+        for subspace in range(self.subspaces):
+            out += table[subspace, self.codes[:, subspace]]
+        return out
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.centroids.nbytes
+
+
+def make_quantizer(kind: str, subspaces: int = 64) -> Optional[Quantizer]:
+    """
+    Create a quantizer by name.
+
+    Args:
+        kind: "none", "int8" or "pq"
+        subspaces: Number of product quantization subspaces (must divide the dimensions)
+
+    Returns:
+        A new quantizer, or None for full-precision search
+    """
+    if kind == "none":
+        return None
+    if kind == "int8":
+        return Int8Quantizer()
+    if kind == "pq":
+        return ProductQuantizer(subspaces=subspaces)
+    raise ValueError(f"Unknown vector quantization: {kind}")
@@ -0,0 +1,51 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from core.ai.vector_store.base import AsyncVectorStore, VectorStore
+
+
+class ThreadedVectorStore(AsyncVectorStore):
+    """
+    AsyncVectorStore adapter that runs a synchronous VectorStore in worker threads.
+
+    Used for backends without a native asyncio client, such as the in-process NumPy store.
+    """
+
+    def __init__(self, store: VectorStore):
+        """
+        Wrap a synchronous store.
+
+        Args:
+            store: The VectorStore to delegate to
+        """
+        self.store = store
+
+    async def insert(self, properties: Dict[str, Any], vector: List[float]) -> str:
+        return await asyncio.to_thread(self.store.insert, properties, vector)
+
+    async def search(self, vector: List[float], limit: int = 5,
+                     filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.store.search, vector, limit, filters)
+
+    async def hybrid_search(self, query_text: str, vector: List[float], alpha: float = 0.5, limit: int = 5,
+                            filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.store.hybrid_search, query_text, vector, alpha, limit, filters)
+
+    async def fetch(self, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+                    sort_by: Optional[str] = None, descending: bool = False) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.store.fetch, filters, limit, sort_by, descending)
+
+    async def update(self, uuid: str, properties: Dict[str, Any], vector: Optional[List[float]] = None) -> None:
+        await asyncio.to_thread(self.store.update, uuid, properties, vector)
+
+    async def delete(self, uuid: str) -> None:
+        await asyncio.to_thread(self.store.delete, uuid)
+
+    async def delete_by_filter(self, filters: Dict[str, Any]) -> int:
+        return await asyncio.to_thread(self.store.delete_by_filter, filters)
+
+    async def is_ready(self) -> bool:
+        return await asyncio.to_thread(self.store.is_ready)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self.store.close)
@@ -0,0 +1,378 @@
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import weaviate
+import weaviate.classes.query as wq
+from weaviate.auth import Auth
+from weaviate.classes.config import Property
+from weaviate.classes.query import Filter
+
+from core.ai.vector_store.base import AsyncVectorStore, VectorObject, VectorStore
+from core.config import config
+
+# Headers for OpenAI integration with Weaviate
+headers = {
+    "X-OpenAI-Api-Key": config.OPENAI_API_KEY,
+}
+
+
+class WeaviateVectorStore(VectorStore):
+    """
+    VectorStore backed by a Weaviate Cloud collection.
+    """
+
+    def __init__(self, weaviate_url: str, collection_name: str, properties: List[Dict[str, Any]]):
+        """
+        Connect to Weaviate and make sure the collection exists.
+
+        Args:
+            weaviate_url: URL to the Weaviate instance
+            collection_name: Name of the collection to store objects in
+            properties: Property schema used when the collection has to be created
+        """
+        self.logger = logging.getLogger(__name__)
+        self.collection_name = collection_name
+        self.properties = properties
+        self.client = None
+        self.collection = None
+
+        # Connect to the Weaviate instance
+        self._connect_to_weaviate(weaviate_url)
+
+        # Ensure the schema exists
+        self._ensure_schema_exists()
+
+    def _connect_to_weaviate(self, weaviate_url: str) -> None:
+        """
+        Connect to Weaviate and verify the connection.
+
+        Args:
+            weaviate_url: URL to the Weaviate instance
+
+        Raises:
+            Exception: If connection fails
+        """
+        try:
+            self.client = weaviate.connect_to_weaviate_cloud(
+                cluster_url=weaviate_url,
+                auth_credentials=Auth.api_key(config.WEAVIATE_API_KEY),
+                headers=headers,
+            )
+
+            # Verify connection by checking if the client is alive
+            if not self.client.is_ready():
+                raise ConnectionError("Weaviate server is not ready")
+
+            self.logger.info(f"Successfully connected to Weaviate at {weaviate_url}")
+        except Exception as e:
+            self.logger.error(f"Failed to connect to Weaviate: {e}")
+            raise
+
+    def _ensure_schema_exists(self) -> None:
+        """
+        Check if the collection exists, if not create it with the required schema.
+        """
+        try:
+            collections = self.client.collections.list_all()
+
+            if self.collection_name not in collections:
+                self.logger.info(f"Creating collection '{self.collection_name}'")
+                self.client.collections.create(name=self.collection_name, properties=self.properties)
+                self.logger.info(f"Collection '{self.collection_name}' created successfully")
+            else:
+                self.logger.info(f"Collection '{self.collection_name}' already exists")
+
+            # Get a reference to the collection for subsequent operations
+            self.collection = self.client.collections.get(self.collection_name)
+
+            # Add properties introduced after the collection was created
+            existing = {prop.name for prop in self.collection.config.get().properties}
+            for prop in self.properties:
+                if prop["name"] not in existing:
+                    self.logger.info(f"Adding property '{prop['name']}' to '{self.collection_name}'")
+                    self.collection.config.add_property(Property(**prop))
+
+        except Exception as e:
+            self.logger.error(f"Error ensuring schema exists: {e}")
+            raise
+
+    @staticmethod
+    def build_filters(filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """
+        Build a Weaviate filter from property/value pairs.
+        Multiple filters are combined with AND operators; a list value matches any of its items.
+
+        Args:
+            filters: Key-value pairs where key is the property name and value is the value to filter by
+
+        Returns:
+            Weaviate Filter object or None if no filters provided
+        """
+        if not filters:
+            return None
+
+        combined_filter = None
+
+        for key, value in filters.items():
+            if isinstance(value, (list, tuple, set)):
+                current_filter = Filter.by_property(key).contains_any(list(value))
+            else:
+                current_filter = Filter.by_property(key).equal(value)
+
+            if combined_filter is None:
+                combined_filter = current_filter
+            else:
+                combined_filter = combined_filter & current_filter
+
+        return combined_filter
+
+    @staticmethod
+    def _to_dict(obj) -> Dict[str, Any]:
+        return {"uuid": obj.uuid, **obj.properties}
+
+    def insert(self, properties: Dict[str, Any], vector: List[float]) -> str:
+        return self.collection.data.insert(properties=properties, vector=vector)
+
+    def bulk_insert(self, objects: Iterable[VectorObject], batch_size: int = 100,
+                    concurrency: int = 2) -> Dict[str, str]:
+        with self.collection.batch.fixed_size(batch_size=batch_size, concurrent_requests=concurrency) as batch:
+            for obj in objects:
+                batch.add_object(properties=obj.properties, vector=obj.vector, uuid=obj.uuid)
+
+        return {str(failed.object_.uuid): failed.message for failed in self.collection.batch.failed_objects}
+
+    def search(self, vector: List[float], limit: int = 5,
+               filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        response = self.collection.query.near_vector(
+            near_vector=vector,
+            filters=self.build_filters(filters),
+            limit=limit,
+            return_metadata=wq.MetadataQuery(distance=True),
+        )
+
+        results = []
+        for obj in response.objects:
+            # Convert cosine distance to a similarity score
+            similarity = 1 - obj.metadata.distance
+            results.append({"uuid": obj.uuid, "similarity": round(similarity, 4), **obj.properties})
+        return results
+
+    def hybrid_search(self, query_text: str, vector: List[float], alpha: float = 0.5, limit: int = 5,
+                      filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        response = self.collection.query.hybrid(
+            query=query_text,
+            vector=vector,
+            alpha=alpha,
+            limit=limit,
+            filters=self.build_filters(filters),
+            fusion_type=wq.HybridFusion.RELATIVE_SCORE,
+            return_metadata=wq.MetadataQuery(score=True),
+        )
+        return [{"uuid": obj.uuid, "score": round(obj.metadata.score, 4), **obj.properties} for obj in response.objects]
+
+    def fetch(self, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+              sort_by: Optional[str] = None, descending: bool = False) -> List[Dict[str, Any]]:
+        response = self.collection.query.fetch_objects(
+            filters=self.build_filters(filters),
+            limit=limit,
+            sort=wq.Sort.by_property(name=sort_by, ascending=not descending) if sort_by else None,
+        )
+        return [self._to_dict(obj) for obj in response.objects]
+
+    def iterate(self, filters: Optional[Dict[str, Any]] = None, page_size: int = 100,
+                order_by: Optional[str] = None, properties: Optional[List[str]] = None,
+                include_vector: bool = False) -> Iterator[VectorObject]:
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        if filters and not order_by:
+            # Weaviate's `after` cursor cannot be combined with filters or sorting
+            raise ValueError("Filtered iteration needs a unique order_by property")
+
+        return_properties = None
+        if properties is not None:
+            return_properties = list(dict.fromkeys([*properties, *([order_by] if order_by else [])]))
+
+        base_filter = self.build_filters(filters)
+        after = None
+        last_value = None
+        while True:
+            if order_by:
+                page_filter = base_filter
+                if last_value is not None:
+                    keyset = Filter.by_property(order_by).greater_than(last_value)
+                    page_filter = keyset if page_filter is None else page_filter & keyset
+                response = self.collection.query.fetch_objects(
+                    filters=page_filter,
+                    limit=page_size,
+                    sort=wq.Sort.by_property(name=order_by, ascending=True),
+                    return_properties=return_properties,
+                    include_vector=include_vector,
+                )
+            else:
+                response = self.collection.query.fetch_objects(
+                    after=after,
+                    limit=page_size,
+                    return_properties=return_properties,
+                    include_vector=include_vector,
+                )
+
+            for obj in response.objects:
+                vector = obj.vector.get("default") if include_vector and obj.vector else None
+                yield VectorObject(uuid=str(obj.uuid), properties=dict(obj.properties), vector=vector)
+
+            if len(response.objects) < page_size:
+                return
+            last = response.objects[-1]
+            after = last.uuid
+            if order_by:
+                last_value = last.properties[order_by]
+
+    def update(self, uuid: str, properties: Dict[str, Any], vector: Optional[List[float]] = None) -> None:
+        if vector is not None:
+            self.collection.data.update(uuid=uuid, properties=properties, vector=vector)
+        else:
+            self.collection.data.update(uuid=uuid, properties=properties)
+
+    def delete(self, uuid: str) -> None:
+        self.collection.data.delete_by_id(uuid)
+
+    def delete_by_filter(self, filters: Dict[str, Any]) -> int:
+        result = self.collection.data.delete_many(where=self.build_filters(filters))
+        return result.successful
+
+    def is_ready(self) -> bool:
+        try:
+            return self.client is not None and self.client.is_ready()
+        except Exception as e:
+            self.logger.warning(f"Weaviate readiness probe failed: {e}")
+            return False
+
+    def close(self) -> None:
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+            self.logger.info("Weaviate client connection closed properly")
+
+
+class AsyncWeaviateVectorStore(AsyncVectorStore):
+    """
+    AsyncVectorStore backed by a Weaviate Cloud collection through the asyncio client.
+
+    Create it with `await AsyncWeaviateVectorStore.connect(...)`.
+    """
+
+    def __init__(self, client: weaviate.WeaviateAsyncClient, collection_name: str):
+        """
+        Wrap a connected async client.
+
+        Args:
+            client: Connected Weaviate async client
+            collection_name: Name of the collection to store objects in
+        """
+        self.logger = logging.getLogger(__name__)
+        self.client = client
+        self.collection_name = collection_name
+        self.collection = client.collections.get(collection_name)
+
+    @classmethod
+    async def connect(cls, weaviate_url: str, collection_name: str,
+                      properties: List[Dict[str, Any]]) -> "AsyncWeaviateVectorStore":
+        """
+        Connect to Weaviate and make sure the collection exists.
+
+        Args:
+            weaviate_url: URL to the Weaviate instance
+            collection_name: Name of the collection to store objects in
+            properties: Property schema used when the collection has to be created
+
+        Returns:
+            A connected store
+
+        Raises:
+            Exception: If connection fails
+        """
+        logger = logging.getLogger(__name__)
+        client = weaviate.use_async_with_weaviate_cloud(
+            cluster_url=weaviate_url,
+            auth_credentials=Auth.api_key(config.WEAVIATE_API_KEY),
+            headers=headers,
+        )
+        try:
+            await client.connect()
+            if not await client.is_ready():
+                raise ConnectionError("Weaviate server is not ready")
+
+            if not await client.collections.exists(collection_name):
+                logger.info(f"Creating collection '{collection_name}'")
+                await client.collections.create(name=collection_name, properties=properties)
+
+            logger.info(f"Successfully connected async client to Weaviate at {weaviate_url}")
+            return cls(client, collection_name)
+        except Exception as e:
+            logger.error(f"Failed to connect async client to Weaviate: {e}")
+            await client.close()
+            raise
+
+    async def insert(self, properties: Dict[str, Any], vector: List[float]) -> str:
+        return await self.collection.data.insert(properties=properties, vector=vector)
+
+    async def search(self, vector: List[float], limit: int = 5,
+                     filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        response = await self.collection.query.near_vector(
+            near_vector=vector,
+            filters=WeaviateVectorStore.build_filters(filters),
+            limit=limit,
+            return_metadata=wq.MetadataQuery(distance=True),
+        )
+        return [
+            {"uuid": obj.uuid, "similarity": round(1 - obj.metadata.distance, 4), **obj.properties}
+            for obj in response.objects
+        ]
+
+    async def hybrid_search(self, query_text: str, vector: List[float], alpha: float = 0.5, limit: int = 5,
+                            filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        response = await self.collection.query.hybrid(
+            query=query_text,
+            vector=vector,
+            alpha=alpha,
+            limit=limit,
+            filters=WeaviateVectorStore.build_filters(filters),
+            fusion_type=wq.HybridFusion.RELATIVE_SCORE,
+            return_metadata=wq.MetadataQuery(score=True),
+        )
+        return [{"uuid": obj.uuid, "score": round(obj.metadata.score, 4), **obj.properties} for obj in response.objects]
+
+    async def fetch(self, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+                    sort_by: Optional[str] = None, descending: bool = False) -> List[Dict[str, Any]]:
+        response = await self.collection.query.fetch_objects(
+            filters=WeaviateVectorStore.build_filters(filters),
+            limit=limit,
+            sort=wq.Sort.by_property(name=sort_by, ascending=not descending) if sort_by else None,
+        )
+        return [{"uuid": obj.uuid, **obj.properties} for obj in response.objects]
+
+    async def update(self, uuid: str, properties: Dict[str, Any], vector: Optional[List[float]] = None) -> None:
+        if vector is not None:
+            await self.collection.data.update(uuid=uuid, properties=properties, vector=vector)
+        else:
+            await self.collection.data.update(uuid=uuid, properties=properties)
+
+    async def delete(self, uuid: str) -> None:
+        await self.collection.data.delete_by_id(uuid)
+
+    async def delete_by_filter(self, filters: Dict[str, Any]) -> int:
+        result = await self.collection.data.delete_many(where=WeaviateVectorStore.build_filters(filters))
+        return result.successful
+
+    async def is_ready(self) -> bool:
+        try:
+            return self.client is not None and await self.client.is_ready()
+        except Exception as e:
+            self.logger.warning(f"Weaviate readiness probe failed: {e}")
+            return False
+
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+            self.logger.info("Weaviate async client connection closed properly")
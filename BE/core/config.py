@@ -1,6 +1,9 @@
 import os
+from typing import Dict, Optional
+
 import dotenv
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 dotenv.load_dotenv()
@@ -31,6 +34,72 @@ class Config(BaseSettings):
     AWS_S3_ENDPOINT_URL: str = os.getenv("AWS_S3_ENDPOINT_URL")
     WEAVIATE_API_KEY: str = os.getenv("WEAVIATE_API_KEY")
     WEAVIATE_URL: str = os.getenv("WEAVIATE_URL")
+    VECTOR_STORE_BACKEND: str = "weaviate"
+    VECTOR_STORE_PATH: str = ""
+    VECTOR_STORE_QUANTIZATION: str = "none"
+    VECTOR_STORE_PQ_SUBSPACES: int = 64
+    VECTOR_STORE_RERANK_FACTOR: int = 4
+    VECTOR_STORE_RETRAIN_WRITES: int = 1000
+    METRICS_ENABLED: bool = True
+    LLM_CHAT_MODEL: str = "gpt-4o-mini"
+    LLM_INTENT_MODEL: str = "gpt-4o-mini"
+    LLM_SUMMARY_MODEL: str = "gpt-4o-mini"
+    LLM_TIMEOUT: float = 30.0
+    LLM_MAX_RETRIES: int = 2
+    LLM_MAX_CONNECTIONS: int = 100
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_KEEPALIVE_EXPIRY: float = 30.0
+    LLM_GLOBAL_CONCURRENCY: int = 32
+    LLM_COURSE_CONCURRENCY: int = 4
+    LLM_QUEUE_TIMEOUT: float = 30.0
+    SUMMARY_CHUNK_TOKENS: int = 4000
+    SUMMARY_CHUNK_OVERLAP_TOKENS: int = 100
+    SUMMARY_MAX_CONCURRENCY: int = 8
+    SUMMARY_TREE_FAN_IN: int = 4
+    SUMMARY_TREE_MAX_DEPTH: int = 5
+    SUMMARY_CACHE_TTL: int = 30 * 86400
+    SUMMARY_TASK_QUEUE: str = "summaries"
+    SUMMARY_TASK_RATE_LIMIT: str = "6/m"
+    SUMMARY_TASK_MAX_RETRIES: int = 3
+    SUMMARY_JOB_TTL: int = 7 * 86400
+    CATALOG_CACHE_TTL: int = 3600
+    RETRIEVAL_TOP_K: int = 3
+    RETRIEVAL_ALPHA: float = 0.5
+    RETRIEVAL_CANDIDATE_MULTIPLIER: int = 4
+    RETRIEVAL_RERANK_WEIGHT: float = 0.2
+    EMBEDDING_MODEL: str = "text-embedding-3-small"
+    EMBEDDING_DIMENSIONS: Optional[int] = None
+    EMBEDDING_CACHE_SIZE: int = 10000
+    EMBEDDING_CACHE_TTL: int = 60 * 60 * 24 * 7
+    ANSWER_CACHE_ENABLED: bool = True
+    ANSWER_CACHE_THRESHOLD: float = 0.95
+    ANSWER_CACHE_TTL: int = 60 * 60 * 24
+    ANSWER_CACHE_MAX_ENTRIES: int = 1000
+    ANSWER_CACHE_LOCAL_COURSES: int = 64
+    CHAT_SPECULATIVE_RETRIEVAL: bool = True
+    CHAT_HISTORY_TOKEN_BUDGET: int = 1500
+    CHAT_HISTORY_MODEL_TOKEN_BUDGETS: Dict[str, int] = {}
+    CHAT_HISTORY_RECENT_TURNS: int = 6
+    CHAT_HISTORY_SUMMARY_TOKENS: int = 300
+    CHAT_HISTORY_REFRESH_TURNS: int = 4
+    CHAT_HISTORY_TTL: int = 60 * 60 * 24
+    INTENT_FAST_PATH_ENABLED: bool = True
+    INTENT_CENTROID_THRESHOLD: float = 0.5
+    INTENT_CENTROID_MARGIN: float = 0.08
+
+    @model_validator(mode="after")
+    def check_product_quantization(self) -> "Config":
+        # Fail at startup rather than at the first search of the numpy backend
+        if (
+            self.VECTOR_STORE_QUANTIZATION == "pq"
+            and self.EMBEDDING_DIMENSIONS
+            and self.EMBEDDING_DIMENSIONS % self.VECTOR_STORE_PQ_SUBSPACES
+        ):
+            raise ValueError(
+                f"EMBEDDING_DIMENSIONS={self.EMBEDDING_DIMENSIONS} is not divisible by "
+                f"VECTOR_STORE_PQ_SUBSPACES={self.VECTOR_STORE_PQ_SUBSPACES}"
+            )
+        return self
 
 
 class TestConfig(Config):
@@ -1,5 +1,5 @@
 from .cache_manager import Cache
-from .cache_tag import CacheTag
+from .cache_tag import CATALOG_TAGS, CacheTag
 from .custom_key_maker import CustomKeyMaker
 from .redis_backend import RedisBackend
 
@@ -8,4 +8,5 @@ __all__ = [
     "RedisBackend",
     "CustomKeyMaker",
     "CacheTag",
+    "CATALOG_TAGS",
 ]
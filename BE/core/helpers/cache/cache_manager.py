@@ -1,8 +1,11 @@
+import logging
 from functools import wraps
 
 from .base import BaseBackend, BaseKeyMaker
 from .cache_tag import CacheTag
 
+logger = logging.getLogger(__name__)
+
 
 class CacheManager:
     def __init__(self):
@@ -29,13 +32,24 @@ class CacheManager:
                 key = await self.key_maker.make(
                     function=function,
                     prefix=prefix if prefix else tag.value,
+                    args=args,
+                    kwargs=kwargs,
                 )
-                cached_response = await self.backend.get(key=key)
-                if cached_response:
+                # The cache is an optimisation: when the backend fails, serve from the source
+                try:
+                    cached_response = await self.backend.get(key=key)
+                except Exception as e:
+                    logger.warning(f"Cache read failed for {key}: {e}")
+                    cached_response = None
+                # Empty results such as [] are cached too
+                if cached_response is not None:
                     return cached_response
 
                 response = await function(*args, **kwargs)
-                await self.backend.set(response=response, key=key, ttl=ttl)
+                try:
+                    await self.backend.set(response=response, key=key, ttl=ttl)
+                except Exception as e:
+                    logger.warning(f"Cache write failed for {key}: {e}")
                 return response
 
             return __cached
@@ -43,7 +57,8 @@ class CacheManager:
         return _cached
 
     async def remove_by_tag(self, *, tag: CacheTag) -> None:
-        await self.backend.delete_startswith(value=tag.value)
+        # Up to the separator, so removing one tag leaves tags it is a prefix of alone
+        await self.backend.delete_startswith(value=f"{tag.value}::")
 
     async def remove_by_prefix(self, *, prefix: str) -> None:
         await self.backend.delete_startswith(value=prefix)
@@ -3,3 +3,16 @@ from enum import Enum
 
 class CacheTag(Enum):
     GET_USER_LIST = "get_user_list"
+    GET_SPECIALISATION_LIST = "get_specialisation_list"
+    GET_SPECIALISATION = "get_specialisation"
+    GET_COURSE_LIST = "get_course_list"
+    GET_COURSE = "get_course"
+
+
+# Tags of cached learning catalog reads, invalidated together when the catalog changes
+CATALOG_TAGS = (
+    CacheTag.GET_SPECIALISATION_LIST,
+    CacheTag.GET_SPECIALISATION,
+    CacheTag.GET_COURSE_LIST,
+    CacheTag.GET_COURSE,
+)
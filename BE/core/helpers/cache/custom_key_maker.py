@@ -1,18 +1,22 @@
 import inspect
-from typing import Callable
+from typing import Any, Callable
 
 from core.helpers.cache.base import BaseKeyMaker
 
 
 class CustomKeyMaker(BaseKeyMaker):
-    async def make(self, *, function: Callable, prefix: str) -> str:
+    async def make(
+        self, *, function: Callable, prefix: str, args: tuple = (), kwargs: dict[str, Any] | None = None
+    ) -> str:
         path = f"{prefix}::{inspect.getmodule(function).__name__}.{function.__name__}"  # type: ignore
-        args = ""
+        signature = inspect.signature(function)
+        # Argument values are part of the key, so calls with different arguments do not share an entry
+        bound = signature.bind_partial(*args, **(kwargs or {})).arguments
+        arguments = ",".join(
+            f"{name}={bound[name]}" if name in bound else name for name in signature.parameters
+        )
 
-        for arg in inspect.signature(function).parameters.values():
-            args += arg.name
-
-        if args:
-            return f"{path}.{args}"
+        if arguments:
+            return f"{path}.{arguments}"
 
         return path
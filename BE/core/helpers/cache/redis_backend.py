@@ -4,19 +4,23 @@ from typing import Any
 import ujson
 
 from core.helpers.cache.base import BaseBackend
-from core.helpers.redis import redis_client
+from core.helpers.redis import async_binary_redis_client, redis_client
 
 
 class RedisBackend(BaseBackend):
     async def get(self, *, key: str) -> Any:
-        result = await redis_client.get(key)
+        # Binary client, as pickled values are not valid UTF-8
+        result = await async_binary_redis_client.get(key)
         if not result:
             return
 
-        return ujson.loads(result)
+        try:
+            return ujson.loads(result)
+        except ValueError:
+            return pickle.loads(result)
 
     async def set(self, *, response: Any, key: str, ttl: int = 60) -> None:
-        if isinstance(response, dict):
+        if isinstance(response, (dict, list)):
             response = ujson.dumps(response)
         else:
             response = pickle.dumps(response)
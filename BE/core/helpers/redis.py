@@ -1,5 +1,12 @@
+from redis import Redis
 from redis import asyncio as redis
 
 from core.config import config
 
 redis_client = redis.from_url(url=f"redis://{config.REDIS_HOST}", decode_responses=True)
+
+# Binary-safe blocking client for synchronous callers such as the AI helpers
+sync_redis_client = Redis.from_url(url=f"redis://{config.REDIS_HOST}")
+
+# Binary-safe asyncio client for async callers such as the async embedding cache
+async_binary_redis_client = redis.from_url(url=f"redis://{config.REDIS_HOST}")
@@ -0,0 +1,36 @@
+"""course-summaries
+
+Revision ID: c41e7a9d2b58
+Revises: 76427f29f0f7
+Create Date: 2026-10-18 10:12:31.482215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c41e7a9d2b58'
+down_revision = '76427f29f0f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('course_summaries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('course_id', sa.Integer(), nullable=False),
+    sa.Column('summary', sa.Text(), nullable=False),
+    sa.Column('source_hash', sa.String(length=64), nullable=False),
+    sa.Column('model', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['course_id'], ['courses.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('course_id')
+    )
+    op.create_index(op.f('ix_course_summaries_id'), 'course_summaries', ['id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_course_summaries_id'), table_name='course_summaries')
+    op.drop_table('course_summaries')
@@ -0,0 +1,62 @@
+import sys
+from itertools import chain, groupby
+
+import asyncio
+import json
+import aiomysql
+
+from core.ai.chunker import chunk_content, parse_duration
+from core.ai.instrumentation import ai_call_context
+from core.ai.transcript_manager import TranscriptManager
+from core.config import config
+from seed.migrate import DB_CONFIG
+
+SELECT_CONTENTS_SQL = """
+SELECT course_id, content_data, content_text
+FROM course_contents
+WHERE content_text IS NOT NULL
+ORDER BY course_id, id
+"""
+
+
+async def load_contents():
+    pool = await aiomysql.create_pool(**DB_CONFIG)
+    async with pool.acquire() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cur:
+            await cur.execute(SELECT_CONTENTS_SQL)
+            rows = await cur.fetchall()
+
+    pool.close()
+    await pool.wait_closed()
+    return rows
+
+
+def course_chunks(rows):
+    for row in rows:
+        data = row["content_data"]
+        if isinstance(data, str):
+            data = json.loads(data or "{}")
+        yield chunk_content(row["content_text"], duration=parse_duration((data or {}).get("duration")))
+
+
+def main():
+    course_ids = {int(arg) for arg in sys.argv[1:]}
+    rows = asyncio.run(load_contents())
+
+    manager = TranscriptManager(weaviate_url=config.WEAVIATE_URL)
+    try:
+        for course_id, course_rows in groupby(rows, key=lambda row: row["course_id"]):
+            if course_ids and course_id not in course_ids:
+                continue
+            with ai_call_context("transcript_index", course_id):
+                result = manager.sync_course_chunks(course_id, chain.from_iterable(course_chunks(course_rows)))
+            print(
+                f"Course {course_id}: {len(result.created)} created, {result.unchanged} unchanged, "
+                f"{result.deleted} deleted, {len(result.errors)} errors"
+            )
+    finally:
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
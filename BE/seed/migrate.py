@@ -5,6 +5,8 @@ import asyncio
 import json
 import aiomysql
 
+from core.helpers.cache import CATALOG_TAGS, Cache, CustomKeyMaker, RedisBackend
+
 # ——— CONFIG ———
 DB_CONFIG = {
     "host": "localhost",
@@ -78,6 +80,14 @@ async def seed(json_path: Path):
 
     pool.close()
     await pool.wait_closed()
+    await invalidate_catalog()
+
+
+async def invalidate_catalog():
+    # Cached catalog reads would otherwise serve the old catalog until their TTL expires
+    Cache.init(backend=RedisBackend(), key_maker=CustomKeyMaker())
+    for tag in CATALOG_TAGS:
+        await Cache.remove_by_tag(tag=tag)
 
 def main():
     json_path = Path(__file__).parent / "specialisation.json"
@@ -0,0 +1,32 @@
+import sys
+
+import asyncio
+
+from app.learning.application.service.summary import course_summary_service
+from app.learning.application.service.summary_job import summary_jobs
+from celery_task import celery_app
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg not in ("--force", "--background")]
+    force = "--force" in sys.argv[1:]
+    course_ids = [int(arg) for arg in args] or None
+
+    if "--background" in sys.argv[1:]:
+        # Run on the Celery worker instead; progress is available from the job status API
+        job_id = asyncio.run(summary_jobs.create(course_ids, force=force))
+        celery_app.send_task("summary.summarise_courses", args=[job_id])
+        print(f"Queued summary job {job_id}")
+        return
+
+    result = asyncio.run(course_summary_service.refresh_all(course_ids, force=force))
+    print(
+        f"{len(result.generated)} generated, {len(result.unchanged)} unchanged, "
+        f"{len(result.skipped)} without content, {len(result.errors)} errors"
+    )
+    for course_id, error in result.errors:
+        print(f"Course {course_id}: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from app.learning.adapter.input.api.v1.content import chat_events, wants_stream
+
+
+class FakeRequest:
+    def __init__(self, disconnect_after: int = None, query_params: dict = None, headers: dict = None):
+        self.disconnect_after = disconnect_after
+        self.checks = 0
+        self.query_params = query_params or {}
+        self.headers = headers or {}
+
+    async def is_disconnected(self) -> bool:
+        self.checks += 1
+        return self.disconnect_after is not None and self.checks > self.disconnect_after
+
+
+def parse_events(events):
+    parsed = []
+    for event in events:
+        name, data = event.strip().split("\n")
+        parsed.append((name.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return parsed
+
+
+@pytest.mark.asyncio
+async def test_chat_events_emits_tokens_then_done():
+    # Given
+    async def tokens():
+        yield "Hello"
+        yield " world"
+
+    # When
+    sut = [event async for event in chat_events(FakeRequest(), tokens())]
+
+    # Then
+    assert parse_events(sut) == [("token", {"token": "Hello"}), ("token", {"token": " world"}), ("done", {})]
+
+
+@pytest.mark.asyncio
+async def test_chat_events_stops_and_closes_generation_on_disconnect():
+    # Given
+    produced = []
+    closed = []
+
+    async def tokens():
+        try:
+            for token in ["a", "b", "c"]:
+                produced.append(token)
+                yield token
+        finally:
+            closed.append(True)
+
+    # When
+    sut = [event async for event in chat_events(FakeRequest(disconnect_after=1), tokens())]
+
+    # Then
+    assert parse_events(sut) == [("token", {"token": "a"})]
+    assert produced == ["a", "b"]
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_chat_events_reports_errors():
+    # Given
+    async def tokens():
+        yield "partial"
+        raise RuntimeError("upstream failed")
+
+    # When
+    sut = [event async for event in chat_events(FakeRequest(), tokens())]
+
+    # Then
+    assert [name for name, _ in parse_events(sut)] == ["token", "error"]
+
+
+def test_wants_stream_is_opt_in():
+    assert not wants_stream(FakeRequest(headers={"accept": "application/json"}))
+    assert wants_stream(FakeRequest(query_params={"stream": "true"}))
+    assert wants_stream(FakeRequest(headers={"accept": "text/event-stream"}))
@@ -0,0 +1,24 @@
+from app.learning.application.service.summary import source_hash
+
+
+def test_source_hash_is_stable():
+    # Given
+    texts = ["Lecture one", "Lecture two"]
+
+    # When
+    sut = source_hash(texts, "gpt-4o-mini")
+
+    # Then
+    assert sut == source_hash(list(texts), "gpt-4o-mini")
+    assert len(sut) == 64
+
+
+def test_source_hash_changes_with_content_order_and_model():
+    # Given
+    digest = source_hash(["Lecture one", "Lecture two"], "gpt-4o-mini")
+
+    # When / Then
+    assert source_hash(["Lecture one", "Lecture two (edited)"], "gpt-4o-mini") != digest
+    assert source_hash(["Lecture two", "Lecture one"], "gpt-4o-mini") != digest
+    assert source_hash(["Lecture one", "Lecture two"], "gpt-4o") != digest
+    assert source_hash(["Lecture one\x1eLecture two"], "gpt-4o-mini") != digest
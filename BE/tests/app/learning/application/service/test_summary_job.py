@@ -0,0 +1,87 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.learning.application.service.summary_job import SummaryJobs
+from tests.support.fake_redis import FakeAsyncRedis
+
+
+def make_jobs(refresh):
+    service = MagicMock()
+    service.refresh = refresh
+    return SummaryJobs(service=service, redis=FakeAsyncRedis())
+
+
+@pytest.mark.asyncio
+async def test_job_runs_courses_and_reports_outcomes():
+    # Given
+    jobs = make_jobs(AsyncMock(side_effect=[True, False, None]))
+    job_id = await jobs.create([1, 2, 3], force=True)
+
+    # When
+    pending = await jobs.start(job_id)
+    for course_id in pending:
+        await jobs.run_course(job_id, course_id)
+    sut = await jobs.status(job_id)
+
+    # Then
+    assert pending == [1, 2, 3]
+    assert sut["status"] == "completed"
+    assert sut["force"] is True
+    assert (sut["total"], sut["completed"]) == (3, 3)
+    assert (sut["generated"], sut["unchanged"], sut["skipped"]) == ([1], [2], [3])
+    jobs.service.refresh.assert_awaited_with(3, force=True)
+
+
+@pytest.mark.asyncio
+async def test_restarted_job_resumes_after_done_courses():
+    # Given
+    refresh = AsyncMock(return_value=True)
+    jobs = make_jobs(refresh)
+    job_id = await jobs.create([1, 2, 3])
+    await jobs.start(job_id)
+    await jobs.run_course(job_id, 1)
+
+    # When
+    pending = await jobs.start(job_id)
+    skipped = await jobs.run_course(job_id, 1)
+    sut = await jobs.status(job_id)
+
+    # Then
+    assert pending == [2, 3]
+    assert skipped is None
+    assert refresh.await_count == 1
+    assert (sut["status"], sut["completed"]) == ("running", 1)
+
+
+@pytest.mark.asyncio
+async def test_failure_is_raised_for_retry_and_recorded_on_final_attempt():
+    # Given
+    jobs = make_jobs(AsyncMock(side_effect=RuntimeError("rate limited")))
+    job_id = await jobs.create([7])
+    await jobs.start(job_id)
+
+    # When
+    with pytest.raises(RuntimeError):
+        await jobs.run_course(job_id, 7, final_attempt=False)
+    outcome = await jobs.run_course(job_id, 7, final_attempt=True)
+    sut = await jobs.status(job_id)
+
+    # Then
+    assert outcome == "error"
+    assert sut["status"] == "completed"
+    assert sut["errors"] == [{"course_id": 7, "error": "rate limited"}]
+
+
+@pytest.mark.asyncio
+async def test_unknown_job():
+    # Given
+    jobs = make_jobs(AsyncMock())
+
+    # When
+    sut = await jobs.status("missing")
+
+    # Then
+    assert sut is None
+    with pytest.raises(KeyError):
+        await jobs.start("missing")
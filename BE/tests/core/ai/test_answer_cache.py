@@ -0,0 +1,101 @@
+import pytest
+
+from core.ai.answer_cache import SemanticAnswerCache
+from tests.support.fake_redis import FakeAsyncRedis, FakeRedis
+
+
+def make_cache(**kwargs) -> SemanticAnswerCache:
+    redis = FakeAsyncRedis()
+    sync_redis = FakeRedis()
+    # Invalidation writes through the sync client; share the counters with the async one
+    sync_redis.data = redis.data
+    return SemanticAnswerCache(redis=redis, sync_redis=sync_redis, **{"threshold": 0.9, **kwargs})
+
+
+@pytest.mark.asyncio
+async def test_lookup_returns_answer_for_similar_question():
+    # Given
+    cache = make_cache()
+    await cache.store(1, [1.0, 0.0, 0.0], "It sorts indices.")
+
+    # When
+    similar = await cache.lookup(1, [0.99, 0.05, 0.0])
+    different = await cache.lookup(1, [0.0, 1.0, 0.0])
+    other_course = await cache.lookup(2, [1.0, 0.0, 0.0])
+
+    # Then
+    assert similar == "It sorts indices."
+    assert different is None
+    assert other_course is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_course_answers():
+    # Given
+    cache = make_cache()
+    await cache.store(1, [1.0, 0.0], "old answer")
+
+    # When
+    cache.invalidate(1)
+    sut = await cache.lookup(1, [1.0, 0.0])
+
+    # Then
+    assert sut is None
+
+
+@pytest.mark.asyncio
+async def test_expired_and_evicted_entries_are_ignored():
+    # Given
+    expired = make_cache(ttl=-1)
+    bounded = make_cache(max_entries=1)
+    await expired.store(1, [1.0, 0.0], "stale")
+    await bounded.store(1, [1.0, 0.0], "first")
+    await bounded.store(1, [0.0, 1.0], "second")
+
+    # When
+    stale = await expired.lookup(1, [1.0, 0.0])
+    first = await bounded.lookup(1, [1.0, 0.0])
+    second = await bounded.lookup(1, [0.0, 1.0])
+
+    # Then
+    assert stale is None
+    assert first is None
+    assert second == "second"
+
+
+@pytest.mark.asyncio
+async def test_lookups_read_only_entries_added_since_the_last_one():
+    # Given
+    writer = make_cache()
+    reader = SemanticAnswerCache(redis=writer.redis, sync_redis=writer.sync_redis, threshold=0.9)
+    await writer.store(1, [1.0, 0.0, 0.0], "first")
+    await reader.lookup(1, [0.0, 0.0, 1.0])
+    await writer.store(1, [0.0, 1.0, 0.0], "second")
+    writer.redis.calls.clear()
+
+    # When
+    second = await reader.lookup(1, [0.0, 1.0, 0.0])
+    first = await reader.lookup(1, [1.0, 0.0, 0.0])
+
+    # Then
+    assert (first, second) == ("first", "second")
+    ranges = [call[2] for call in writer.redis.calls]
+    assert "-" not in ranges
+    assert len(reader._indexes[1].ids) == 2
+
+
+@pytest.mark.asyncio
+async def test_mirrored_entries_follow_invalidation_and_course_limit():
+    # Given
+    cache = make_cache(local_courses=1)
+    await cache.store(1, [1.0, 0.0], "old answer")
+    await cache.lookup(1, [1.0, 0.0])
+
+    # When
+    cache.invalidate(1)
+    invalidated = await cache.lookup(1, [1.0, 0.0])
+    await cache.lookup(2, [1.0, 0.0])
+
+    # Then
+    assert invalidated is None
+    assert list(cache._indexes) == [2]
@@ -0,0 +1,47 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.ai.async_transcript_manager import AsyncTranscriptManager
+from core.ai.embedding_cache import EmbeddingCache
+from core.ai.vector_store import NumpyVectorStore, ThreadedVectorStore
+
+
+def make_manager(store: NumpyVectorStore) -> AsyncTranscriptManager:
+    with patch.object(AsyncTranscriptManager, "_initialize_embedding_model"):
+        manager = AsyncTranscriptManager(ThreadedVectorStore(store))
+
+    manager.embedding_model = MagicMock()
+    manager.embedding_model.aembed_query = AsyncMock(side_effect=lambda text: [float(len(text)), 1.0])
+    manager.embedding_cache = EmbeddingCache(namespace="test", redis=None, async_redis=None)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_awaits_embedding_and_store():
+    # Given
+    store = NumpyVectorStore()
+    store.insert({"course_id": 1, "text": "use np.argsort", "start_time": 5, "end_time": 9}, [1.0, 1.0])
+    store.insert({"course_id": 2, "text": "use np.argsort", "start_time": 0, "end_time": 4}, [1.0, 1.0])
+    manager = make_manager(store)
+
+    # When
+    sut = await manager.hybrid_search("np.argsort", course_id=1)
+
+    # Then
+    assert [(result["course_id"], result["start_time"]) for result in sut] == [(1, 5)]
+    manager.embedding_model.aembed_query.assert_awaited_once_with("np.argsort")
+
+
+@pytest.mark.asyncio
+async def test_create_embedding_is_cached():
+    # Given
+    manager = make_manager(NumpyVectorStore())
+
+    # When
+    first = await manager.create_embedding("query")
+    second = await manager.create_embedding("query")
+
+    # Then
+    assert first == second == [5.0, 1.0]
+    assert manager.embedding_model.aembed_query.await_count == 1
@@ -0,0 +1,250 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.ai import chatbot
+from core.config import config
+
+
+class FakeStreamingLLM:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.prompts = []
+        self.closed = False
+
+    async def astream(self, prompt):
+        self.prompts.append(prompt)
+        try:
+            for token in self.tokens:
+                yield SimpleNamespace(content=token)
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def no_answer_cache(monkeypatch):
+    monkeypatch.setattr(config, "ANSWER_CACHE_ENABLED", False)
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_yields_rag_tokens(no_answer_cache):
+    # Given
+    llm = FakeStreamingLLM(["Use ", "", "np.argsort"])
+
+    # When
+    with patch.object(chatbot, "intent_identifier", AsyncMock(return_value="course_question")), \
+            patch.object(chatbot, "retrieve_context", AsyncMock(return_value="[0s-4s] sorting")), \
+            patch.object(chatbot, "chat_llm", MagicMock(return_value=llm)):
+        sut = [token async for token in chatbot.chat_stream(["how to sort?"], course_id=1)]
+
+    # Then
+    assert sut == ["Use ", "np.argsort"]
+    assert "[0s-4s] sorting" in llm.prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_prefixes_general_answers(no_answer_cache):
+    # Given
+    llm = FakeStreamingLLM(["Hello"])
+
+    # When
+    with patch.object(chatbot, "intent_identifier", AsyncMock(return_value="general_question")), \
+            patch.object(chatbot, "general_history", AsyncMock(return_value="User: hi")), \
+            patch.object(chatbot, "chat_llm", MagicMock(return_value=llm)):
+        sut = [token async for token in chatbot.chat_stream(["hi"])]
+
+    # Then
+    assert "".join(sut) == "Assistant: Hello"
+    assert "User: hi" in llm.prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_close_cancels_llm_stream_and_skips_cache():
+    # Given
+    llm = FakeStreamingLLM(["one ", "two ", "three"])
+    store = AsyncMock()
+    stream = chatbot.chat_stream(["how to sort?"], course_id=1)
+
+    # When
+    with patch.object(chatbot, "cached_answer", AsyncMock(return_value=(None, [1.0, 0.0]))), \
+            patch.object(chatbot, "intent_identifier", AsyncMock(return_value="course_question")), \
+            patch.object(chatbot, "retrieve_context", AsyncMock(return_value="")), \
+            patch.object(chatbot, "chat_llm", MagicMock(return_value=llm)), \
+            patch.object(chatbot.answer_cache, "store", store):
+        first = await stream.__anext__()
+        await stream.aclose()
+
+    # Then
+    assert first == "one "
+    assert llm.closed
+    store.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_caches_completed_answer():
+    # Given
+    llm = FakeStreamingLLM(["one ", "two"])
+    store = AsyncMock()
+
+    # When
+    with patch.object(chatbot, "cached_answer", AsyncMock(return_value=(None, [1.0, 0.0]))), \
+            patch.object(chatbot, "intent_identifier", AsyncMock(return_value="course_question")), \
+            patch.object(chatbot, "retrieve_context", AsyncMock(return_value="")), \
+            patch.object(chatbot, "chat_llm", MagicMock(return_value=llm)), \
+            patch.object(chatbot.answer_cache, "store", store):
+        sut = [token async for token in chatbot.chat_stream(["how to sort?"], course_id=3)]
+
+    # Then
+    assert sut == ["one ", "two"]
+    store.assert_awaited_once_with(3, [1.0, 0.0], "one two")
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_serves_cache_hit_without_llm():
+    # Given
+    chat_llm = MagicMock()
+
+    # When
+    with patch.object(chatbot, "cached_answer", AsyncMock(return_value=("cached", [1.0]))), \
+            patch.object(chatbot, "chat_llm", chat_llm):
+        sut = [token async for token in chatbot.chat_stream(["how to sort?"])]
+
+    # Then
+    assert sut == ["cached"]
+    chat_llm.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_llm_intent_sends_the_classification_prompt():
+    # Given
+    structured = MagicMock()
+    structured.ainvoke = AsyncMock(return_value=chatbot.Intent(intent="summary"))
+
+    # When
+    with patch.object(chatbot, "intent_llm", MagicMock(return_value=structured)):
+        sut = await chatbot.llm_intent("what did we cover?")
+
+    # Then
+    assert sut == "summary"
+    prompt = structured.ainvoke.await_args.args[0]
+    assert "what did we cover?" in prompt and "course_question" in prompt
+
+
+@pytest.mark.asyncio
+async def test_retrieval_runs_concurrently_with_intent(no_answer_cache, monkeypatch):
+    # Given
+    monkeypatch.setattr(config, "CHAT_SPECULATIVE_RETRIEVAL", True)
+    retrieval_started = asyncio.Event()
+
+    async def intent_identifier(message):
+        await asyncio.wait_for(retrieval_started.wait(), timeout=1)
+        return "course_question"
+
+    async def retrieve_context(message, course_id):
+        retrieval_started.set()
+        return "[0s-4s] sorting"
+
+    timings = {}
+
+    # When
+    with patch.object(chatbot, "intent_identifier", intent_identifier), \
+            patch.object(chatbot, "retrieve_context", retrieve_context):
+        sut = await chatbot.plan_answer("how to sort?", 1, timings)
+
+    # Then
+    assert sut == ("course_question", "[0s-4s] sorting")
+    assert {"intent", "retrieval", "retrieval_wait"} <= set(timings)
+
+
+@pytest.mark.asyncio
+async def test_speculative_retrieval_is_cancelled_for_other_intents(no_answer_cache, monkeypatch):
+    # Given
+    monkeypatch.setattr(config, "CHAT_SPECULATIVE_RETRIEVAL", True)
+    cancelled = asyncio.Event()
+
+    async def retrieve_context(message, course_id):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def intent_identifier(message):
+        await asyncio.sleep(0)
+        return "general_question"
+
+    # When
+    with patch.object(chatbot, "intent_identifier", intent_identifier), \
+            patch.object(chatbot, "retrieve_context", retrieve_context):
+        sut = await chatbot.plan_answer("hi there", 1, {})
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    # Then
+    assert sut == ("general_question", None)
+
+
+@pytest.mark.asyncio
+async def test_failed_speculative_retrieval_does_not_affect_other_intents(no_answer_cache, monkeypatch):
+    # Given
+    monkeypatch.setattr(config, "CHAT_SPECULATIVE_RETRIEVAL", True)
+
+    async def intent_identifier(message):
+        await asyncio.sleep(0.01)
+        return "general_question"
+
+    # When
+    with patch.object(chatbot, "intent_identifier", intent_identifier), \
+            patch.object(chatbot, "retrieve_context", AsyncMock(side_effect=RuntimeError("weaviate down"))):
+        sut = await chatbot.plan_answer("hi there", 1, {})
+
+    # Then
+    assert sut == ("general_question", None)
+
+
+@pytest.mark.asyncio
+async def test_sequential_mode_retrieves_after_intent(no_answer_cache, monkeypatch):
+    # Given
+    monkeypatch.setattr(config, "CHAT_SPECULATIVE_RETRIEVAL", False)
+    retrieve_context = AsyncMock(return_value="context")
+
+    # When
+    with patch.object(chatbot, "intent_identifier", AsyncMock(return_value="summary")), \
+            patch.object(chatbot, "retrieve_context", retrieve_context):
+        sut = await chatbot.plan_answer("summarise", 1, {})
+
+    # Then
+    assert sut == ("summary", None)
+    retrieve_context.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_summary_intent_answers_from_storage(no_answer_cache):
+    # Given
+    summary_loader = AsyncMock(return_value="Key points of the course")
+    chat_llm = MagicMock()
+
+    # When
+    with patch.object(chatbot, "intent_identifier", AsyncMock(return_value="summary")), \
+            patch.object(chatbot, "retrieve_context", AsyncMock(return_value="")), \
+            patch.object(chatbot, "chat_llm", chat_llm):
+        sut = await chatbot.chat(["summarise the course"], course_id=4, summary_loader=summary_loader)
+
+    # Then
+    assert sut == "Key points of the course"
+    summary_loader.assert_awaited_once_with(4)
+    chat_llm.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_summary_intent_without_stored_summary(no_answer_cache):
+    # When
+    with patch.object(chatbot, "intent_identifier", AsyncMock(return_value="summary")), \
+            patch.object(chatbot, "retrieve_context", AsyncMock(return_value="")):
+        sut = [token async for token in chatbot.chat_stream(
+            ["summarise"], course_id=4, summary_loader=AsyncMock(return_value=None)
+        )]
+
+    # Then
+    assert sut == [chatbot.NO_SUMMARY_MESSAGE]
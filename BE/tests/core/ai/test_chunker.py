@@ -0,0 +1,158 @@
+from core.ai.chunker import Cue, chunk_cues, chunk_text, parse_captions, parse_duration, text_cues
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def test_parse_srt_captions():
+    # Given
+    lines = [
+        "1",
+        "00:00:01,000 --> 00:00:04,500",
+        "Hello and welcome",
+        "",
+        "2",
+        "00:00:04,500 --> 00:00:08,000",
+        "to the <i>course</i>",
+    ]
+
+    # When
+    sut = list(parse_captions(lines))
+
+    # Then
+    assert sut == [Cue(1.0, 4.5, "Hello and welcome"), Cue(4.5, 8.0, "to the course")]
+
+
+def test_parse_vtt_captions_skips_header_and_settings():
+    # Given
+    lines = ["WEBVTT", "", "NOTE intro", "", "01:02.250 --> 01:05.000 align:start", "<v Ann>Ready?", ""]
+
+    # When
+    sut = list(parse_captions(lines))
+
+    # Then
+    assert sut == [Cue(62.25, 65.0, "Ready?")]
+
+
+def test_text_cues_spread_duration_over_sentences():
+    # Given
+    text = "Call np.argmax first. Then sort."
+
+    # When
+    sut = list(text_cues(text, duration=parse_duration("0:32")))
+
+    # Then
+    assert [cue.text for cue in sut] == ["Call np.argmax first.", "Then sort."]
+    assert sut[0].start == 0
+    assert sut[1].end == 32
+
+
+def test_chunk_cues_respects_budget_and_overlap():
+    # Given
+    cues = [Cue(i * 10, i * 10 + 10, f"w{i}a w{i}b") for i in range(5)]
+
+    # When
+    sut = list(chunk_cues(iter(cues), max_tokens=4, overlap_tokens=2, count=count_words))
+
+    # Then
+    assert [chunk.text for chunk in sut] == ["w0a w0b w1a w1b", "w1a w1b w2a w2b", "w2a w2b w3a w3b", "w3a w3b w4a w4b"]
+    assert [(chunk.start_time, chunk.end_time) for chunk in sut] == [(0, 20), (10, 30), (20, 40), (30, 50)]
+    assert all(chunk.token_count <= 4 for chunk in sut)
+    assert len({chunk.content_hash for chunk in sut}) == 4
+
+
+def test_chunk_cues_splits_oversized_cue():
+    # Given
+    cues = [Cue(0, 60, "one two three four five six")]
+
+    # When
+    sut = list(chunk_cues(cues, max_tokens=2, overlap_tokens=0, count=count_words))
+
+    # Then
+    assert [chunk.text for chunk in sut] == ["one two", "three four", "five six"]
+    assert sut[0].start_time == 0 and sut[-1].end_time == 60
+
+
+def test_chunk_cues_splits_long_unpunctuated_cue_in_linear_time():
+    # Given
+    text = " ".join(f"word{i}" for i in range(5000))
+    counted = []
+
+    def count(piece: str) -> int:
+        counted.append(len(piece))
+        return count_words(piece)
+
+    # When
+    sut = list(chunk_cues([Cue(0, 600, text)], max_tokens=100, overlap_tokens=0, count=count, anchor_tokens=0))
+
+    # Then
+    assert " ".join(chunk.text for chunk in sut) == text
+    assert all(chunk.token_count <= 100 for chunk in sut)
+    assert sum(counted) < 10 * len(text)
+
+def test_chunk_text_packs_sentences_with_overlap():
+    # Given
+    text = "One two. Three four.\nFive six. Seven eight."
+
+    # When
+    sut = list(chunk_text([text], max_tokens=6, overlap_tokens=2, count=count_words))
+
+    # Then
+    assert sut == ["One two. Three four.", "Three four. Five six.", "Five six. Seven eight."]
+
+
+def test_chunk_text_breaks_at_paragraphs():
+    # Given
+    texts = ["A b c. D e.\n\nF g. H i j k.", "L m.\n\n\n"]
+
+    # When
+    sut = list(chunk_text(texts, max_tokens=9, overlap_tokens=2, count=count_words))
+
+    # Then
+    assert sut == ["A b c. D e.", "F g. H i j k.", "L m."]
+
+
+def test_chunk_text_splits_oversized_sentence_and_respects_budget():
+    # Given
+    text = "a b c d e f g h i j."
+
+    # When
+    sut = list(chunk_text(iter([text]), max_tokens=4, count=count_words))
+
+    # Then
+    assert sut == ["a b c d", "e f g h", "i j."]
+    assert all(count_words(chunk) <= 4 for chunk in sut)
+
+
+def lecture(edit: str = "") -> str:
+    topics = ["arrays", "lists", "sorting", "searching", "hashing", "trees", "graphs"]
+    return " ".join(
+        f"Sentence {i} {edit if i == 1 else ''}covers {topics[i % 7]} and {topics[i * 3 % 7]} in detail."
+        for i in range(80)
+    )
+
+
+def test_editing_an_early_sentence_only_changes_nearby_chunks():
+    # Given
+    options = {"max_tokens": 40, "overlap_tokens": 8, "count": count_words, "anchor_tokens": 10}
+    before = list(chunk_cues(text_cues(lecture(), duration=600), **options))
+
+    # When
+    sut = list(chunk_cues(text_cues(lecture(edit="now briefly "), duration=600), **options))
+
+    # Then
+    changed = {chunk.content_hash for chunk in sut} - {chunk.content_hash for chunk in before}
+    assert len(sut) > 10
+    assert len(changed) <= 2
+
+
+def test_chunks_close_at_paragraph_starts():
+    # Given
+    text = "One two three. Four five.\n\nSix seven. Eight nine."
+
+    # When
+    sut = list(chunk_cues(text_cues(text), max_tokens=8, overlap_tokens=0, count=count_words, anchor_tokens=0))
+
+    # Then
+    assert [chunk.text for chunk in sut] == ["One two three. Four five.", "Six seven. Eight nine."]
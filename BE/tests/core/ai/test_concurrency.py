@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from core.ai.concurrency import AIBusyException, ConcurrencyLimiter, SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_share_one_upstream_call():
+    # Given
+    flight = SingleFlight()
+    calls = []
+    release = asyncio.Event()
+
+    async def upstream():
+        calls.append(1)
+        await release.wait()
+        return "summary"
+
+    # When
+    waiters = [asyncio.create_task(flight.do(("summary", 1), upstream)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    sut = await asyncio.gather(*waiters)
+
+    # Then
+    assert sut == ["summary"] * 5
+    assert len(calls) == 1
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_call():
+    # Given
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def upstream():
+        await release.wait()
+        return 42
+
+    first = asyncio.create_task(flight.do("key", upstream))
+    second = asyncio.create_task(flight.do("key", upstream))
+    await asyncio.sleep(0)
+
+    # When
+    first.cancel()
+    release.set()
+
+    # Then
+    assert await second == 42
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_are_not_cached():
+    # Given
+    flight = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0)
+        raise RuntimeError("rate limited")
+
+    # When
+    sut = await asyncio.gather(flight.do("key", failing), flight.do("key", failing), return_exceptions=True)
+
+    # Then
+    assert all(isinstance(result, RuntimeError) for result in sut)
+    assert await flight.do("key", lambda: asyncio.sleep(0, result="ok")) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_course_limit_queues_calls():
+    # Given
+    limiter = ConcurrencyLimiter(global_limit=10, course_limit=2, queue_timeout=None)
+    running, peak = 0, 0
+
+    async def upstream():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    # When
+    await asyncio.gather(*(limiter.run(7, upstream) for _ in range(6)))
+
+    # Then
+    assert peak == 2
+    assert limiter._courses == {}
+
+
+@pytest.mark.asyncio
+async def test_global_limit_spans_courses():
+    # Given
+    limiter = ConcurrencyLimiter(global_limit=3, course_limit=2, queue_timeout=None)
+    running, peak = 0, 0
+
+    async def upstream():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    # When
+    await asyncio.gather(*(limiter.run(course_id, upstream) for course_id in range(6)))
+
+    # Then
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_raises_busy():
+    # Given
+    limiter = ConcurrencyLimiter(global_limit=1, course_limit=1, queue_timeout=0.01)
+    release = asyncio.Event()
+    holder = asyncio.create_task(limiter.run(1, release.wait))
+    await asyncio.sleep(0)
+
+    # When / Then
+    with pytest.raises(AIBusyException):
+        await limiter.run(1, release.wait)
+    release.set()
+    await holder
+    assert limiter._courses == {}
@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.ai.embedding_cache import EmbeddingCache, pack_vector, unpack_vector
+
+
+def test_pack_vector_roundtrip():
+    # Given
+    vector = [0.5, -1.25, 3.0]
+
+    # When
+    data = pack_vector(vector)
+
+    # Then
+    assert len(data) == 4 * len(vector)
+    assert unpack_vector(data) == vector
+
+
+def test_get_or_create_embeds_only_missing_texts():
+    # Given
+    cache = EmbeddingCache(namespace="test", redis=None)
+    embed = MagicMock(side_effect=lambda texts: [[float(len(text))] for text in texts])
+    cache.get_or_create(["a"], embed)
+
+    # When
+    sut = cache.get_or_create(["a", "bb", "bb"], embed)
+
+    # Then
+    assert sut == [[1.0], [2.0], [2.0]]
+    assert embed.call_args_list[-1].args == (["bb"],)
+
+
+def test_lru_evicts_by_size():
+    # Given
+    cache = EmbeddingCache(namespace="test", max_entries=2, redis=None)
+
+    # When
+    cache.set_many(["a", "b", "c"], [[1.0], [2.0], [3.0]])
+
+    # Then
+    assert cache.get_many(["a", "b", "c"]) == [None, [2.0], [3.0]]
+
+
+def test_lru_evicts_by_ttl():
+    # Given
+    cache = EmbeddingCache(namespace="test", ttl=0, redis=None)
+    cache.set_many(["a"], [[1.0]])
+
+    # When
+    sut = cache.get_many(["a"])
+
+    # Then
+    assert sut == [None]
+
+
+def test_redis_tier_hit_is_promoted():
+    # Given
+    redis = MagicMock()
+    cache = EmbeddingCache(namespace="test", redis=redis)
+    redis.mget.return_value = [pack_vector([4.0])]
+
+    # When
+    first = cache.get_many(["a"])
+    second = cache.get_many(["a"])
+
+    # Then
+    assert first == second == [[4.0]]
+    redis.mget.assert_called_once_with([cache.make_key("a")])
+
+
+def test_redis_failure_is_a_miss():
+    # Given
+    redis = MagicMock()
+    redis.mget.side_effect = ConnectionError("down")
+    cache = EmbeddingCache(namespace="test", redis=redis)
+
+    # When
+    sut = cache.get_many(["a"])
+
+    # Then
+    assert sut == [None]
+
+
+@pytest.mark.parametrize("namespace", ["model-a", "model-b"])
+def test_make_key_depends_on_namespace(namespace):
+    # Given
+    cache = EmbeddingCache(namespace=namespace, redis=None)
+
+    # When
+    sut = cache.make_key("text")
+
+    # Then
+    assert sut != EmbeddingCache(namespace="other", redis=None).make_key("text")
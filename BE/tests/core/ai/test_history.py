@@ -0,0 +1,138 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.ai import history as history_module
+from core.ai.concurrency import ConcurrencyLimiter
+from core.ai.history import ConversationHistory
+from tests.support.fake_redis import FakeAsyncRedis
+
+MODEL = "test-model"
+
+
+def conversation(turns: int):
+    return [f"{'User' if index % 2 == 0 else 'Assistant'}: message number {index}" for index in range(turns)]
+
+
+def make_history(**kwargs) -> ConversationHistory:
+    options = dict(budget=1000, recent_turns=4, summary_tokens=50, refresh_turns=2, redis=FakeAsyncRedis(),
+                   summarise=AsyncMock(return_value="they talked about numbers"))
+    options.update(kwargs)
+    return ConversationHistory(**options)
+
+
+@pytest.mark.asyncio
+async def test_short_conversation_is_kept_verbatim():
+    # Given
+    history = make_history()
+    messages = conversation(3)
+
+    # When
+    sut = await history.window(messages, model=MODEL)
+    await history.drain()
+
+    # Then
+    assert sut.turns == messages
+    assert sut.summary == ""
+    history.summarise.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_aged_out_turns_are_summarised_in_the_background():
+    # Given
+    history = make_history()
+    messages = conversation(8)
+
+    # When
+    first = await history.window(messages, model=MODEL)
+    await history.drain()
+    second = await history.window(messages + ["User: and now?"], conversation_id=None, model=MODEL)
+
+    # Then
+    assert first.summary == "" and first.turns == messages
+    history.summarise.assert_awaited_once_with("", messages[:4], 50)
+    assert second.summary == "they talked about numbers"
+    assert second.turns == messages[4:] + ["User: and now?"]
+
+
+@pytest.mark.asyncio
+async def test_window_never_exceeds_budget():
+    # Given
+    history = make_history(budget=40, redis=None)
+    messages = conversation(30)
+
+    # When
+    sut = await history.window(messages, model=MODEL)
+
+    # Then
+    assert sut.tokens <= 40
+    assert sut.turns[-1] == messages[-1]
+    assert sut.dropped == 30 - len(sut.turns)
+
+
+@pytest.mark.asyncio
+async def test_oversized_current_message_is_truncated():
+    # Given
+    history = make_history(budget=20, redis=None)
+
+    # When
+    sut = await history.window(["User: " + "word " * 500], model=MODEL)
+
+    # Then
+    assert sut.tokens <= 20
+    assert sut.turns[0].startswith("User: word")
+
+
+@pytest.mark.asyncio
+async def test_edited_history_ignores_stale_summary():
+    # Given
+    history = make_history()
+    messages = conversation(8)
+    await history.window(messages, model=MODEL)
+    await history.drain()
+    edited = messages[:1] + ["Assistant: something else"] + messages[2:]
+
+    # When
+    sut = await history.window(edited, model=MODEL)
+
+    # Then
+    assert sut.summary == ""
+    assert sut.turns == edited
+
+
+@pytest.mark.asyncio
+async def test_budget_is_chosen_per_model():
+    # Given
+    history = make_history(budget=1000, model_budgets={"small-model": 12})
+    messages = conversation(6)
+
+    # When
+    small = await history.window(messages, model="small-model")
+    default = await history.window(messages, model=MODEL)
+    await history.drain()
+
+    # Then
+    assert small.tokens <= 12 < default.tokens
+    assert default.turns == messages
+
+
+@pytest.mark.asyncio
+async def test_summarise_turns_runs_under_the_llm_limiter(monkeypatch):
+    # Given
+    chat = MagicMock()
+    chat.ainvoke = AsyncMock(return_value=MagicMock(content=" summary "))
+    monkeypatch.setattr(history_module.llm_registry, "chat", MagicMock(return_value=chat))
+    limiter = ConcurrencyLimiter(global_limit=1)
+    monkeypatch.setattr("core.ai.concurrency.llm_limiter", limiter)
+
+    # When
+    async with limiter.slot(kind="chat"):
+        pending = asyncio.create_task(history_module.summarise_turns("", ["User: hi"], 50))
+        await asyncio.sleep(0.01)
+        waited = not pending.done()
+    sut = await pending
+
+    # Then
+    assert waited
+    assert sut == "summary"
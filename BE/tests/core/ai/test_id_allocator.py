@@ -0,0 +1,91 @@
+from unittest.mock import MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from core.ai.id_allocator import StoreIdAllocator, TranscriptIdAllocator
+from core.ai.vector_store import NumpyVectorStore
+from tests.support.fake_redis import FakeRedis
+
+
+def test_reserve_seeds_once():
+    # Given
+    allocator = TranscriptIdAllocator(redis=FakeRedis())
+    seed = MagicMock(return_value=5)
+
+    # When
+    first = allocator.reserve_transcript_ids(3, seed=seed)
+    second = allocator.reserve_transcript_ids(2, seed=seed)
+
+    # Then
+    assert list(first) == [5, 6, 7]
+    assert list(second) == [8, 9]
+    seed.assert_called_once()
+
+
+def test_reserve_course_counters_are_independent():
+    # Given
+    allocator = TranscriptIdAllocator(redis=FakeRedis())
+
+    # When
+    course_1 = allocator.reserve_course_transcript_ids(1, 2, seed=lambda: 0)
+    course_2 = allocator.reserve_course_transcript_ids(2, 1, seed=lambda: 10)
+
+    # Then
+    assert list(course_1) == [0, 1]
+    assert list(course_2) == [10]
+
+
+def test_reserve_nothing():
+    # Given
+    redis = MagicMock()
+    allocator = TranscriptIdAllocator(redis=redis)
+
+    # When
+    sut = allocator.reserve("global", 0, seed=lambda: 1)
+
+    # Then
+    assert list(sut) == []
+    redis.incrby.assert_not_called()
+
+
+def test_redis_errors_are_raised():
+    # Given
+    redis = MagicMock()
+    redis.exists.side_effect = RedisConnectionError("connection refused")
+    allocator = TranscriptIdAllocator(redis=redis)
+
+    # When / Then
+    with pytest.raises(RedisConnectionError):
+        allocator.reserve_course_transcript_ids(3, 2, seed=lambda: 7)
+
+
+def test_store_counters_are_seeded_once():
+    # Given
+    allocator = StoreIdAllocator(NumpyVectorStore())
+    seed = MagicMock(return_value=4)
+
+    # When
+    first = allocator.reserve_transcript_ids(2, seed=seed)
+    second = allocator.reserve_transcript_ids(1, seed=seed)
+
+    # Then
+    assert [list(first), list(second)] == [[4, 5], [6]]
+    seed.assert_called_once()
+
+
+def test_store_counters_are_shared_by_stores_on_one_path(tmp_path):
+    # Given
+    first = StoreIdAllocator(NumpyVectorStore(path=str(tmp_path)))
+    second = StoreIdAllocator(NumpyVectorStore(path=str(tmp_path)))
+
+    # When
+    reserved = [
+        first.reserve_course_transcript_ids(1, 2, seed=lambda: 0),
+        second.reserve_course_transcript_ids(1, 3, seed=lambda: 0),
+        first.reserve_course_transcript_ids(1, 1, seed=lambda: 0),
+        second.reserve_course_transcript_ids(2, 1, seed=lambda: 10),
+    ]
+
+    # Then
+    assert [list(ids) for ids in reserved] == [[0, 1], [2, 3, 4], [5], [10]]
@@ -0,0 +1,100 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from langchain_openai import OpenAIEmbeddings
+from prometheus_client import REGISTRY
+
+from core.ai.instrumentation import (
+    InstrumentedOpenAIEmbeddings,
+    MetricsCallbackHandler,
+    ai_call_context,
+    ai_endpoint,
+    estimate_cost,
+    record_response,
+)
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_estimate_cost_uses_base_model_price():
+    assert estimate_cost("gpt-4o-mini-2024-07-18", 1_000_000, 1_000_000) == pytest.approx(0.75)
+    assert estimate_cost("gpt-4o", 1_000_000, 0) == pytest.approx(2.50)
+    assert estimate_cost("some-other-model", 10, 10) is None
+
+
+def test_callback_records_tokens_and_cost_per_endpoint_and_course():
+    # Given
+    handler = MetricsCallbackHandler()
+    run_id = uuid4()
+    message = AIMessage(content="ok", usage_metadata={"input_tokens": 120, "output_tokens": 30, "total_tokens": 150})
+    labels = dict(kind="chat", model="gpt-4o-mini", endpoint="test_endpoint", course="11")
+    before = sample("ai_openai_tokens_total", type="prompt", **labels)
+
+    # When
+    with ai_call_context("test_endpoint", 11):
+        handler.on_chat_model_start(
+            {}, [[]], run_id=run_id, metadata={"ai_role": "chat"}, invocation_params={"model": "gpt-4o-mini"}
+        )
+        handler.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]), run_id=run_id)
+
+    # Then
+    assert sample("ai_openai_tokens_total", type="prompt", **labels) - before == 120
+    assert sample("ai_openai_tokens_total", type="completion", **labels) >= 30
+    assert sample("ai_openai_calls_total", result="ok", **labels) >= 1
+    assert sample("ai_openai_cost_usd_total", model="gpt-4o-mini", endpoint="test_endpoint", course="11") > 0
+    assert ai_endpoint.get() == "none"
+
+
+@pytest.mark.asyncio
+async def test_callback_records_errors_of_chat_models():
+    # Given
+    handler = MetricsCallbackHandler()
+    llm = GenericFakeChatModel(messages=iter([]), callbacks=[handler], metadata={"ai_role": "intent"})
+    labels = dict(kind="intent", model="unknown", endpoint="failing_endpoint", course="none", result="error")
+    before = sample("ai_openai_calls_total", **labels)
+
+    # When
+    with ai_call_context("failing_endpoint"):
+        with pytest.raises(Exception):
+            await llm.ainvoke("hello")
+
+    # Then
+    assert sample("ai_openai_calls_total", **labels) - before == 1
+
+
+@pytest.mark.asyncio
+async def test_embeddings_are_recorded():
+    # Given
+    embeddings = InstrumentedOpenAIEmbeddings(model="text-embedding-3-small", api_key="test")
+    labels = dict(kind="embedding", model="text-embedding-3-small", endpoint="embed_endpoint", course="3")
+    before = sample("ai_openai_calls_total", result="ok", **labels)
+
+    # When
+    with patch.object(OpenAIEmbeddings, "aembed_documents", return_value=[[0.1, 0.2]]):
+        with ai_call_context("embed_endpoint", 3):
+            sut = await embeddings.aembed_query("what is a tensor")
+
+    # Then
+    assert sut == [0.1, 0.2]
+    assert sample("ai_openai_calls_total", result="ok", **labels) - before == 1
+    assert sample("ai_openai_tokens_total", type="prompt", **labels) > 0
+
+
+def test_retryable_responses_are_counted():
+    # Given
+    before = sample("ai_openai_retryable_responses_total", endpoint="retry_endpoint", status="429")
+
+    # When
+    with ai_call_context("retry_endpoint"):
+        record_response(httpx.Response(429))
+        record_response(httpx.Response(200))
+
+    # Then
+    assert sample("ai_openai_retryable_responses_total", endpoint="retry_endpoint", status="429") - before == 1
@@ -0,0 +1,125 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.ai.intent_classifier import IntentClassifier
+
+VOCABULARY = ["bullet", "sort", "array", "joke", "weather"]
+EXAMPLES = {
+    "summary": ["bullet points please", "bullet list"],
+    "course_question": ["sort the array", "array sort"],
+    "general_question": ["tell a joke", "weather today"],
+}
+
+
+async def embed(text: str):
+    words = text.lower().split()
+    return [float(sum(word.startswith(term) for word in words)) + 0.01 for term in VOCABULARY]
+
+
+def make_classifier(**kwargs) -> IntentClassifier:
+    return IntentClassifier(threshold=0.6, margin=0.1, examples=EXAMPLES, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("message, expected", [
+    ("Can you summarise the lectures?", "summary"),
+    ("Give me a recap", "summary"),
+    ("Please give me a short summary.", "summary"),
+    ("thanks!", "general_question"),
+    ("What did the instructor say about recursion in this lecture?", "course_question"),
+    ("Give me the key points of the last video", "summary"),
+    ("tl;dr", "summary"),
+])
+async def test_keyword_rules_decide_without_network(message, expected):
+    # Given
+    classifier = make_classifier()
+    embedder = AsyncMock(side_effect=embed)
+    fallback = AsyncMock()
+
+    # When
+    sut = await classifier.classify(message, embedder, fallback)
+
+    # Then
+    assert sut == expected
+    embedder.assert_not_awaited()
+    fallback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("message", [
+    "What are summary statistics?",
+    "What are the key points of gradient descent?",
+    "Give an overview of hash maps",
+    "How do I summarize a pandas dataframe?",
+    "write me an overview of the causes of WW1",
+    "give me a summary of how quicksort works",
+])
+async def test_summary_rule_ignores_other_mentions_of_summaries(message):
+    # Given
+    classifier = make_classifier()
+    embedder = AsyncMock(side_effect=embed)
+    fallback = AsyncMock(return_value="course_question")
+
+    # When
+    sut = classifier.match_rules(message)
+    await classifier.classify(message, embedder, fallback)
+
+    # Then
+    assert sut is None
+    embedder.assert_any_await(message)
+
+
+@pytest.mark.asyncio
+async def test_confident_centroid_decides():
+    # Given
+    classifier = make_classifier()
+    fallback = AsyncMock()
+
+    # When
+    sut = await classifier.classify("how do I sort an array", embed, fallback)
+
+    # Then
+    assert sut == "course_question"
+    fallback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_uncertain_message_falls_back_to_llm():
+    # Given
+    classifier = make_classifier()
+    fallback = AsyncMock(return_value="general_question")
+
+    # When
+    sut = await classifier.classify("sort a joke", embed, fallback)
+
+    # Then
+    assert sut == "general_question"
+    fallback.assert_awaited_once_with("sort a joke")
+
+
+@pytest.mark.asyncio
+async def test_embedding_failure_falls_back_to_llm():
+    # Given
+    classifier = make_classifier()
+    fallback = AsyncMock(return_value="course_question")
+
+    # When
+    sut = await classifier.classify("how do I sort", AsyncMock(side_effect=RuntimeError("down")), fallback)
+
+    # Then
+    assert sut == "course_question"
+
+
+@pytest.mark.asyncio
+async def test_centroids_are_embedded_once():
+    # Given
+    classifier = make_classifier()
+    embedder = AsyncMock(side_effect=embed)
+
+    # When
+    await classifier.classify("sort the array quickly", embedder, AsyncMock())
+    await classifier.classify("tell me a joke about weather", embedder, AsyncMock())
+
+    # Then
+    assert embedder.await_count == 6 + 2
@@ -0,0 +1,37 @@
+from core.ai.lexical import BM25Index, query_terms, term_coverage, tokenize
+
+
+def test_tokenize_keeps_identifiers():
+    # When
+    sut = tokenize("Call np.argmax on the utf-8 snake_case array")
+
+    # Then
+    assert sut == ["call", "np.argmax", "on", "the", "utf-8", "snake_case", "array"]
+
+
+def test_term_coverage_ignores_stopwords():
+    # Given
+    terms = query_terms("What does np.argmax return?")
+
+    # When
+    sut = term_coverage(terms, "np.argmax gives the index; it does not return the value")
+
+    # Then
+    assert terms == {"np.argmax", "return"}
+    assert sut == 1.0
+
+
+def test_bm25_ranks_rare_terms_higher():
+    # Given
+    index = BM25Index([
+        "gradient descent updates the weights",
+        "the softmax function normalises logits",
+        "the weights and the bias",
+    ])
+
+    # When
+    sut = index.scores("softmax weights")
+
+    # Then
+    assert sut.argmax() == 1
+    assert sut[2] > 0
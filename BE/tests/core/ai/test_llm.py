@@ -0,0 +1,70 @@
+import pytest
+
+from core.ai.instrumentation import InstrumentedOpenAIEmbeddings, metrics_callback
+from core.ai.llm import LLMRegistry
+
+
+def test_chat_clients_are_shared_per_role():
+    # Given
+    registry = LLMRegistry(api_key="test", timeout=5.0, max_retries=3)
+
+    # When
+    chat = registry.chat("chat")
+    intent = registry.chat("intent")
+
+    # Then
+    assert registry.chat("chat") is chat
+    assert intent is not chat
+    assert chat.max_retries == 3
+    assert chat.request_timeout == 5.0
+
+
+def test_clients_share_connection_pools():
+    # Given
+    registry = LLMRegistry(api_key="test")
+
+    # When
+    chat = registry.chat("summary")
+    embeddings = registry.embeddings("text-embedding-3-small", 512)
+
+    # Then
+    assert registry.embeddings("text-embedding-3-small", 512) is embeddings
+    assert embeddings.dimensions == 512
+    assert chat.root_client._client is embeddings.client._client._client
+    assert chat.root_async_client._client is embeddings.async_client._client._client
+
+
+def test_unknown_role_is_rejected():
+    # Given
+    registry = LLMRegistry(api_key="test")
+
+    # When / Then
+    with pytest.raises(ValueError):
+        registry.chat("poetry")
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_pools():
+    # Given
+    registry = LLMRegistry(api_key="test")
+    chat = registry.chat()
+
+    # When
+    await registry.aclose()
+
+    # Then
+    assert chat.root_async_client._client.is_closed
+
+
+def test_clients_are_instrumented():
+    # Given
+    registry = LLMRegistry(api_key="test")
+
+    # When
+    chat = registry.chat("intent")
+    embeddings = registry.embeddings()
+
+    # Then
+    assert metrics_callback in chat.callbacks
+    assert chat.metadata == {"ai_role": "intent"}
+    assert isinstance(embeddings, InstrumentedOpenAIEmbeddings)
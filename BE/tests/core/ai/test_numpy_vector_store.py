@@ -0,0 +1,284 @@
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from core.ai.vector_store import NumpyVectorStore, VectorObject
+
+
+def test_search_returns_top_k_by_cosine():
+    # Given
+    store = NumpyVectorStore()
+    store.insert({"course_id": 1, "text": "x"}, [1.0, 0.0])
+    store.insert({"course_id": 1, "text": "y"}, [0.0, 1.0])
+    store.insert({"course_id": 1, "text": "xy"}, [1.0, 1.0])
+
+    # When
+    sut = store.search([1.0, 0.1], limit=2, filters={"course_id": 1})
+
+    # Then
+    assert [result["text"] for result in sut] == ["x", "xy"]
+    assert sut[0]["similarity"] > sut[1]["similarity"]
+
+
+def test_search_with_property_filter():
+    # Given
+    store = NumpyVectorStore()
+    store.insert({"course_id": 1, "lang": "en", "text": "a"}, [1.0, 0.0])
+    store.insert({"course_id": 1, "lang": "fr", "text": "b"}, [1.0, 0.0])
+    store.insert({"course_id": 2, "lang": "en", "text": "c"}, [1.0, 0.0])
+
+    # When
+    sut = store.search([1.0, 0.0], filters={"lang": "en"})
+
+    # Then
+    assert sorted(result["text"] for result in sut) == ["a", "c"]
+
+
+def test_delete_keeps_locations_consistent():
+    # Given
+    store = NumpyVectorStore()
+    first = store.insert({"course_id": 1, "n": 1}, [1.0, 0.0])
+    store.insert({"course_id": 1, "n": 2}, [0.0, 1.0])
+    store.insert({"course_id": 1, "n": 3}, [1.0, 1.0])
+
+    # When
+    store.delete(first)
+    store.update(store.fetch(filters={"n": 3})[0]["uuid"], {"n": 30})
+
+    # Then
+    assert sorted(result["n"] for result in store.fetch()) == [2, 30]
+
+
+def test_delete_by_filter():
+    # Given
+    store = NumpyVectorStore()
+    store.bulk_insert([
+        VectorObject(uuid="a", properties={"course_id": 1}, vector=[1.0, 0.0]),
+        VectorObject(uuid="b", properties={"course_id": 1}, vector=[1.0, 0.0]),
+        VectorObject(uuid="c", properties={"course_id": 2}, vector=[1.0, 0.0]),
+    ])
+
+    # When
+    sut = store.delete_by_filter({"course_id": 1})
+
+    # Then
+    assert sut == 2
+    assert [result["uuid"] for result in store.fetch()] == ["c"]
+
+
+def test_bulk_insert_reports_bad_vectors():
+    # Given
+    store = NumpyVectorStore()
+
+    # When
+    sut = store.bulk_insert([
+        VectorObject(uuid="a", properties={"course_id": 1}, vector=[1.0, 0.0]),
+        VectorObject(uuid="b", properties={"course_id": 1}, vector=[1.0, 0.0, 0.0]),
+    ])
+
+    # Then
+    assert list(sut) == ["b"]
+
+
+def test_bulk_insert_collects_batches_outside_the_lock(tmp_path):
+    # Given
+    store = NumpyVectorStore(path=str(tmp_path))
+    readers_done = []
+
+    def objects():
+        for n in range(5):
+            # Another thread can read while the next object is produced
+            reader = threading.Thread(target=store.fetch)
+            reader.start()
+            reader.join(timeout=1)
+            readers_done.append(not reader.is_alive())
+            yield VectorObject(uuid=str(n), properties={"course_id": 1}, vector=[1.0, float(n)])
+
+    # When
+    with patch.object(store, "flush", wraps=store.flush) as flush:
+        sut = store.bulk_insert(objects(), batch_size=2)
+
+    # Then
+    assert sut == {}
+    assert readers_done == [True] * 5
+    assert flush.call_count == 3
+    assert len(NumpyVectorStore(path=str(tmp_path)).fetch()) == 5
+
+
+def test_deferred_flush_persists_once(tmp_path):
+    # Given
+    store = NumpyVectorStore(path=str(tmp_path))
+    uuids = [store.insert({"course_id": 1, "n": n}, [1.0, float(n)]) for n in range(3)]
+
+    # When
+    with patch.object(store, "flush", wraps=store.flush) as flush:
+        with store.deferred_flush():
+            for uuid in uuids[:2]:
+                store.delete(uuid)
+            store.update(uuids[2], {"n": 20})
+
+    # Then
+    assert flush.call_count == 1
+    assert [result["n"] for result in NumpyVectorStore(path=str(tmp_path)).fetch()] == [20]
+
+
+def test_persists_to_memory_mapped_files(tmp_path):
+    # Given
+    store = NumpyVectorStore(path=str(tmp_path))
+    store.insert({"course_id": 1, "text": "kept"}, [0.0, 1.0])
+    store.close()
+
+    # When
+    reopened = NumpyVectorStore(path=str(tmp_path))
+    sut = reopened.search([0.0, 1.0], filters={"course_id": 1})
+    reopened.insert({"course_id": 1, "text": "added"}, [1.0, 0.0])
+
+    # Then
+    assert sut[0]["text"] == "kept"
+    assert len(reopened.fetch(filters={"course_id": 1})) == 2
+
+
+def test_stores_sharing_a_path_see_each_others_writes(tmp_path):
+    # Given
+    api = NumpyVectorStore(path=str(tmp_path))
+    indexer = NumpyVectorStore(path=str(tmp_path))
+    first = indexer.insert({"course_id": 1, "text": "indexed"}, [1.0, 0.0])
+
+    # When
+    seen = [result["text"] for result in api.search([1.0, 0.0], filters={"course_id": 1})]
+    api.insert({"course_id": 1, "text": "from api"}, [0.0, 1.0])
+    indexer.insert({"course_id": 1, "text": "indexed later"}, [1.0, 1.0])
+    indexer.delete(first)
+
+    # Then
+    assert seen == ["indexed"]
+    assert sorted(result["text"] for result in api.fetch()) == ["from api", "indexed later"]
+    assert sorted(result["text"] for result in NumpyVectorStore(path=str(tmp_path)).fetch()) == [
+        "from api", "indexed later",
+    ]
+
+
+def test_hybrid_search_fuses_keyword_and_vector_scores():
+    # Given
+    store = NumpyVectorStore()
+    store.insert({"course_id": 1, "text": "an overview of sorting"}, [1.0, 0.0])
+    store.insert({"course_id": 1, "text": "call np.argsort on the array"}, [0.0, 1.0])
+
+    # When
+    vector_only = store.hybrid_search("np.argsort", [1.0, 0.0], alpha=1.0, filters={"course_id": 1})
+    keyword_only = store.hybrid_search("np.argsort", [1.0, 0.0], alpha=0.0, filters={"course_id": 1})
+
+    # Then
+    assert vector_only[0]["text"] == "an overview of sorting"
+    assert keyword_only[0]["text"] == "call np.argsort on the array"
+    assert keyword_only[0]["score"] == 1.0
+
+
+def test_hybrid_search_sees_updated_text():
+    # Given
+    store = NumpyVectorStore()
+    uuid = store.insert({"course_id": 1, "text": "old words"}, [1.0, 0.0])
+    store.insert({"course_id": 1, "text": "other words"}, [1.0, 0.0])
+    store.hybrid_search("sigmoid", [1.0, 0.0], alpha=0.0)
+
+    # When
+    store.update(uuid, {"text": "the sigmoid function"})
+    sut = store.hybrid_search("sigmoid", [1.0, 0.0], alpha=0.0)
+
+    # Then
+    assert sut[0]["uuid"] == uuid
+
+
+def test_iterate_pages_in_order_with_selected_properties():
+    # Given
+    store = NumpyVectorStore()
+    for position in [2, 0, 1]:
+        store.insert({"course_id": 1, "position": position, "text": f"t{position}"}, [1.0, 0.0])
+    store.insert({"course_id": 2, "position": 0, "text": "other"}, [0.0, 1.0])
+
+    # When
+    sut = list(store.iterate(filters={"course_id": 1}, page_size=2, order_by="position", properties=["position"]))
+
+    # Then
+    assert [obj.properties for obj in sut] == [{"position": 0}, {"position": 1}, {"position": 2}]
+    assert all(obj.vector is None for obj in sut)
+
+
+def test_list_filter_matches_any_value():
+    # Given
+    store = NumpyVectorStore()
+    for course_id in [1, 2, 3]:
+        store.insert({"course_id": course_id, "position": course_id}, [1.0, 0.0])
+
+    # When
+    by_partition = store.fetch(filters={"course_id": [1, 3]})
+    by_property = store.fetch(filters={"position": [2, 3]})
+
+    # Then
+    assert sorted(obj["course_id"] for obj in by_partition) == [1, 3]
+    assert sorted(obj["position"] for obj in by_property) == [2, 3]
+
+
+@pytest.mark.parametrize("quantization", ["int8", "pq"])
+def test_quantized_search_reranks_at_full_precision(quantization):
+    # Given
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((300, 16)).astype(np.float32)
+    exact = NumpyVectorStore(autoflush=False)
+    quantized = NumpyVectorStore(quantization=quantization, pq_subspaces=4, rerank_factor=8, autoflush=False)
+    for index, vector in enumerate(vectors):
+        exact.insert({"course_id": 1, "row": index}, vector.tolist())
+        quantized.insert({"course_id": 1, "row": index}, vector.tolist())
+    quantized.train_quantizers()
+    query = vectors[7].tolist()
+
+    # When
+    sut = quantized.search(query, limit=5)
+
+    # Then
+    expected = exact.search(query, limit=5)
+    assert sut[0]["row"] == 7
+    assert [result["row"] for result in sut] == [result["row"] for result in expected]
+    assert sut[0]["similarity"] == expected[0]["similarity"]
+
+
+def test_pq_subspaces_must_divide_the_dimensions():
+    # Given
+    store = NumpyVectorStore(quantization="pq", pq_subspaces=4)
+
+    # When / Then
+    with pytest.raises(ValueError):
+        NumpyVectorStore(quantization="pq", pq_subspaces=96, dimensions=512)
+    with pytest.raises(ValueError):
+        store.insert({"course_id": 1}, [1.0] * 10)
+    NumpyVectorStore(quantization="pq", dimensions=512)
+
+
+def test_quantizer_trains_in_the_background_and_survives_writes():
+    # Given
+    rng = np.random.default_rng(2)
+    vectors = rng.standard_normal((200, 16)).astype(np.float32)
+    store = NumpyVectorStore(quantization="pq", pq_subspaces=4, rerank_factor=4, autoflush=False)
+    store.bulk_insert(
+        VectorObject(uuid=str(index), properties={"course_id": 1, "row": index}, vector=vector.tolist())
+        for index, vector in enumerate(vectors)
+    )
+    partition = store._partitions[1]
+
+    # When
+    exact = store.search(vectors[3].tolist(), limit=1)
+    for future in list(store._training.values()):
+        future.result()
+    quantizer = partition.quantizer
+    added = rng.standard_normal(16).astype(np.float32)
+    store.insert({"course_id": 1, "row": "added"}, added.tolist())
+    sut = store.search(added.tolist(), limit=1)
+
+    # Then
+    assert exact[0]["row"] == 3
+    assert quantizer is not None
+    assert partition.quantizer is quantizer
+    assert partition.stale == {200}
+    assert sut[0]["row"] == "added"
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.ai import summariser
+from core.config import config
+from tests.support.fake_redis import FakeAsyncRedis
+
+
+class FakeChain:
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.inputs = []
+        self.running = 0
+        self.max_running = 0
+
+    async def ainvoke(self, inputs):
+        self.inputs.append(inputs["transcript"])
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        return f"summary of {inputs['transcript'].split()[0]}"
+
+
+@pytest.fixture(autouse=True)
+def count_words(monkeypatch):
+    monkeypatch.setattr(summariser, "summary_tokens", lambda text: len(text.split()))
+
+
+def test_split_into_chunks_keeps_sentences_whole():
+    # When
+    sut = list(summariser.split_into_chunks("One two. Three four five. Six.", 4, overlap_tokens=0))
+
+    # Then
+    assert sut == ["One two.", "Three four five.", "Six."]
+
+
+def test_split_into_chunks_handles_long_unpunctuated_transcripts():
+    # Given
+    text = " ".join(f"word{i}" for i in range(20000))
+
+    # When
+    started = time.perf_counter()
+    sut = list(summariser.split_into_chunks(text, config.SUMMARY_CHUNK_TOKENS, overlap_tokens=0))
+    elapsed = time.perf_counter() - started
+
+    # Then
+    assert " ".join(sut) == text
+    assert all(len(chunk.split()) <= config.SUMMARY_CHUNK_TOKENS for chunk in sut)
+    assert elapsed < 1
+
+def truncate_words(text, max_tokens, model):
+    return " ".join(text.split()[:max_tokens])
+
+
+def make_tree(**kwargs):
+    options = {"max_tokens": 10, "overlap_tokens": 0, "fan_in": 2, "max_concurrency": 8, "redis": None}
+    options.update(kwargs)
+    return summariser.SummaryTree(**options)
+
+
+@pytest.mark.asyncio
+async def test_leaves_are_summarised_concurrently_up_to_the_limit():
+    # Given
+    chain = FakeChain()
+    sections = [f"section{i} text." for i in range(6)]
+
+    # When
+    with patch.object(summariser, "summary_chain", MagicMock(return_value=chain)):
+        sut = await make_tree(max_tokens=100, max_concurrency=2).summarise(sections)
+
+    # Then
+    assert sut == "\n\n".join(f"summary of section{i}" for i in range(6))
+    assert chain.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_progress_is_reported_per_leaf():
+    # Given
+    progress = []
+
+    # When
+    with patch.object(summariser, "summary_chain", MagicMock(return_value=FakeChain())):
+        await make_tree().summarise(["a.", "b.", "c."], on_progress=lambda done, total: progress.append((done, total)))
+
+    # Then
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+@pytest.mark.asyncio
+async def test_short_transcript_is_summarised_in_one_call():
+    # Given
+    chain = FakeChain()
+
+    # When
+    with patch.object(summariser, "summary_chain", MagicMock(return_value=chain)), \
+            patch.object(summariser, "summary_tree", make_tree()):
+        sut = await summariser.asummarize_transcript("python basics")
+
+    # Then
+    assert sut == "summary of python"
+    assert chain.inputs == ["python basics"]
+
+
+@pytest.mark.asyncio
+async def test_summaries_are_reduced_recursively_until_they_fit():
+    # Given
+    chain = FakeChain()
+    sections = ["a b c.", "d e f.", "g h i.", "j k l."]
+
+    # When
+    with patch.object(summariser, "summary_chain", MagicMock(return_value=chain)):
+        sut = await make_tree(max_tokens=4).summarise(sections)
+
+    # Then
+    assert sut == "summary of summary"
+    # Four leaves, two parents and the root
+    assert len(chain.inputs) == 7
+
+
+@pytest.mark.asyncio
+async def test_summary_over_budget_after_max_depth_is_truncated():
+    # Given
+    chain = MagicMock()
+    chain.ainvoke = AsyncMock(return_value="far too long to ever fit the budget")
+
+    # When
+    with patch.object(summariser, "summary_chain", MagicMock(return_value=chain)), \
+            patch.object(summariser, "truncate_tokens", truncate_words):
+        sut = await make_tree(max_tokens=3, max_depth=2).summarise(["a b c."])
+
+    # Then
+    assert sut == "far too long"
+    assert chain.ainvoke.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_editing_a_section_only_resummarises_its_leaf_and_ancestors():
+    # Given
+    chain = FakeChain()
+    tree = make_tree(max_tokens=4, redis=FakeAsyncRedis())
+    with patch.object(summariser, "summary_chain", MagicMock(return_value=chain)):
+        await tree.summarise(["a b c.", "d e f.", "g h i."])
+        calls = len(chain.inputs)
+
+        # When
+        sut = await tree.summarise(["a b c.", "x e f.", "g h i."])
+
+    # Then
+    assert sut == "summary of summary"
+    assert calls == 5
+    assert chain.inputs[calls:] == ["x e f.", "summary of a\n\nsummary of x"]
+
+
+def test_node_key_depends_on_input_only():
+    # Given
+    tree = make_tree()
+
+    # When
+    sut = tree.node_key("some text")
+
+    # Then
+    assert sut == make_tree().node_key("some text")
+    assert sut != tree.node_key("other text")
@@ -0,0 +1,357 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.ai.chunker import Cue, chunk_cues, text_cues
+from core.ai.embedding_cache import EmbeddingCache
+from core.ai.id_allocator import TranscriptIdAllocator
+from core.ai import transcript_manager
+from core.ai.transcript_manager import (
+    TranscriptManager,
+    TranscriptSegment,
+    create_numpy_store,
+    release_numpy_store,
+)
+from core.ai.vector_store import NumpyVectorStore
+from tests.support.fake_redis import FakeRedis
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+@pytest.fixture(autouse=True)
+def answer_cache_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr("core.ai.transcript_manager.answer_cache.sync_redis", redis)
+    return redis
+
+
+def make_manager(store=None) -> TranscriptManager:
+    with patch.object(TranscriptManager, "_initialize_embedding_model"):
+        manager = TranscriptManager(
+            store=store or NumpyVectorStore(),
+            id_allocator=TranscriptIdAllocator(redis=FakeRedis()),
+        )
+
+    manager.embedding_model = MagicMock()
+    manager.embedding_model.embed_query.side_effect = lambda text: [float(len(text)), 1.0]
+    manager.embedding_model.embed_documents.side_effect = lambda texts: [[float(len(text)), 1.0] for text in texts]
+    manager.embedding_cache = EmbeddingCache(namespace="test", redis=None)
+    return manager
+
+
+def test_bulk_create_transcripts():
+    # Given
+    manager = make_manager()
+    segments = [
+        TranscriptSegment(course_id=1, text="first", start_time=0, end_time=5),
+        {"course_id": 1, "text": "second", "start_time": 5, "end_time": 9},
+        {"course_id": 1, "text": "third"},
+    ]
+
+    # When
+    sut = manager.bulk_create_transcripts(segments, batch_size=2, max_concurrency=2)
+
+    # Then
+    assert sut.errors == []
+    assert [item["transcript_id"] for item in sut.created] == [1, 2, 3]
+    assert [item["course_transcript_id"] for item in sut.created] == [0, 1, 2]
+    assert manager.embedding_model.embed_documents.call_count == 2
+    assert len(manager.get_course_transcripts(1)) == 3
+
+
+def test_bulk_create_transcripts_continues_existing_ids():
+    # Given
+    manager = make_manager()
+    manager.create_transcript(course_id=1, text="existing", transcript_id=41, course_transcript_id=9)
+    manager.id_allocator = TranscriptIdAllocator(redis=FakeRedis())
+
+    # When
+    sut = manager.bulk_create_transcripts([{"course_id": 1, "text": "new"}])
+
+    # Then
+    assert (sut.created[0]["transcript_id"], sut.created[0]["course_transcript_id"]) == (42, 10)
+
+
+def test_bulk_create_transcripts_reports_item_errors():
+    # Given
+    store = MagicMock()
+
+    def bulk_insert(objects, **kwargs):
+        objects = list(objects)
+        return {objects[1].uuid: "invalid object"}
+
+    store.bulk_insert.side_effect = bulk_insert
+    store.fetch.return_value = []
+    manager = make_manager(store=store)
+    segments = [{"course_id": 1, "text": "ok"}, {"course_id": 1, "text": "bad"}, {"course_id": 1, "text": ""}]
+
+    # When
+    sut = manager.bulk_create_transcripts(segments, batch_size=10)
+
+    # Then
+    assert [item["text"] for item in sut.created] == ["ok"]
+    assert [error["index"] for error in sut.errors] == [1, 2]
+    assert sut.errors[0]["error"] == "invalid object"
+
+
+def test_bulk_create_transcripts_invalid_batch_size():
+    # Given
+    manager = make_manager()
+
+    # When, Then
+    with pytest.raises(ValueError):
+        manager.bulk_create_transcripts([], batch_size=0)
+
+
+def test_create_transcript_allocates_ids():
+    # Given
+    manager = make_manager()
+
+    # When
+    first = manager.create_transcript(course_id=1, text="first")
+    second = manager.create_transcript(course_id=1, text="second")
+
+    # Then
+    assert (first["transcript_id"], first["course_transcript_id"]) == (1, 0)
+    assert (second["transcript_id"], second["course_transcript_id"]) == (2, 1)
+
+
+def test_update_and_delete_transcript():
+    # Given
+    manager = make_manager()
+    created = manager.create_transcript(course_id=1, text="before")
+
+    # When
+    updated = manager.update_transcript(created["transcript_id"], {"text": "after!"})
+    deleted = manager.delete_transcript(created["transcript_id"])
+
+    # Then
+    assert updated["text"] == "after!"
+    assert deleted is True
+    assert manager.get_transcript(created["transcript_id"]) is None
+
+
+def test_most_similar_content_is_scoped_to_course():
+    # Given
+    manager = make_manager()
+    manager.create_transcript(course_id=1, text="aaaa")
+    manager.create_transcript(course_id=2, text="a")
+
+    # When
+    sut = manager.most_similar_content("a", course_id=1)
+
+    # Then
+    assert sut == "aaaa"
+
+
+def test_hybrid_search_reranks_exact_terms_and_returns_time_ranges():
+    # Given
+    manager = make_manager()
+    manager.bulk_create_transcripts([
+        {"course_id": 1, "text": "we now sort the list", "start_time": 0, "end_time": 10},
+        {"course_id": 1, "text": "use np.argsort for indices", "start_time": 10, "end_time": 20},
+        {"course_id": 2, "text": "np.argsort in another course", "start_time": 0, "end_time": 5},
+    ])
+
+    # When
+    sut = manager.hybrid_search("how does np.argsort work", limit=2, alpha=0.5, course_id=1)
+
+    # Then
+    assert sut[0]["text"] == "use np.argsort for indices"
+    assert (sut[0]["start_time"], sut[0]["end_time"]) == (10, 20)
+    assert sut[0]["term_coverage"] > sut[1]["term_coverage"]
+    assert all(result["course_id"] == 1 for result in sut)
+
+
+def test_hybrid_search_defaults_are_read_from_config_at_call_time(monkeypatch):
+    # Given
+    manager = make_manager()
+    manager.bulk_create_transcripts([{"course_id": 1, "text": f"arrays part {n}"} for n in range(3)])
+    monkeypatch.setattr("core.ai.transcript_manager.config.RETRIEVAL_TOP_K", 1)
+
+    # When
+    sut = manager.hybrid_search("arrays", course_id=1)
+
+    # Then
+    assert len(sut) == 1
+
+
+def test_sync_course_chunks_only_embeds_changes(answer_cache_redis):
+    # Given
+    manager = make_manager()
+    first = [Cue(0, 10, "intro to arrays."), Cue(10, 20, "sorting arrays."), Cue(20, 30, "searching arrays.")]
+    manager.sync_course_chunks(1, chunk_cues(first, max_tokens=3, overlap_tokens=0, count=count_words))
+    manager.embedding_model.embed_documents.reset_mock()
+    edited = [first[0], Cue(10, 20, "sorting lists."), first[2]]
+
+    # When
+    sut = manager.sync_course_chunks(1, chunk_cues(edited, max_tokens=3, overlap_tokens=0, count=count_words))
+
+    # Then
+    assert (len(sut.created), sut.unchanged, sut.deleted) == (1, 2, 1)
+    assert answer_cache_redis.get("answer_cache:1:generation") == 2
+    manager.embedding_model.embed_documents.assert_called_once_with(["sorting lists."])
+    assert sorted(item["text"] for item in manager.get_course_transcripts(1)) == [
+        "intro to arrays.", "searching arrays.", "sorting lists.",
+    ]
+
+
+def test_sync_course_chunks_reembeds_only_chunks_near_an_edit(answer_cache_redis):
+    # Given
+    manager = make_manager()
+    sentences = [f"Part {n} explains topic {n * 7 % 11} with an example." for n in range(60)]
+
+    def chunks(text):
+        return chunk_cues(text_cues(text, duration=900), max_tokens=40, overlap_tokens=8,
+                          count=count_words, anchor_tokens=10)
+
+    manager.sync_course_chunks(1, chunks(" ".join(sentences)))
+    manager.embedding_model.embed_documents.reset_mock()
+    sentences[2] = "Part 2 briefly explains topic 3 with a longer example than before."
+
+    # When
+    sut = manager.sync_course_chunks(1, chunks(" ".join(sentences)))
+
+    # Then
+    embedded = [text for call in manager.embedding_model.embed_documents.call_args_list for text in call.args[0]]
+    assert len(embedded) == len(sut.created) <= 2
+    assert sut.unchanged > 5
+    assert sut.retimed > 0
+    assert all(transcript["end_time"] <= 900 for transcript in manager.get_course_transcripts(1))
+
+
+def test_iter_transcripts_skips_text_and_vectors_by_request():
+    # Given
+    manager = make_manager()
+    manager.bulk_create_transcripts([{"course_id": 1, "text": f"segment {i}"} for i in range(5)])
+
+    # When
+    sut = list(manager.iter_transcripts(1, page_size=2, include_text=False))
+
+    # Then
+    assert [record.course_transcript_id for record in sut] == [0, 1, 2, 3, 4]
+    assert all(record.text is None and record.vector is None for record in sut)
+
+
+def test_update_many_reembeds_only_changed_texts():
+    # Given
+    manager = make_manager()
+    created = manager.bulk_create_transcripts([{"course_id": 1, "text": f"segment {i}"} for i in range(3)]).created
+    ids = [item["transcript_id"] for item in created]
+    manager.embedding_model.embed_documents.reset_mock()
+
+    # When
+    sut = manager.update_many({
+        ids[0]: {"text": "rewritten segment"},
+        ids[1]: {"start_time": 42},
+        ids[2]: {"text": "segment 2"},
+        999: {"text": "missing"},
+    }, batch_size=2)
+
+    # Then
+    assert (sut.updated, sut.reembedded, sut.missing, sut.errors) == (3, 1, [999], [])
+    manager.embedding_model.embed_documents.assert_called_once_with(["rewritten segment"])
+    assert manager.get_transcript(ids[0])["content_hash"] == ""
+    assert manager.get_transcript(ids[1])["start_time"] == 42
+    assert manager.vector_search("rewritten segment", limit=1, course_id=1)[0]["transcript_id"] == ids[0]
+
+
+def test_delete_many_by_course():
+    # Given
+    manager = make_manager()
+    manager.bulk_create_transcripts([
+        {"course_id": 1, "text": "a"}, {"course_id": 1, "text": "b"}, {"course_id": 2, "text": "c"},
+    ])
+
+    # When
+    sut = manager.delete_many(course_id=1)
+
+    # Then
+    assert sut == 2
+    assert manager.get_course_transcripts(1) == []
+    assert len(manager.get_course_transcripts(2)) == 1
+    with pytest.raises(ValueError):
+        manager.delete_many()
+
+
+def test_numpy_store_is_shared_per_path(monkeypatch, tmp_path):
+    # Given
+    monkeypatch.setattr(transcript_manager, "_numpy_stores", {})
+    monkeypatch.setattr(transcript_manager, "_numpy_store_users", {})
+    monkeypatch.setattr("core.ai.transcript_manager.config.VECTOR_STORE_PATH", str(tmp_path))
+
+    # When
+    sut = create_numpy_store("Transcripts")
+
+    # Then
+    assert create_numpy_store("Transcripts") is sut
+    assert create_numpy_store("Other") is not sut
+    assert sut.path == str(tmp_path / "Transcripts")
+
+
+def test_shared_numpy_store_is_closed_by_its_last_user(monkeypatch, tmp_path):
+    # Given
+    monkeypatch.setattr(transcript_manager, "_numpy_stores", {})
+    monkeypatch.setattr(transcript_manager, "_numpy_store_users", {})
+    monkeypatch.setattr("core.ai.transcript_manager.config.VECTOR_STORE_PATH", str(tmp_path))
+    monkeypatch.setattr("core.ai.transcript_manager.config.EMBEDDING_DIMENSIONS", 2)
+    first = make_manager(store=create_numpy_store("Transcripts"))
+    second = make_manager(store=create_numpy_store("Transcripts"))
+
+    # When
+    first.close()
+    second.create_transcript(course_id=1, text="still open")
+    still_open = second.store._lock_file is not None
+    store = second.store
+    second.close()
+
+    # Then
+    assert still_open
+    assert store._lock_file is None
+    assert transcript_manager._numpy_stores == {}
+    assert create_numpy_store("Transcripts") is not store
+
+def test_every_write_invalidates_the_course_answers(answer_cache_redis):
+    # Given
+    manager = make_manager()
+    created = manager.bulk_create_transcripts([
+        {"course_id": 1, "text": "arrays"},
+        {"course_id": 2, "text": "lists"},
+        {"course_id": 3, "text": "trees"},
+    ]).created
+    ids = {transcript["course_id"]: transcript["transcript_id"] for transcript in created}
+
+    def generations():
+        return [answer_cache_redis.get(f"answer_cache:{course_id}:generation") for course_id in (1, 2, 3)]
+
+    # When
+    after_create = generations()
+    manager.update_transcript(ids[1], {"text": "sorted arrays"})
+    manager.update_many({ids[2]: {"course_id": 3}})
+    after_updates = generations()
+    manager.delete_transcript(ids[1])
+    manager.delete_many(transcript_id=ids[2])
+
+    # Then
+    assert after_create == [1, 1, 1]
+    assert after_updates == [2, 2, 2]
+    assert generations() == [3, 2, 3]
+
+
+def test_delete_many_without_course_invalidates_every_matching_course(answer_cache_redis):
+    # Given
+    manager = make_manager()
+    created = manager.bulk_create_transcripts([
+        {"course_id": course_id, "text": f"topic {course_id}"} for course_id in range(1, 6)
+    ]).created
+
+    # When
+    sut = manager.delete_many(transcript_id=[transcript["transcript_id"] for transcript in created[1:]])
+
+    # Then
+    assert sut == 4
+    assert [answer_cache_redis.get(f"answer_cache:{course_id}:generation") for course_id in range(1, 6)] == [
+        1, 2, 2, 2, 2,
+    ]
@@ -0,0 +1,57 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.ai.transcript_provider import AsyncTranscriptManagerProvider
+
+
+@pytest.mark.asyncio
+@patch("core.ai.transcript_provider.AsyncTranscriptManager")
+async def test_async_get_reuses_manager(manager_class):
+    # Given
+    manager_class.connect = AsyncMock(return_value=AsyncMock())
+    provider = AsyncTranscriptManagerProvider(health_check_interval=60)
+    await provider.init(weaviate_url="http://weaviate")
+
+    # When
+    first = await provider.get()
+    second = await provider.get()
+
+    # Then
+    assert first is second
+    manager_class.connect.assert_awaited_once_with("http://weaviate", collection_name="Transcripts")
+    first.is_ready.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("core.ai.transcript_provider.AsyncTranscriptManager")
+async def test_async_get_reconnects_when_not_ready(manager_class):
+    # Given
+    stale, fresh = AsyncMock(), AsyncMock()
+    stale.is_ready.return_value = False
+    manager_class.connect = AsyncMock(side_effect=[stale, fresh])
+    provider = AsyncTranscriptManagerProvider(health_check_interval=0)
+    await provider.init(weaviate_url="http://weaviate")
+
+    # When
+    sut = await provider.get()
+
+    # Then
+    assert sut is fresh
+    stale.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("core.ai.transcript_provider.AsyncTranscriptManager")
+async def test_async_close(manager_class):
+    # Given
+    manager_class.connect = AsyncMock(return_value=AsyncMock())
+    provider = AsyncTranscriptManagerProvider()
+    manager = await provider.init(weaviate_url="http://weaviate")
+
+    # When
+    await provider.close()
+
+    # Then
+    manager.close.assert_awaited_once()
+    assert provider.manager is None
@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from core.ai.vector_store import WeaviateVectorStore
+
+
+def make_store() -> WeaviateVectorStore:
+    with patch.object(WeaviateVectorStore, "_connect_to_weaviate"), \
+            patch.object(WeaviateVectorStore, "_ensure_schema_exists"):
+        store = WeaviateVectorStore("http://weaviate", "Transcripts", [])
+    store.collection = MagicMock()
+    return store
+
+
+def page(*positions):
+    return SimpleNamespace(objects=[
+        SimpleNamespace(uuid=f"uuid-{position}", properties={"position": position}, vector=None)
+        for position in positions
+    ])
+
+
+def test_filtered_iterate_pages_by_keyset():
+    # Given
+    store = make_store()
+    store.collection.query.fetch_objects.side_effect = [page(0, 1), page(2)]
+
+    # When
+    sut = list(store.iterate(filters={"course_id": 1}, page_size=2, order_by="position"))
+
+    # Then
+    assert [obj.uuid for obj in sut] == ["uuid-0", "uuid-1", "uuid-2"]
+    calls = store.collection.query.fetch_objects.call_args_list
+    assert len(calls) == 2
+    assert "after" not in calls[1].kwargs
+    assert calls[1].kwargs["filters"] is not calls[0].kwargs["filters"]
+
+
+def test_unfiltered_iterate_follows_uuid_cursor():
+    # Given
+    store = make_store()
+    store.collection.query.fetch_objects.side_effect = [page(0, 1), page()]
+
+    # When
+    sut = list(store.iterate(page_size=2))
+
+    # Then
+    assert len(sut) == 2
+    calls = store.collection.query.fetch_objects.call_args_list
+    assert calls[0].kwargs["after"] is None
+    assert calls[1].kwargs["after"] == "uuid-1"
@@ -0,0 +1,121 @@
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from core.helpers.cache import CacheTag, CustomKeyMaker
+from core.helpers.cache.base import BaseBackend
+from core.helpers.cache.cache_manager import CacheManager
+
+
+class MemoryBackend(BaseBackend):
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, *, key):
+        return self.data.get(key)
+
+    async def set(self, *, response, key, ttl=60):
+        self.data[key] = response
+
+    async def delete_startswith(self, *, value):
+        for key in [key for key in self.data if key.startswith(value)]:
+            del self.data[key]
+
+
+class FailingBackend(BaseBackend):
+    async def get(self, *, key):
+        raise RedisConnectionError("connection refused")
+
+    async def set(self, *, response, key, ttl=60):
+        raise RedisConnectionError("connection refused")
+
+    async def delete_startswith(self, *, value):
+        raise RedisConnectionError("connection refused")
+
+
+def make_cache(backend=None):
+    cache = CacheManager()
+    cache.init(backend=backend or MemoryBackend(), key_maker=CustomKeyMaker())
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_cached_keys_by_argument_values():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(tag=CacheTag.GET_COURSE)
+    async def get_course(course_id: int):
+        calls.append(course_id)
+        return {"id": course_id}
+
+    # When
+    first = await get_course(course_id=1)
+    second = await get_course(course_id=2)
+    again = await get_course(course_id=1)
+
+    # Then
+    assert (first, second, again) == ({"id": 1}, {"id": 2}, {"id": 1})
+    assert calls == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_empty_result_is_served_from_cache():
+    # Given
+    cache = make_cache()
+    calls = []
+
+    @cache.cached(tag=CacheTag.GET_COURSE_LIST)
+    async def list_courses():
+        calls.append(1)
+        return []
+
+    # When
+    await list_courses()
+    sut = await list_courses()
+
+    # Then
+    assert sut == []
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_failing_backend_falls_through_to_the_function():
+    # Given
+    cache = make_cache(FailingBackend())
+    calls = []
+
+    @cache.cached(tag=CacheTag.GET_COURSE)
+    async def get_course(course_id: int):
+        calls.append(course_id)
+        return {"id": course_id}
+
+    # When
+    sut = [await get_course(course_id=1), await get_course(course_id=1)]
+
+    # Then
+    assert sut == [{"id": 1}, {"id": 1}]
+    assert calls == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_remove_by_tag_leaves_other_tags():
+    # Given
+    cache = make_cache()
+
+    @cache.cached(tag=CacheTag.GET_COURSE)
+    async def get_course(course_id: int):
+        return {"id": course_id}
+
+    @cache.cached(tag=CacheTag.GET_COURSE_LIST)
+    async def list_courses():
+        return [{"id": 1}]
+
+    await get_course(course_id=1)
+    await list_courses()
+
+    # When
+    await cache.remove_by_tag(tag=CacheTag.GET_COURSE)
+
+    # Then
+    assert [key.split("::")[0] for key in cache.backend.data] == ["get_course_list"]
@@ -29,3 +29,17 @@ async def test_make_with_args():
 
     # Then
     assert sut == "hide::tests.core.helpers.cache.test_custom_key_maker.test.a"
+
+
+@pytest.mark.asyncio
+async def test_make_with_arg_values():
+    # Given
+    def test(a: int, b: str = "x"):
+        pass
+
+    # When
+    sut = await key_maker.make(function=test, prefix="hide", args=(1,), kwargs={"b": "y"})
+
+    # Then
+    assert sut == "hide::tests.core.helpers.cache.test_custom_key_maker.test.a=1,b=y"
+    assert sut != await key_maker.make(function=test, prefix="hide", args=(2,), kwargs={"b": "y"})
@@ -78,3 +78,18 @@ async def test_delete_startswith():
     # Then
     assert await redis_client.get("data1") is None
     assert await redis_client.get("data2") is None
+
+
+@pytest.mark.asyncio
+async def test_set_list():
+    # Given
+    data = [{"id": 1, "name": "hide"}]
+    key = "hide"
+
+    # When
+    await redis_backend.set(response=data, key=key)
+
+    # Then
+    sut = await redis_backend.get(key=key)
+    assert sut == data
+    await redis_client.delete(key)
@@ -0,0 +1,119 @@
+class FakeRedis:
+    """In-memory stand-in for the synchronous Redis client used by core.ai helpers."""
+
+    def __init__(self):
+        self.data = {}
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, name, value, ex=None, nx=False):
+        if nx and name in self.data:
+            return None
+        self.data[name] = value
+        return True
+
+    def incrby(self, name, amount=1):
+        self.data[name] = int(self.data.get(name, 0)) + amount
+        return self.data[name]
+
+    def delete(self, *names):
+        return sum(1 for name in names if self.data.pop(name, None) is not None)
+
+
+class FakeAsyncRedis:
+    """In-memory stand-in for the binary asyncio Redis client used by core.ai helpers."""
+
+    def __init__(self):
+        self.data = {}
+        self.hashes = {}
+        self.streams = {}
+        self.ttls = {}
+        self.calls = []
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, name, value, ex=None, nx=False):
+        if nx and name in self.data:
+            return None
+        self.data[name] = value
+        if ex is not None:
+            self.ttls[name] = ex
+        return True
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        items = dict(mapping or {})
+        if field is not None:
+            items[field] = value
+        # Like Redis, numbers are read back as strings
+        self.hashes.setdefault(key, {}).update(
+            {name: item if isinstance(item, (str, bytes)) else str(item) for name, item in items.items()}
+        )
+        return len(items)
+
+    async def hdel(self, key, *fields):
+        return sum(1 for field in fields if self.hashes.get(key, {}).pop(field, None) is not None)
+
+    async def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    async def xadd(self, name, fields, maxlen=None, approximate=True):
+        entries = self.streams.setdefault(name, [])
+        last = tuple(map(int, entries[-1][0].decode().split("-"))) if entries else (0, 0)
+        entry_id = f"{last[0]}-{last[1] + 1}".encode()
+        entries.append((entry_id, {key.encode(): value for key, value in fields.items()}))
+        if maxlen is not None:
+            del entries[:max(0, len(entries) - maxlen)]
+        return entry_id
+
+    async def xrange(self, name, min="-", max="+", count=None):
+        self.calls.append(("xrange", name, min, max))
+
+        def key(value):
+            return tuple(map(int, value.split("-")))
+
+        def after_min(entry_id):
+            if min == "-":
+                return True
+            if min.startswith("("):
+                return key(entry_id) > key(min[1:])
+            return key(entry_id) >= key(min)
+
+        return [
+            (entry_id, dict(data)) for entry_id, data in self.streams.get(name, [])
+            if after_min(entry_id.decode()) and (max == "+" or key(entry_id.decode()) <= key(max))
+        ]
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakeAsyncPipeline(self)
+
+
+class FakeAsyncPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        results = [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+        self.calls = []
+        return results